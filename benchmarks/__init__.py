@@ -0,0 +1,3 @@
+"""
+Timing benchmarks for the calculators, exports and page render, with JSON baselines.
+"""
@@ -0,0 +1,193 @@
+from datetime import date
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Problem sizes: lease term in months (purchase periods use whole years of it)
+# and number of scenarios analyzed or exported together
+SIZES = {
+    "term":      (60, 240, 600),
+    "scenarios": (1, 10, 100),
+}
+
+
+class Case(NamedTuple):
+    """
+    One benchmarked operation.
+
+    Attributes:
+        name: Case name; each size combination is timed as ``name[term=..,scenarios=..]``
+        sizes: The ``SIZES`` dimensions the case varies over
+        setup: ``setup(**size)`` builds the inputs and returns the call to time
+    """
+    name: str
+    sizes: tuple
+    setup: Callable
+
+
+def lease_params(term, i=0):
+    """Lease web app parameters, as the Inputs tab builds them."""
+    return {
+        'name': f'Option {i + 1}', 'start_date': date(2025, 1, 1), 'term_mos': term,
+        'sqft': 10_000, 'exp_month': 0, 'exp_sqft': 0, 'total_sqft': 10_000,
+        'base': 30.0 + i / 100, 'inc': 3.0, 'rent_incs': None, 'lease_type': 'Triple Net (NNN)',
+        'opex_base': None, 'opex': 12.0, 'opexinc': 2.5, 'park_cost': 150.0, 'park_spaces': 20,
+        'park_detail': {'unres_spaces': 20, 'unres_cost': 150.0, 'res_spaces': 0,
+                        'res_cost': 0.0, 'park_inc': 3.0},
+        'move_exp': 10.0, 'construction': 0.0, 'ffe': 5.0, 'free': 6, 'ti': 60.0,
+        'add_cred': 5.0, 'disc': 8.0, 'custom_abate': False, 'abates': None,
+        'inside_term': False, 'base_only_abate': False, 'commission': 4.0, 'include_opex': False,
+    }
+
+
+def purchase_params(term, i=0):
+    return {
+        "name": f"Purchase {i + 1}", "purchase_price": 5_000_000 + 10_000 * i,
+        "down_payment_pct": 25.0, "mortgage_rate": 6.5, "mortgage_term": 25,
+        "property_tax_rate": 1.2, "insurance_rate": 0.4, "maintenance_rate": 1.0,
+        "appreciation_rate": 3.0, "analysis_period": max(1, term // 12), "discount_rate": 8.0,
+    }
+
+
+def advisory_params(term, i=0):
+    return {
+        'term_mos': term, 'sqft': 10_000, 'base_rent': 30.0 + i / 100, 'rent_escalation': 3.0,
+        'opex': 12.0, 'opex_escalation': 3.0, 'free_rent_months': 6, 'ti_allowance': 60.0,
+        'moving_expense': 10.0, 'construction_costs': 80.0, 'parking_ratio': 3.0,
+        'num_reserved_spaces': 5, 'reserved_cost_monthly': 200.0, 'unreserved_cost_monthly': 120.0,
+        'discount_rate': 8.0, 'show_advanced': False, 'custom_escalations': [], 'custom_sqft': [],
+        'use_base_year_stop': False, 'include_parking_in_eff_rent': True,
+        'include_parking_in_npv': True,
+    }
+
+
+def lease_results(term, scenarios):
+    from lease_analysis.web.analysis import analyze_lease
+    return [(p, *analyze_lease(p)) for p in (lease_params(term, i) for i in range(scenarios))]
+
+
+def purchase_results(term, scenarios):
+    from lease_analysis.web.analysis import analyze_purchase
+    return [(p, *analyze_purchase.uncached(p))
+            for p in (purchase_params(term, i) for i in range(scenarios))]
+
+
+def comparison_tables(results, kind="Lease Type"):
+    """Raw and formatted comparison tables, built as the Comparison tab builds them."""
+    rows = [(r[1], {kind: r[0].get("lease_type", "Purchase")}) for r in results]
+    raw_df = pd.DataFrame([{**s, **extra} for s, extra in rows])
+    df = pd.DataFrame([{**s.formatted(), **extra} for s, extra in rows])
+    return raw_df, df
+
+
+def setup_analyze_lease(term, scenarios):
+    from lease_analysis.engine import lease as lease_engine
+    params = [lease_params(term, i) for i in range(scenarios)]
+    # The web app's analyze_lease is this memoized engine call; time the calculation
+    return lambda: [lease_engine.analyze_lease.uncached(p) for p in params]
+
+
+def setup_analyze_purchase(term, scenarios):
+    from lease_analysis.web.analysis import analyze_purchase
+    params = [purchase_params(term, i) for i in range(scenarios)]
+    # Time the calculation, not the result cache
+    return lambda: [analyze_purchase.uncached(p) for p in params]
+
+
+def setup_purchase_vs_lease(term, scenarios):
+    from lease_analysis.web.analysis import analyze_purchase_vs_lease
+    lease = lease_results(term, 1)[0][1:]
+    params = [purchase_params(term, i) for i in range(scenarios)]
+    return lambda: [analyze_purchase_vs_lease(p, lease, p["analysis_period"]) for p in params]
+
+
+def setup_calculate_lease_metrics(term, scenarios):
+    from revolutionary_property_analyzer import calculate_lease_metrics
+    params = [advisory_params(term, i) for i in range(scenarios)]
+    return lambda: [calculate_lease_metrics(p) for p in params]
+
+
+def setup_excel_export(scenarios):
+    from lease_analysis.web.exports import summary_excel
+    raw_df, _ = comparison_tables(lease_results(60, scenarios))
+    return lambda: summary_excel(raw_df)
+
+
+def setup_excel_workbook(term, scenarios):
+    from lease_analysis.web.exports import comparison_excel
+    results = lease_results(term, scenarios)
+    raw_df, _ = comparison_tables(results)
+    return lambda: comparison_excel(raw_df, results, monthly=True)
+
+
+def setup_lease_pdf(term, scenarios):
+    from lease_analysis.web.exports import lease_comparison_pdf
+    results = lease_results(term, scenarios)
+    _, df = comparison_tables(results)
+    # Chart images need Kaleido and dominate when present; time the document itself
+    return lambda: lease_comparison_pdf(df, results, charts=False)
+
+
+def setup_purchase_pdf(scenarios):
+    from lease_analysis.web.exports import purchase_comparison_pdf
+    results = purchase_results(120, scenarios)
+    _, df = comparison_tables(results, "Property Type")
+    return lambda: purchase_comparison_pdf(df, results)
+
+
+def setup_page_render(scenarios):
+    from streamlit.testing.v1 import AppTest
+    results = lease_results(60, scenarios)
+
+    def render():
+        app = AppTest.from_file(str(ROOT / "lease_web_app.py"), default_timeout=300)
+        app.session_state["results"] = results
+        app.run()
+        if app.exception:
+            raise RuntimeError(app.exception[0].value)
+    return render
+
+
+CASES = [
+    Case("analyze_lease",             ("term", "scenarios"), setup_analyze_lease),
+    Case("analyze_purchase",          ("term", "scenarios"), setup_analyze_purchase),
+    Case("analyze_purchase_vs_lease", ("term", "scenarios"), setup_purchase_vs_lease),
+    Case("calculate_lease_metrics",   ("term", "scenarios"), setup_calculate_lease_metrics),
+    Case("excel_export",              ("scenarios",),        setup_excel_export),
+    Case("excel_workbook_export",     ("term", "scenarios"), setup_excel_workbook),
+    Case("lease_pdf_export",          ("term", "scenarios"), setup_lease_pdf),
+    Case("purchase_pdf_export",       ("scenarios",),        setup_purchase_pdf),
+    Case("page_render",               ("scenarios",),        setup_page_render),
+]
+
+
+def case_id(name, size):
+    """Baseline key of one case at one size, e.g. ``analyze_lease[term=60,scenarios=10]``."""
+    return f"{name}[{','.join(f'{k}={v}' for k, v in size.items())}]"
+
+
+def expand(cases=CASES, sizes=SIZES, select=None):
+    """
+    Every ``(case_id, case, size)`` combination to run.
+
+    Args:
+        cases (list): Cases to expand
+        sizes (dict): Values of each size dimension, as ``SIZES``
+        select (str): Keep only case ids containing this substring
+
+    Returns:
+        list: ``(case_id, Case, size dict)`` tuples
+    """
+    runs = []
+    for case in cases:
+        combos = [{}]
+        for dim in case.sizes:
+            combos = [dict(combo, **{dim: value}) for combo in combos for value in sizes[dim]]
+        for size in combos:
+            key = case_id(case.name, size)
+            if select is None or select in key:
+                runs.append((key, case, size))
+    return runs
@@ -0,0 +1,180 @@
+"""
+Time the benchmark cases and compare them with the stored baselines.
+
+Usage:
+    python -m benchmarks.run                      # compare with benchmarks/baseline.json
+    python -m benchmarks.run -k analyze_lease     # only case ids containing a substring
+    python -m benchmarks.run --update             # record the current timings as baselines
+
+Exits non-zero when a case is slower than its baseline by more than the
+threshold (--threshold or $LEASE_ANALYZER_BENCH_THRESHOLD, default 25%).
+Baselines are machine-specific: record them on the machine that checks them.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from benchmarks.cases import CASES, SIZES, expand
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+THRESHOLD_ENV = "LEASE_ANALYZER_BENCH_THRESHOLD"
+# Allowed slowdown as a fraction of the baseline
+THRESHOLD = 0.25
+# Slowdowns smaller than this many seconds are timer noise, whatever the ratio
+MIN_DELTA = 0.002
+# Each timing repeats a call until it runs at least this long, and keeps the best
+MIN_TIME = 0.05
+
+
+class Comparison(NamedTuple):
+    """A case's timing against its baseline (seconds per call; baseline None if new)."""
+    case: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self):
+        return self.current / self.baseline if self.baseline else float("nan")
+
+    @property
+    def regressed(self):
+        return (self.baseline is not None
+                and self.current > self.baseline * (1 + self.threshold)
+                and self.current - self.baseline > MIN_DELTA)
+
+
+def time_call(fn, repeat=5, min_time=MIN_TIME):
+    """
+    Best time of one call to ``fn`` over ``repeat`` rounds.
+
+    Each round calls ``fn`` often enough to run for ``min_time`` seconds, so
+    fast calls are not lost in timer resolution; the first call warms up
+    imports and caches and is not counted.
+
+    Returns:
+        float: Seconds per call
+    """
+    fn()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def run_cases(runs, repeat=5, min_time=MIN_TIME, out=None):
+    """Time each ``(case_id, case, size)`` from ``expand``; returns ``{case_id: seconds}``."""
+    timings = {}
+    for key, case, size in runs:
+        timings[key] = time_call(case.setup(**size), repeat, min_time)
+        if out:
+            print(f"{key:<55} {timings[key] * 1000:>10.2f} ms", file=out, flush=True)
+    return timings
+
+
+def compare(baseline, timings, threshold=THRESHOLD):
+    """``Comparison`` of each timed case against ``baseline`` (``{case_id: seconds}``)."""
+    return [Comparison(key, baseline.get(key), seconds, threshold) for key, seconds in timings.items()]
+
+
+def load_baseline(path=BASELINE):
+    """``{case_id: seconds}`` stored at ``path``; empty if there is none yet."""
+    try:
+        with open(path) as f:
+            return json.load(f)["seconds"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(timings, path=BASELINE):
+    """Merge ``timings`` into the baselines at ``path``, keeping cases not rerun."""
+    seconds = {**load_baseline(path), **timings}
+    data = {
+        "machine": {
+            "python":    platform.python_version(),
+            "platform":  platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpus":      os.cpu_count(),
+        },
+        "seconds": {key: round(value, 6) for key, value in sorted(seconds.items())},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def report(comparisons, out=sys.stdout):
+    print(f"\n{'case':<55} {'baseline':>10} {'current':>10} {'ratio':>7}", file=out)
+    for c in comparisons:
+        base = f"{c.baseline * 1000:.2f}" if c.baseline is not None else "new"
+        flag = "  REGRESSED" if c.regressed else ""
+        print(f"{c.case:<55} {base:>10} {c.current * 1000:>10.2f} {c.ratio:>7.2f}{flag}", file=out)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Time the calculators, exports and page render against stored baselines.")
+    parser.add_argument("-k", dest="select", help="Only run case ids containing this substring")
+    parser.add_argument("--term", type=int, nargs="+", default=SIZES["term"],
+                        help=f"Lease terms in months (default: {' '.join(map(str, SIZES['term']))})")
+    parser.add_argument("--scenarios", type=int, nargs="+", default=SIZES["scenarios"],
+                        help="Scenario counts (default: "
+                             f"{' '.join(map(str, SIZES['scenarios']))})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds per case (default: 5)")
+    parser.add_argument("--threshold", type=float,
+                        default=float(os.environ.get(THRESHOLD_ENV) or THRESHOLD),
+                        help=f"Allowed slowdown as a fraction (default: ${THRESHOLD_ENV} or {THRESHOLD})")
+    parser.add_argument("--baseline", type=Path, default=BASELINE,
+                        help="Baseline JSON file (default: benchmarks/baseline.json)")
+    parser.add_argument("--update", action="store_true",
+                        help="Store the timings as the new baselines instead of checking them")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    # Benchmarks time the calculations, never the on-disk result cache
+    os.environ["LEASE_ANALYZER_CACHE"] = ""
+    runs = expand(CASES, {"term": args.term, "scenarios": args.scenarios}, args.select)
+    if not runs:
+        parser.error(f"no benchmark case matches {args.select!r}")
+    timings = run_cases(runs, args.repeat, out=sys.stdout)
+
+    if args.update:
+        save_baseline(timings, args.baseline)
+        print(f"Stored {len(timings)} baselines in {args.baseline}")
+        return 0
+
+    comparisons = compare(load_baseline(args.baseline), timings, args.threshold)
+    report(comparisons)
+    regressed = [c.case for c in comparisons if c.regressed]
+    if regressed:
+        print(f"\n{len(regressed)} of {len(comparisons)} cases are more than "
+              f"{args.threshold:.0%} slower than their baseline", file=sys.stderr)
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+import os
+import tempfile
+
+# Keep test runs off the user's persistent result cache and saved scenarios
+os.environ.setdefault("LEASE_ANALYZER_CACHE", "")
+os.environ.setdefault("LEASE_ANALYZER_STORE", os.path.join(tempfile.mkdtemp(), "scenarios.sqlite"))
@@ -6,11 +6,15 @@ from lease_analysis.ui.comparison import render_comparison_tab
 from lease_analysis.ui.purchase_inputs import render_purchase_inputs_tab
 from lease_analysis.ui.purchase_analysis import render_purchase_analysis_tab
 from lease_analysis.ui.purchase_comparison import render_purchase_comparison_tab
+from lease_analysis.utils.timing import configure_logging, stage, start_run
+from lease_analysis.utils.ui_helpers import render_diagnostics
 
 def main():
     """Main application entry point."""
     # Configure page
     st.set_page_config(page_title="Savills Property Analyzer", layout="wide")
+    configure_logging()
+    timings = start_run("property_analyzer")
     
     # Header
     st.title("Savills | Property Analyzer")
@@ -31,13 +35,13 @@ def main():
         tab_inputs, tab_analysis, tab_comparison = st.tabs(["Inputs", "Analysis", "Comparison"])
         
         # Render each tab
-        with tab_inputs:
+        with tab_inputs, stage("tab.inputs"):
             render_inputs_tab()
         
-        with tab_analysis:
+        with tab_analysis, stage("tab.analysis"):
             render_analysis_tab()
         
-        with tab_comparison:
+        with tab_comparison, stage("tab.comparison"):
             render_comparison_tab()
     
     else:  # Purchase Analyzer
@@ -45,14 +49,16 @@ def main():
         tab_inputs, tab_analysis, tab_comparison = st.tabs(["Inputs", "Analysis", "Comparison"])
         
         # Render each tab
-        with tab_inputs:
+        with tab_inputs, stage("tab.inputs"):
             render_purchase_inputs_tab()
         
-        with tab_analysis:
+        with tab_analysis, stage("tab.analysis"):
             render_purchase_analysis_tab()
         
-        with tab_comparison:
+        with tab_comparison, stage("tab.comparison"):
             render_purchase_comparison_tab()
 
+    render_diagnostics(timings)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
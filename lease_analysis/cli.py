@@ -0,0 +1,277 @@
+"""
+Headless batch runner for lease and purchase scenarios.
+
+Usage:
+    python -m lease_analysis.cli scenarios.json -o results.xlsx --workers 4
+
+Large batches are split across worker processes (all CPUs by default, or
+$LEASE_ANALYZER_WORKERS); small ones run in-process.
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+
+from lease_analysis.engine import lease as lease_engine
+from lease_analysis.engine.executor import MIN_PARALLEL_ROWS, batch_rows, map_chunks, take_rows
+from lease_analysis.engine.params import PurchaseParams
+from lease_analysis.utils.purchase_calculator import analyze_purchase
+from lease_analysis.utils.scenario_import import read_scenarios
+
+LEASE_MODES = {"web": lease_engine.WEB, "classic": lease_engine.CLASSIC}
+DATE_FIELDS = ("start_date", "purchase_date")
+OUTPUT_FORMATS = (".csv", ".parquet", ".xlsx")
+# Bad parameter values surface as these; they fail the scenario, not the batch
+SCENARIO_ERRORS = (KeyError, TypeError, ValueError, ZeroDivisionError)
+
+
+def parse_scenario(record):
+    """Turn a decoded scenario record into calculator parameters (ISO dates become dates)."""
+    scenario = dict(record)
+    scenario.setdefault("type", "lease")
+    for field in DATE_FIELDS:
+        if isinstance(scenario.get(field), str):
+            scenario[field] = date.fromisoformat(scenario[field])
+    return scenario
+
+
+def load_scenarios(path, kind=None):
+    """
+    Read scenario definitions from a JSON array, JSON Lines, CSV or XLSX file.
+
+    Each scenario is an object (or spreadsheet row) of calculator parameters
+    plus a ``type`` of "lease" (the default) or "purchase". Spreadsheet rows
+    are validated as they stream in.
+
+    Args:
+        path (str): Scenario file
+        kind (str): Scenario type for spreadsheets without a ``type`` column
+
+    Returns:
+        tuple: (scenarios, bad_rows) where bad_rows lists (row_number, [messages])
+    """
+    if os.path.splitext(path)[1].lower() in (".csv", ".xlsx", ".xlsm"):
+        return read_scenarios(path, kind)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        records = json.loads(text)
+    else:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if kind:
+        records = [{"type": kind, **r} for r in records]
+    return [parse_scenario(r) for r in records], []
+
+
+def _failure(kind, error):
+    if isinstance(error, KeyError):
+        return kind, None, None, f"missing parameter {error}"
+    return kind, None, None, str(error)
+
+
+def run_scenario(scenario, lease_mode="web"):
+    """
+    Analyze one scenario.
+
+    Returns:
+        tuple: (kind, summary_dict, cash_flow_df, error); ``error`` is a message
+            and the frames are None when the scenario could not be analyzed
+    """
+    kind = scenario.get("type", "lease")
+    params = {k: v for k, v in scenario.items() if k != "type"}
+    try:
+        if kind == "lease":
+            summary, df = lease_engine.analyze_lease(params, LEASE_MODES[lease_mode])
+        elif kind == "purchase":
+            summary, df = analyze_purchase(params)
+        else:
+            return kind, None, None, f"unknown scenario type {kind!r}"
+    except SCENARIO_ERRORS as e:
+        return _failure(kind, e)
+    return kind, summary, df, None
+
+
+def _lease_rows(b, lease_mode):
+    # Runs in the workers: ``b`` is a row slice of the stacked lease inputs
+    try:
+        return [("lease", summary, df, None)
+                for summary, df in lease_engine.analyze_stacked(b, LEASE_MODES[lease_mode])]
+    except SCENARIO_ERRORS as e:
+        n = batch_rows(b)
+        if n == 1:
+            return [_failure("lease", e)]
+        # Retry row by row so one bad scenario does not fail its neighbours
+        return [result for row in range(n) for result in _lease_rows(take_rows(b, row, row + 1), lease_mode)]
+
+
+def _purchase_rows(columns):
+    # Runs in the workers: ``columns`` is a row slice of ``PurchaseParams.to_columns``
+    results = []
+    for params in PurchaseParams.from_columns(columns):
+        try:
+            summary, df = analyze_purchase(params)
+        except SCENARIO_ERRORS as e:
+            results.append(_failure("purchase", e))
+        else:
+            results.append(("purchase", summary, df, None))
+    return results
+
+
+def run_batch(scenarios, workers=1, lease_mode="web", min_parallel=MIN_PARALLEL_ROWS):
+    """
+    Analyze scenarios in order, fanning large batches out to worker processes.
+
+    Leases are normalized here and stacked into the engine's scenario x period
+    arrays; purchases are validated into ``PurchaseParams`` and stacked into a
+    matrix. Workers receive row slices of those arrays, not pickled dicts
+    (see ``engine.executor.map_chunks``). Scenarios that cannot be stacked
+    are analyzed on their own with ``run_scenario``, so they report the same
+    errors either way.
+
+    Args:
+        scenarios (list): Scenario dicts from ``load_scenarios``
+        workers (int): Worker processes; 1 runs in this process and ``None``
+            uses every CPU (or ``$LEASE_ANALYZER_WORKERS``)
+        lease_mode (str): "web" or "classic" lease calculation mode
+        min_parallel (int): Smallest lease or purchase batch sent to workers
+
+    Returns:
+        list: ``run_scenario`` results, in input order
+    """
+    results = [None] * len(scenarios)
+    leases, purchases = [], []
+    for number, scenario in enumerate(scenarios):
+        kind = scenario.get("type", "lease")
+        params = {k: v for k, v in scenario.items() if k != "type"}
+        try:
+            if kind == "lease":
+                x = lease_engine.lease_inputs(params, LEASE_MODES[lease_mode])
+                if lease_engine.stackable(x):
+                    leases.append((number, x))
+                    continue
+            if kind == "purchase":
+                purchases.append((number, PurchaseParams.from_dict(params)))
+                continue
+        except SCENARIO_ERRORS:
+            pass
+        results[number] = run_scenario(scenario, lease_mode)
+
+    batches = []
+    if leases:
+        numbers, xs = zip(*leases)
+        try:
+            batches.append((numbers, _lease_rows, lease_engine.stack_inputs(xs), {"lease_mode": lease_mode}))
+        except SCENARIO_ERRORS:
+            for number in numbers:
+                results[number] = run_scenario(scenarios[number], lease_mode)
+    if purchases:
+        numbers, items = zip(*purchases)
+        batches.append((numbers, _purchase_rows, PurchaseParams.to_columns(items), {}))
+
+    for numbers, func, columns, kwargs in batches:
+        for number, result in zip(numbers, map_chunks(func, columns, workers, min_parallel, **kwargs)):
+            results[number] = result
+    return results
+
+
+def collect_tables(results):
+    """
+    Assemble batch results into summary and cash flow tables per scenario type.
+
+    Returns:
+        dict: Table name ("lease_summary", "lease_cash_flows", ...) to DataFrame
+    """
+    rows = {"lease": [], "purchase": []}
+    flows = {"lease": [], "purchase": []}
+    for number, (kind, summary, df, error) in enumerate(results, start=1):
+        if error is not None:
+            continue
+        rows[kind].append({"Scenario": number, **summary})
+        flows[kind].append(df.assign(Scenario=number)[["Scenario", *df.columns]])
+
+    tables = {}
+    for kind in ("lease", "purchase"):
+        if rows[kind]:
+            tables[f"{kind}_summary"] = pd.DataFrame(rows[kind])
+            tables[f"{kind}_cash_flows"] = pd.concat(flows[kind], ignore_index=True)
+    return tables
+
+
+def write_tables(tables, output):
+    """
+    Write result tables to ``output``.
+
+    An ``.xlsx`` path gets one sheet per table; ``.csv`` and ``.parquet`` paths
+    get one file per table, named ``<stem>_<table><suffix>``.
+
+    Returns:
+        list: Paths written
+    """
+    stem, suffix = os.path.splitext(output)
+    suffix = suffix.lower()
+    if suffix == ".xlsx":
+        with pd.ExcelWriter(output, engine="openpyxl") as writer:
+            for name, df in tables.items():
+                df.to_excel(writer, sheet_name=name.replace("_", " ").title(), index=False)
+        return [output]
+
+    paths = []
+    for name, df in tables.items():
+        path = f"{stem}_{name}{suffix}"
+        if suffix == ".parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m lease_analysis.cli",
+        description="Run lease and purchase scenarios without the web app.")
+    parser.add_argument("scenarios", help="Scenario file: JSON array, JSON Lines, .csv or .xlsx")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Output path ending in .csv, .parquet or .xlsx")
+    parser.add_argument("--workers", type=int,
+                        help="Worker processes (default: all CPUs; small batches run in-process)")
+    parser.add_argument("--type", choices=("lease", "purchase"), dest="kind",
+                        help="Scenario type for files without a type column/key")
+    parser.add_argument("--lease-mode", choices=sorted(LEASE_MODES), default="web",
+                        help="Lease calculation mode (default: web)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if os.path.splitext(args.output)[1].lower() not in OUTPUT_FORMATS:
+        parser.error(f"output must end in one of {', '.join(OUTPUT_FORMATS)}")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    try:
+        scenarios, bad_rows = load_scenarios(args.scenarios, args.kind)
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot read {args.scenarios}: {e}")
+    for number, errors in bad_rows:
+        print(f"row {number}: {'; '.join(errors)}", file=sys.stderr)
+
+    results = run_batch(scenarios, workers=args.workers, lease_mode=args.lease_mode)
+    failed = [(n, kind, error) for n, (kind, _, _, error) in enumerate(results, start=1) if error]
+    for number, kind, error in failed:
+        print(f"scenario {number} ({kind}): {error}", file=sys.stderr)
+
+    try:
+        paths = write_tables(collect_tables(results), args.output)
+    except ImportError as e:
+        parser.error(str(e))
+    print(f"Analyzed {len(results) - len(failed)} of {len(results)} scenarios -> {', '.join(paths)}")
+    return 1 if failed or bad_rows else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
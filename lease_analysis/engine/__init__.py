@@ -0,0 +1,3 @@
+"""
+Calculation engine for the Lease Analyzer.
+"""
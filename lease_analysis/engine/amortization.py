@@ -0,0 +1,184 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+def _column(value):
+    # Scalars and (n,) arrays become (n, 1) so they broadcast across months
+    return np.atleast_1d(np.asarray(value, dtype=float))[:, None]
+
+
+def _annuity(r, months):
+    # Present value of 1 per month for ``months`` months; ``months`` itself at a zero rate
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r != 0, (1 - (1 + r) ** -months) / np.where(r != 0, r, 1), months)
+
+
+def payment(principal, rate, months):
+    """
+    Level monthly payment that retires ``principal`` over ``months`` (``npf.pmt``).
+
+    Args:
+        principal: Loan amount(s)
+        rate: Annual interest rate(s), in %
+        months: Amortization length(s) in months
+
+    Returns:
+        float or np.ndarray: Monthly payment(s), positive
+    """
+    r = np.asarray(rate, dtype=float) / 1200
+    months = np.asarray(months, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(months > 0, principal / _annuity(r, months), principal)
+    return result[()]
+
+
+def remaining_balance(principal, rate, months, paid_months):
+    """
+    Balance of a level-payment loan after ``paid_months`` payments, floored at zero.
+
+    Args:
+        principal: Loan amount(s)
+        rate: Annual interest rate(s), in %
+        months: Amortization length(s) in months
+        paid_months: Payments made so far
+
+    Returns:
+        float or np.ndarray: Remaining balance(s)
+    """
+    r = np.asarray(rate, dtype=float) / 1200
+    paid = np.asarray(paid_months, dtype=float)
+    balance = principal * (1 + r) ** paid - payment(principal, rate, months) * (1 + r) ** paid * _annuity(r, paid)
+    balance = np.maximum(balance, 0.0)
+    return balance[()]
+
+
+class Amortization(NamedTuple):
+    """
+    Monthly loan schedules, one row per financing variant.
+
+    Month ``k`` (column ``k - 1``) covers the ``k``-th payment. Columns past a
+    variant's maturity are zero.
+
+    Attributes:
+        payment: Scheduled debt service (interest plus scheduled principal)
+        interest: Interest portion of each payment
+        principal: Scheduled principal portion of each payment
+        prepayment: Extra principal paid on top of the scheduled payment
+        balloon: Balance paid off at maturity
+        balance: Balance after the month's payments
+        monthly_payment: ``(n,)`` level payment once amortization starts
+    """
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    prepayment: np.ndarray
+    balloon: np.ndarray
+    balance: np.ndarray
+    monthly_payment: np.ndarray
+
+    def annual(self):
+        """
+        Roll the monthly schedule up into loan years (months 1-12, 13-24, ...).
+
+        Returns:
+            dict: ``(n, years)`` arrays; flows are summed over each year and
+                ``balance`` is the balance at the year's end
+        """
+        n, months = self.balance.shape
+        years = -(-months // 12)
+        pad = ((0, 0), (0, years * 12 - months))
+        year_end = np.minimum(np.arange(1, years + 1) * 12, months) - 1
+
+        rollup = {name: np.pad(getattr(self, name), pad).reshape(n, years, 12).sum(axis=2)
+                  for name in ("payment", "interest", "principal", "prepayment", "balloon")}
+        rollup["balance"] = self.balance[:, year_end]
+        return rollup
+
+
+def amortize(principal, rate, amort_years, term_years=None, interest_only_months=0,
+             extra_payment=0.0, prepayments=None, months=None):
+    """
+    Closed-form monthly amortization schedules for many financing variants.
+
+    Every argument may be a scalar or an ``(n,)`` array (one value per
+    variant); balances come straight from the annuity formula rather than a
+    month-by-month loop, so thousands of 30-year variants are a few array
+    operations.
+
+    The loan pays interest only for ``interest_only_months``, then a level
+    payment that retires the balance over ``amort_years``. Prepayments go
+    straight to principal and keep the payment unchanged, so they shorten
+    the loan; a final payment is cut to what is owed. When ``term_years`` is
+    shorter than the amortization, the balance left at maturity is due as a
+    balloon.
+
+    Args:
+        principal: Loan amount
+        rate: Annual interest rate, in %
+        amort_years: Amortization period in years (after any interest-only period)
+        term_years: Loan maturity in years; defaults to the interest-only
+            period plus the amortization period
+        interest_only_months: Months of interest-only payments at the start
+        extra_payment: Extra principal paid every month
+        prepayments: Lump-sum principal payments by month, ``(months,)`` or
+            ``(n, months)`` with column 0 paid in month 1
+        months: Months to schedule; defaults to the longest maturity
+
+    Returns:
+        Amortization: Monthly schedules (see ``Amortization.annual`` for loan years)
+    """
+    principal = _column(principal)
+    r = _column(rate) / 1200
+    io = np.rint(_column(interest_only_months))
+    amort = np.rint(_column(amort_years) * 12)
+    term = io + amort if term_years is None else np.rint(_column(term_years) * 12)
+    principal, r, io, amort, term = np.broadcast_arrays(principal, r, io, amort, term)
+    if months is None:
+        months = int(term.max()) if term.size else 0
+
+    k = np.arange(1, months + 1)[None, :]
+    lumps = np.zeros((len(principal), months))
+    if prepayments is not None:
+        given = np.atleast_2d(np.asarray(prepayments, dtype=float))[:, :months]
+        lumps[:, :given.shape[1]] = given
+    lumps = lumps + _column(extra_payment)
+    lumps = np.where(k <= term, lumps, 0.0)
+
+    # Prepayments during the interest-only period come straight off the balance
+    paid_early = np.cumsum(lumps, axis=1)
+    io_balance = np.maximum(principal - np.where(k <= io, lumps, 0.0).sum(axis=1, keepdims=True), 0.0)
+    level = payment(io_balance, r * 1200, amort)
+
+    # Afterwards: B_k = B_io (1+r)^j - P a(j) (1+r)^j - sum of lumps m in (io, k] grown to k
+    j = np.maximum(k - io, 0)
+    growth = (1 + r) ** j
+    lumps_after = np.where(k > io, lumps, 0.0)
+    grown_lumps = growth * np.cumsum(lumps_after * (1 + r) ** -j, axis=1)
+    amortizing = io_balance * growth - level * growth * _annuity(r, j) - grown_lumps
+    balance = np.where(k <= io, principal - paid_early, amortizing)
+    balance = np.maximum(np.where(k <= term, balance, 0.0), 0.0)
+
+    opening = np.column_stack([principal[:, 0], balance[:, :-1]]) if months else balance
+    interest = opening * r
+    scheduled = np.where(k <= io, 0.0, np.minimum(level - interest, opening))
+    scheduled = np.where(k <= term, np.maximum(scheduled, 0.0), 0.0)
+    paid_down = opening - balance
+    prepayment = np.maximum(paid_down - scheduled, 0.0)
+    scheduled = paid_down - prepayment
+
+    # Whatever is still owed at maturity is paid as a balloon
+    at_maturity = k == term
+    balloon = np.where(at_maturity, balance, 0.0)
+    balance = np.where(at_maturity, 0.0, balance)
+    interest = np.where(k <= term, interest, 0.0)
+
+    return Amortization(
+        payment=interest + scheduled,
+        interest=interest,
+        principal=scheduled,
+        prepayment=prepayment,
+        balloon=balloon,
+        balance=balance,
+        monthly_payment=level[:, 0],
+    )
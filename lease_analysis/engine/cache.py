@@ -0,0 +1,338 @@
+import copy
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time as _time
+from collections import OrderedDict
+from datetime import date, datetime, time
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+# Bump whenever a calculation changes so results persisted by an older
+# engine are never served.
+ENGINE_VERSION = "5"
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_BYTES = 512 * 1024 * 1024
+
+
+def _canonical(value):
+    """Convert a parameter value into plain JSON types with a stable layout."""
+    # Parameter objects (engine.params) hash themselves once and reuse it
+    cache_key = getattr(value, "cache_key", None)
+    if callable(cache_key):
+        return {"$params": cache_key()}
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    # Tag dates so they never collide with the equivalent string
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, np.ndarray):
+        return _canonical(value.tolist())
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Cannot hash parameter value of type {type(value).__name__}")
+
+
+def param_key(*parts):
+    """
+    Stable hash of analysis parameters.
+
+    Dict keys are sorted, tuples hash like lists and dates hash by their ISO
+    form, so equal parameters give the same key across reruns and processes.
+
+    Args:
+        *parts: Parameter dicts (and any other JSON-like values) to hash together
+
+    Returns:
+        str: Hex SHA-256 digest
+
+    Raises:
+        TypeError: If a value has no canonical form
+    """
+    payload = json.dumps(_canonical(parts), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _nbytes(value):
+    """Approximate memory held by a cached result."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_nbytes(k) + _nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of analysis results bounded by an approximate byte budget.
+
+    Results are copied on the way in and out, so callers can mutate what they
+    get back (style a DataFrame, add summary keys) without corrupting the cache.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return a copy of the cached result for ``key``, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[0]
+        return copy.deepcopy(value)
+
+    def put(self, key, value):
+        """Store a copy of ``value``, evicting least recently used entries past the budget."""
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def stats(self):
+        """Hit/miss counters and current size, e.g. for a diagnostics panel."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "hit_rate":  self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries":   len(self._entries),
+                "bytes":     self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class DiskCache:
+    """
+    SQLite-backed result cache shared across sessions, processes and restarts.
+
+    Rows are keyed by parameter hash and tagged with ``ENGINE_VERSION``; rows
+    from another engine version are purged on open. Once the stored blobs
+    exceed ``max_bytes`` the least recently read rows are deleted. Any SQLite
+    error disables the cache rather than failing the analysis.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_DISK_BYTES, version=ENGINE_VERSION):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = False
+
+    def _connect(self):
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    " key TEXT PRIMARY KEY, version TEXT NOT NULL, value BLOB NOT NULL,"
+                    " size INTEGER NOT NULL, accessed REAL NOT NULL)")
+                conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+                conn.execute("DELETE FROM results WHERE version != ?", (self.version,))
+                conn.commit()
+                self._conn = conn
+            except (sqlite3.Error, OSError):
+                self._disabled = True
+        return self._conn
+
+    def get(self, key, default=None):
+        """Return the stored result for ``key``, counting the hit or miss."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn and conn.execute(
+                    "SELECT value FROM results WHERE key = ? AND version = ?",
+                    (key, self.version)).fetchone()
+                if row:
+                    conn.execute("UPDATE results SET accessed = ? WHERE key = ?",
+                                 (_time.time(), key))
+                    conn.commit()
+            except sqlite3.Error:
+                self._disabled, row = True, None
+            if not row:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key, value):
+        """Persist ``value``, then trim the oldest rows past the byte budget."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                if conn is None:
+                    return
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, version, value, size, accessed)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, self.version, blob, len(blob), _time.time()))
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+                if total > self.max_bytes:
+                    for old_key, size in conn.execute(
+                            "SELECT key, size FROM results ORDER BY accessed").fetchall():
+                        if total <= self.max_bytes:
+                            break
+                        conn.execute("DELETE FROM results WHERE key = ?", (old_key,))
+                        total -= size
+                        self.evictions += 1
+                conn.commit()
+            except sqlite3.Error:
+                self._disabled = True
+
+    def clear(self):
+        """Delete every stored result and reset the counters."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                if conn is not None:
+                    conn.execute("DELETE FROM results")
+                    conn.commit()
+            except sqlite3.Error:
+                self._disabled = True
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Hit/miss counters and stored size."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                entries, size = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone() if conn else (0, 0)
+            except sqlite3.Error:
+                entries, size = 0, 0
+            return {
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "evictions": self.evictions,
+                "entries":   entries,
+                "bytes":     size,
+                "max_bytes": self.max_bytes,
+                "enabled":   not self._disabled,
+            }
+
+
+def _default_disk_path():
+    # LEASE_ANALYZER_CACHE="" turns the disk cache off
+    path = os.environ.get("LEASE_ANALYZER_CACHE")
+    if path is None:
+        path = os.path.join(os.path.expanduser("~"), ".cache", "lease_analyzer", "results.sqlite")
+    return path or None
+
+
+# Shared by every session in the process; lives in an imported module so it
+# survives Streamlit reruns of the page script.
+results_cache = ResultCache()
+_disk_path = _default_disk_path()
+disk_cache = DiskCache(_disk_path) if _disk_path else None
+
+
+_NO_DISK = object()
+
+
+def memoize(func=None, *, cache=None, disk=_NO_DISK, name=None):
+    """
+    Cache a pure analysis function on a hash of its arguments.
+
+    Lookups go to the in-memory cache, then the disk cache, and only then
+    run the function. The key combines ``name`` (default ``module.qualname``)
+    with the canonical arguments, so a function re-defined on every Streamlit
+    rerun still hits. Calls with arguments that cannot be hashed run uncached.
+
+    Args:
+        func: Function to wrap (when used as a bare ``@memoize``)
+        cache (ResultCache): Memory cache, defaults to ``results_cache``
+        disk (DiskCache): Persistent cache, defaults to ``disk_cache``;
+            ``None`` keeps results in memory only
+        name (str): Key namespace for the function
+    """
+    def decorate(fn):
+        namespace = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            store = cache if cache is not None else results_cache
+            persist = disk_cache if disk is _NO_DISK else disk
+            try:
+                key = param_key(namespace, args, kwargs)
+            except TypeError:
+                return fn(*args, **kwargs)
+            result = store.get(key)
+            if result is None:
+                result = persist.get(key) if persist is not None else None
+                if result is None:
+                    result = fn(*args, **kwargs)
+                    if persist is not None:
+                        persist.put(key, result)
+                store.put(key, result)
+            return result
+
+        wrapper.uncached = fn
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
@@ -0,0 +1,123 @@
+import contextvars
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+
+import numpy as np
+
+# Worker count when none is given; LEASE_ANALYZER_WORKERS overrides the CPU count
+WORKERS_ENV = "LEASE_ANALYZER_WORKERS"
+# Batches smaller than this run in-process: starting workers costs more than it saves
+MIN_PARALLEL_ROWS = 256
+# A few chunks per worker balances uneven rows without much transfer overhead
+CHUNKS_PER_WORKER = 4
+
+
+def default_workers():
+    """Worker processes to use: ``$LEASE_ANALYZER_WORKERS`` or the machine's CPU count."""
+    value = os.environ.get(WORKERS_ENV)
+    if value:
+        return max(1, int(value))
+    return os.cpu_count() or 1
+
+
+def batch_rows(columns):
+    """Number of rows in a column batch (the shared length of its arrays)."""
+    lengths = {len(value) for value in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"batch columns have different lengths: {sorted(lengths)}")
+    return lengths.pop() if lengths else 0
+
+
+def take_rows(columns, start, stop):
+    """Rows ``start:stop`` of every column."""
+    return {key: value[start:stop] for key, value in columns.items()}
+
+
+def merge_chunks(parts):
+    """
+    Join per-chunk results in order.
+
+    Lists are concatenated, arrays are joined along the first axis and dicts
+    are merged key by key (recursively), so a chunk function may return any
+    of them as long as every chunk returns the same layout.
+    """
+    first = parts[0]
+    if isinstance(first, dict):
+        return {key: merge_chunks([part[key] for part in parts]) for key in first}
+    if isinstance(first, np.ndarray):
+        return np.concatenate(parts, axis=0)
+    return [item for part in parts for item in part]
+
+
+def map_chunks(func, columns, workers=None, min_rows=MIN_PARALLEL_ROWS, **kwargs):
+    """
+    Apply ``func`` to row chunks of ``columns`` and merge the results in order.
+
+    A batch travels as columns (arrays sharing their first axis, one row per
+    scenario), so each chunk pickles as a few raw array slices rather than
+    one dict per scenario. Small batches (fewer than ``min_rows`` rows) and
+    single-worker runs call ``func`` once in this process. Otherwise the batch
+    is split into a few chunks per worker and run on a ``ProcessPoolExecutor``,
+    so ``func`` must be a module-level function.
+
+    Args:
+        func: ``func(chunk_columns, **kwargs)`` returning a list, an array or
+            a dict of those, with one entry per row
+        columns (dict): Column name -> array with one row per scenario
+        workers (int): Worker processes; ``None`` uses ``default_workers()``
+        min_rows (int): Smallest batch worth sending to workers
+        **kwargs: Extra (picklable) arguments for ``func``
+
+    Returns:
+        ``func``'s result for the whole batch, rows in input order
+    """
+    n = batch_rows(columns)
+    workers = default_workers() if workers is None else workers
+    if workers <= 1 or n < max(min_rows, 2):
+        return func(columns, **kwargs)
+
+    size = -(-n // (workers * CHUNKS_PER_WORKER))
+    chunks = [take_rows(columns, start, start + size) for start in range(0, n, size)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return merge_chunks(list(pool.map(partial(func, **kwargs), chunks)))
+
+
+def map_threads(func, items, workers, progress=None):
+    """
+    Apply ``func`` to each item on a thread pool and return the results in order.
+
+    For work that waits outside the interpreter, where threads overlap
+    without pickling and share in-process caches. Each call runs in a copy
+    of the caller's context, so stage timings (``utils.timing``) land in
+    the caller's run.
+
+    Args:
+        func: ``func(item)``
+        items (list): Inputs, one call each
+        workers (int): Threads; 1 (or a single item) runs in this thread
+        progress: Optional ``progress(done, total)``, called in this thread
+            as calls finish
+
+    Returns:
+        list: ``func``'s results, in the order of ``items``
+    """
+    items = list(items)
+    total = len(items)
+    if workers <= 1 or total < 2:
+        results = []
+        for item in items:
+            results.append(func(item))
+            if progress:
+                progress(len(results), total)
+        return results
+
+    results = [None] * total
+    with ThreadPoolExecutor(max_workers=min(workers, total)) as pool:
+        futures = {pool.submit(contextvars.copy_context().run, func, item): n
+                   for n, item in enumerate(items)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, total)
+    return results
@@ -0,0 +1,169 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from lease_analysis.engine.lease import (
+    WEB, lease_inputs, lease_metrics, lease_schedule, schedule_amounts, stack_inputs,
+)
+
+# Inputs goal_seek can solve for, with the default search range for each;
+# a high bound of None means each scenario's own lease term
+BOUNDS = {
+    "base":     (0.0, 500.0),     # $/SF/yr
+    "inc":      (-10.0, 25.0),    # annual escalation, %
+    "free":     (0.0, None),      # months
+    "ti":       (0.0, 500.0),     # $/SF
+    "add_cred": (0.0, 500.0),     # $/SF
+}
+
+
+class GoalSeekResult(NamedTuple):
+    """
+    Solved inputs for a batch of goal-seek targets.
+
+    Attributes:
+        value: Input value hitting each target; NaN where none in the bounds does
+        converged: True where ``value`` hits the target to tolerance
+        iterations: Evaluations of the lease math spent on each target
+        achieved: The metric at ``value``
+    """
+    value: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+    achieved: np.ndarray
+
+    @property
+    def failed(self):
+        """Indices of the targets with no solution in the bounds."""
+        return np.flatnonzero(~self.converged)
+
+
+def _metric(b, metric, mode):
+    s = lease_schedule(b, mode)
+    return lease_metrics(b, s, schedule_amounts(s), mode)[metric]
+
+
+def _evaluator(scenarios, variable, metric, mode):
+    """``f(rows, values)``: the metric of scenario ``rows`` with ``variable`` set to ``values``."""
+    if variable == "free":
+        # Free months change the term and so the schedule width: restack every call
+        def evaluate(rows, values):
+            b = stack_inputs([lease_inputs(dict(scenarios[row], free=value, custom_abate=False), mode)
+                              for row, value in zip(rows, values)])
+            return _metric(b, metric, mode)
+        return evaluate
+
+    stacked = stack_inputs([lease_inputs(p, mode) for p in scenarios])
+
+    def evaluate(rows, values):
+        b = {key: value[rows] for key, value in stacked.items()}
+        column = values[:, None]
+        # A solved escalation replaces any custom per-year increases
+        b[variable] = np.repeat(column, b["inc"].shape[1], axis=1) if variable == "inc" else column
+        return _metric(b, metric, mode)
+    return evaluate
+
+
+def goal_seek(params, variable, targets, metric="npv", bounds=None, mode=WEB,
+              tol=1e-6, max_iter=60):
+    """
+    Solve for the lease input that brings a metric to each target value.
+
+    Every target is solved at once: each iteration stacks the still-open
+    targets into one ``lease_schedule`` pass. The root is kept bracketed
+    and narrowed with the Illinois variant of regula falsi, which settles a
+    linear metric (NPV in base rent or TI) in one or two evaluations and
+    never takes more than ``max_iter``. Targets the metric cannot reach
+    inside ``bounds`` come back as NaN with ``converged`` False.
+
+    Args:
+        params: Lease parameter dict, as for ``analyze_lease``, or a list of
+            them (one per target)
+        variable (str): Input to solve for, one of ``BOUNDS``; solving
+            ``free`` replaces a custom abatement schedule and solving ``inc``
+            replaces custom per-year increases
+        targets: Target metric value(s), a scalar or ``(n,)`` array
+        metric (str): ``lease_metrics`` key, e.g. "npv" or "avg_eff_rent"
+        bounds (tuple): ``(low, high)`` search range; defaults to ``BOUNDS[variable]``
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+        tol (float): Convergence tolerance on the solved input
+        max_iter (int): Most evaluations per target after the bracket ends
+
+    Returns:
+        GoalSeekResult: ``(n,)`` solved values, flags, iteration counts and
+            the metric achieved
+    """
+    if variable not in BOUNDS:
+        raise ValueError(f"cannot solve for {variable!r}; choose one of {sorted(BOUNDS)}")
+    targets = np.atleast_1d(np.asarray(targets, dtype=float))
+    scenarios = [params] * len(targets) if isinstance(params, dict) else list(params)
+    if len(scenarios) != len(targets):
+        raise ValueError(f"{len(scenarios)} scenarios for {len(targets)} targets")
+    n = len(targets)
+    low, high = bounds or BOUNDS[variable]
+    evaluate = _evaluator(scenarios, variable, metric, mode)
+
+    rows = np.arange(n)
+    lo = np.full(n, float(low))
+    hi = np.array([p["term_mos"] for p in scenarios], dtype=float) if high is None else np.full(n, float(high))
+    f_lo = evaluate(rows, lo) - targets
+    f_hi = evaluate(rows, hi) - targets
+    value = np.where(f_lo == 0, lo, np.where(f_hi == 0, hi, np.nan))
+    residual = np.where(f_lo == 0, 0.0, f_hi)
+    converged = np.isfinite(value)
+    iterations = np.full(n, 2)
+    # Bracketed: the metric crosses the target between the bounds
+    active = np.flatnonzero(~converged & (np.sign(f_lo) != np.sign(f_hi)))
+    side = np.zeros(n, dtype=np.int8)
+
+    for _ in range(max_iter):
+        if not len(active):
+            break
+        a, c, fa, fc = lo[active], hi[active], f_lo[active], f_hi[active]
+        x = c - fc * (c - a) / (fc - fa)
+        x = np.where(np.isfinite(x) & (x > a) & (x < c), x, (a + c) / 2)
+        fx = evaluate(active, x) - targets[active]
+        iterations[active] += 1
+
+        # Keep the bracket; halve the stale end's residual when it survives twice (Illinois)
+        left = np.sign(fx) == np.sign(fa)
+        stale_hi = left & (side[active] == 1)
+        stale_lo = ~left & (side[active] == -1)
+        lo[active] = np.where(left, x, a)
+        f_lo[active] = np.where(left, fx, np.where(stale_lo, fa / 2, fa))
+        hi[active] = np.where(left, c, x)
+        f_hi[active] = np.where(left, np.where(stale_hi, fc / 2, fc), fx)
+        side[active] = np.where(left, 1, -1)
+
+        value[active] = x
+        residual[active] = fx
+        done = (np.abs(fx) <= 1e-9 * (1 + np.abs(targets[active]))) | (hi[active] - lo[active] <= tol)
+        converged[active] = done
+        active = active[~done]
+
+    achieved = np.where(np.isfinite(value), targets + residual, np.nan)
+    return GoalSeekResult(value, converged, iterations, achieved)
+
+
+def breakeven(p, others, variable="base", metric="npv", **kwargs):
+    """
+    Solve ``p``'s ``variable`` so its metric matches each of ``others``.
+
+    For example, the base rent that makes option A's NPV equal option B's,
+    or (with ``p`` carrying a $10/SF smaller TI and ``others=[original]``)
+    the free months that offset the TI shortfall.
+
+    Args:
+        p (dict): Lease parameters to adjust
+        others: Lease parameter dict or list of dicts to match
+        variable (str): Input of ``p`` to solve for, see ``goal_seek``
+        metric (str): ``lease_metrics`` key to equalize
+        **kwargs: ``bounds``, ``mode``, ``tol`` and ``max_iter`` for ``goal_seek``
+
+    Returns:
+        GoalSeekResult: One solution per entry of ``others``
+    """
+    others = [others] if isinstance(others, dict) else list(others)
+    mode = kwargs.get("mode", WEB)
+    b = stack_inputs([lease_inputs(other, mode) for other in others])
+    return goal_seek(p, variable, _metric(b, metric, mode), metric=metric, **kwargs)
@@ -0,0 +1,710 @@
+from numbers import Real
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from lease_analysis.engine.cache import memoize
+from lease_analysis.engine.summary import (
+    CURRENCY, CURRENCY_CENTS, DATE, MONTHS, PERCENT, RENT_PSF, SQFT, SQFT_CHANGE, TEXT, Summary,
+)
+
+NNN = "Triple Net (NNN)"
+GROSS = "Full Service (Gross)"
+
+
+class LeaseMode(NamedTuple):
+    """
+    Switches for the behaviours that differ between the app's lease entry points.
+
+    Attributes:
+        name: Output layout, "web", "classic" or "advisory"
+        extend_term: Abatement months extend the term unless abatement is inside term
+        abate_base_only: Abatement credits base rent only, whatever the lease type
+        cap_abatement: Abatement in a period never exceeds that period's months
+        compound_escalations: Year n rent is the product of every prior year's
+            increase, rather than year n's rate raised to the n-th power
+        all_in_cash_flow: Net cash flow includes parking and the one-time TI,
+            moving and additional credits; payback also counts the additional credit
+    """
+    name: str = "web"
+    extend_term: bool = True
+    abate_base_only: bool = False
+    cap_abatement: bool = False
+    compound_escalations: bool = False
+    all_in_cash_flow: bool = False
+
+
+# lease_web_app.py lease analysis
+WEB = LeaseMode()
+# lease_analysis package (analysis.py / utils.lease_calculator)
+CLASSIC = LeaseMode("classic", extend_term=False, abate_base_only=True, all_in_cash_flow=True)
+# revolutionary_property_analyzer.py Client Advisory Tool
+ADVISORY = LeaseMode("advisory", extend_term=False, abate_base_only=True,
+                     cap_abatement=True, compound_escalations=True)
+
+
+def add_months(start, months):
+    """
+    Vectorized ``start + relativedelta(months=months)``.
+
+    Args:
+        start: Date (or array of datetime64[D]) to offset
+        months: Month offsets, broadcast against ``start``
+
+    Returns:
+        np.ndarray: datetime64[D] dates, clipped to the end of shorter months
+    """
+    start = np.asarray(start, dtype="datetime64[D]")
+    month0 = start.astype("datetime64[M]")
+    day = (start - month0.astype("datetime64[D]")).astype(np.int64)
+    target = month0 + np.asarray(months, dtype=np.int64)
+    month_len = ((target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")).astype(np.int64)
+    return target.astype("datetime64[D]") + np.minimum(day, month_len - 1)
+
+
+def lease_inputs(p, mode=WEB):
+    """Normalize a lease parameter dict into the scalars the engine works with."""
+    custom_ab = bool(p["custom_abate"])
+    abates = list(p.get("abates") or [])
+    free_mo = p["free"]
+
+    # Extend term by abatement months only if not inside term
+    base_term_mos = max(p["term_mos"], 1)
+    total_abate_months = sum(abates) if custom_ab else free_mo
+    inside_term = p.get("inside_term", False)
+    extend = mode.extend_term and not inside_term
+    term_mos = base_term_mos + total_abate_months if extend else base_term_mos
+
+    initial_sqft = max(p["sqft"], 1)
+    exp_month = p.get("exp_month", 0) or 0
+    exp_sqft = p.get("exp_sqft", 0) or 0
+    total_sqft = initial_sqft + exp_sqft if exp_month > 0 else initial_sqft
+
+    lease_type = p.get("lease_type", NNN)
+    park_detail = p.get("park_detail") or {}
+    park_ratio = p.get("park_ratio")
+
+    return {
+        "name":           p.get("name", ""),
+        "start_date":     p.get("start_date"),
+        "base_term_mos":  base_term_mos,
+        "term_mos":       term_mos,
+        "inside_term":    inside_term,
+        "initial_sqft":   initial_sqft,
+        "exp_month":      exp_month,
+        "exp_sqft":       exp_sqft,
+        "total_sqft":     total_sqft,
+        "sqft_schedule":  list(p.get("sqft_schedule") or []),
+        "base":           p["base"],
+        "inc":            p["inc"] if p["inc"] is not None else 0.0,
+        "rent_incs":      list(p.get("rent_incs") or []),
+        "gross":          lease_type == GROSS,
+        # Full Service tenants only pay OPEX above the base year
+        "opex_stop":      p.get("opex_base") or p["opex"],
+        "opex":           p["opex"],
+        "opexinc":        p["opexinc"],
+        "park_detail":    bool(park_detail),
+        "park_cost":      p["park_cost"],
+        "park_spaces":    p["park_spaces"],
+        # Spaces per 1,000 SF; reserved spaces come out of the ratio count
+        "park_by_ratio":  park_ratio is not None,
+        "park_ratio":     park_ratio or 0.0,
+        "unres_cost":     park_detail.get("unres_cost", 0.0),
+        "unres_spaces":   park_detail.get("unres_spaces", 0),
+        "res_cost":       park_detail.get("res_cost", 0.0),
+        "res_spaces":     park_detail.get("res_spaces", 0),
+        "park_inc":       park_detail.get("park_inc", 0.0),
+        "free":           free_mo,
+        "custom_abate":   custom_ab and bool(abates),
+        "abates":         abates,
+        "abate_total":    sum(abates) if custom_ab and abates else free_mo,
+        "base_only":      mode.abate_base_only or (
+            bool(p.get("base_only_abate", False)) and lease_type == NNN),
+        "ti":             p["ti"],
+        "add_cred":       p["add_cred"],
+        "move_ffe":       p["move_exp"] + p.get("ffe", 0.0),
+        "construction":   p.get("construction", 0.0),
+        "disc":           p["disc"],
+        "commission":     p.get("commission", 0.0),
+        "include_opex":   p.get("include_opex", False),
+    }
+
+
+_COLUMN_INPUTS = (
+    "base_term_mos", "term_mos", "inside_term", "exp_month", "exp_sqft", "initial_sqft", "total_sqft", "base", "inc", "gross",
+    "opex_stop", "opex", "opexinc", "park_detail", "park_cost", "park_spaces",
+    "park_by_ratio", "park_ratio", "unres_cost", "unres_spaces", "res_cost",
+    "res_spaces", "park_inc", "free", "custom_abate", "abate_total", "base_only",
+    "ti", "add_cred", "move_ffe", "construction", "disc", "commission", "include_opex",
+)
+# Flags among them; stacked as bool even for an empty batch
+_FLAG_INPUTS = (
+    "inside_term", "gross", "park_detail", "park_by_ratio", "custom_abate", "base_only", "include_opex",
+)
+
+
+def stackable(x):
+    """Whether normalized inputs are all numeric, so ``stack_inputs`` gives number arrays."""
+    return (all(isinstance(x[key], Real) for key in _COLUMN_INPUTS)
+            and all(isinstance(v, Real) for key in ("rent_incs", "abates", "sqft_schedule") for v in x[key]))
+
+
+def stack_inputs(xs):
+    """
+    Stack normalized scenarios into scenario x period arrays.
+
+    Scalar inputs become ``(n, 1)`` columns so they broadcast across periods;
+    per-year lists (custom increases, abatement, SF) become ``(n, periods)``
+    matrices padded with the flat-rate fallback. Names and start dates ride
+    along as ``(n, 1)`` object and ``datetime64[D]`` columns, so the stacked
+    arrays alone are enough to rebuild each scenario's summary.
+
+    Args:
+        xs (list): Normalized inputs from ``lease_inputs``
+
+    Returns:
+        dict: Stacked inputs for ``lease_schedule``
+    """
+    b = {key: np.array([x[key] for x in xs], dtype=bool if key in _FLAG_INPUTS else None)[:, None]
+         for key in _COLUMN_INPUTS}
+    b["name"] = np.array([x["name"] for x in xs], dtype=object)[:, None]
+    b["start_date"] = np.array([x["start_date"] for x in xs], dtype="datetime64[D]")[:, None]
+    term_mos = b["term_mos"]
+    b["full_years"] = term_mos // 12
+    b["extra_mos"] = term_mos % 12
+    b["periods"] = b["full_years"] + (b["extra_mos"] > 0)
+    width = int(b["periods"].max()) if xs else 0
+
+    # Period lengths and SF in effect at the end of each period
+    i = np.arange(width)[None, :]
+    b["valid"] = i < b["periods"]
+    b["months"] = np.where(i < b["full_years"], 12, b["extra_mos"])
+    end_month = i * 12 + b["months"]
+    b["expanded"] = (b["exp_month"] > 0) & (end_month >= b["exp_month"])
+    sqft = np.where(b["expanded"], b["total_sqft"], b["initial_sqft"]).astype(float)
+
+    inc = np.repeat(b["inc"].astype(float), width, axis=1)
+    abate_mos = np.zeros((len(xs), width))
+    abate_mos[:, :1] = np.where(b["custom_abate"], 0, b["free"])[:, :width]
+    for row, x in enumerate(xs):
+        custom = x["rent_incs"][:width]
+        inc[row, :len(custom)] = custom
+        if x["custom_abate"]:
+            listed = x["abates"][:width]
+            abate_mos[row, :len(listed)] = listed
+        sf = x["sqft_schedule"][:width]
+        sqft[row, :len(sf)] = sf
+    b["inc"] = inc
+    b["abate_mos"] = abate_mos
+    b["sqft"] = sqft
+    return b
+
+
+def annual_rates(b, mode=WEB):
+    """
+    Escalated per-SF annual rates for every stacked scenario and lease year.
+
+    Args:
+        b (dict): Stacked inputs from ``stack_inputs``
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+
+    Returns:
+        tuple: ``(n, periods)`` base rent, OPEX (net of any base-year stop) and
+            parking rates, in $/SF/year
+    """
+    i = np.arange(b["inc"].shape[1])[None, :]
+    first = i == 0
+    sqft = b["sqft"]
+
+    if mode.compound_escalations:
+        growth = np.cumprod(np.where(first, 1.0, 1 + b["inc"] / 100), axis=1)
+    else:
+        growth = (1 + b["inc"] / 100) ** i
+    b_year = b["base"] * growth
+    raw_opex = b["opex"] * (1 + b["opexinc"] / 100) ** i
+    o_year = np.where(b["gross"], np.maximum(0, raw_opex - b["opex_stop"]), raw_opex)
+
+    # Parking with escalation
+    park_growth = (1 + b["park_inc"] / 100) ** i
+    ratio_spaces = sqft / 1000 * b["park_ratio"]
+    by_ratio = b["park_by_ratio"]
+    res_spaces = np.where(by_ratio, np.minimum(b["res_spaces"], ratio_spaces), b["res_spaces"])
+    unres_spaces = np.where(by_ratio, ratio_spaces - res_spaces, b["unres_spaces"])
+    unres_total = b["unres_cost"] * park_growth * unres_spaces * 12
+    res_total = b["res_cost"] * park_growth * res_spaces * 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p_year = np.where(
+            b["park_detail"] | by_ratio,
+            (unres_total + res_total) / sqft,
+            b["park_cost"] * b["park_spaces"] * 12 / sqft * park_growth,
+        )
+    p_year = np.where(sqft > 0, p_year, 0.0)
+    return b_year, o_year, p_year
+
+
+def lease_schedule(b, mode=WEB):
+    """
+    Compute every per-period lease cash flow in one vectorized pass.
+
+    Args:
+        b (dict): Stacked inputs from ``stack_inputs``
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+
+    Returns:
+        dict: ``(n, periods)`` arrays (base rent, OPEX, parking, abatement,
+            credits, net rent, net cash flow and commission base), zeroed
+            past the end of each scenario's term
+    """
+    i = np.arange(b["inc"].shape[1])[None, :]
+    valid, months, sqft = b["valid"], b["months"], b["sqft"]
+    first = i == 0
+    frac = months / 12 * valid
+    b_year, o_year, p_year = annual_rates(b, mode)
+
+    abate_mos = b["abate_mos"] * valid
+    if mode.cap_abatement:
+        abate_mos = np.minimum(abate_mos, months * valid)
+    abate_rate = np.where(b["base_only"], b["base"], b["base"] + o_year)
+    abate_credit = abate_mos / 12 * abate_rate * sqft
+
+    # One-time items land in the first period
+    move_ffe = np.where(first, b["move_ffe"] * b["initial_sqft"], 0.0)
+    add_credit = np.where(first, b["add_cred"] * b["total_sqft"], 0.0)
+    ti_credit = np.where(first, b["ti"] * b["total_sqft"], 0.0)
+
+    gross = (b_year + o_year + p_year) * sqft * frac
+    total_credit = abate_credit + add_credit
+    base_components = b_year * sqft * frac
+    opex_components = o_year * sqft * frac
+
+    if mode.all_in_cash_flow:
+        net_cf = -gross + (abate_credit + ti_credit + (add_credit + move_ffe))
+    else:
+        net_cf = -(base_components + opex_components) + total_credit
+
+    # Commission is paid on rent for non-abated months
+    commission_rate = np.where(b["include_opex"], b_year + o_year, b_year)
+    commission_base = commission_rate * sqft * ((months - abate_mos) / 12) * valid
+
+    return {
+        "valid":           valid,
+        "sqft":            sqft,
+        "expanded":        b["expanded"],
+        "base_rent":       base_components,
+        "opex":            opex_components,
+        "parking":         p_year * sqft * frac,
+        "abatement":       abate_credit,
+        "ti_credit":       ti_credit,
+        "move_ffe":        move_ffe,
+        "add_credit":      add_credit,
+        "net_rent":        gross + move_ffe - total_credit,
+        "net_cf":          net_cf,
+        "commission_base": commission_base,
+    }
+
+
+def npv(rate, cash_flows):
+    """Net present value with the first cash flow undiscounted (``npf.npv`` convention)."""
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    return (cash_flows / (1 + rate) ** np.arange(cash_flows.shape[-1])).sum(axis=-1)
+
+
+def _rint(values):
+    return np.rint(values).astype(np.int64)
+
+
+def schedule_amounts(s):
+    """Round a computed schedule to the whole-dollar columns shown in the app."""
+    return {
+        "Base Rent":         _rint(s["base_rent"]),
+        "Opex":              _rint(s["opex"]),
+        "Parking Exp":       _rint(s["parking"]),
+        "Rent Abatement":    -_rint(s["abatement"]),
+        "Moving & FF&E":     _rint(s["move_ffe"]),
+        "Additional Credit": -_rint(s["add_credit"]),
+        "Net Rent":          _rint(np.abs(s["net_rent"])),
+        "Base Components":   _rint(s["base_rent"] + s["opex"]),
+    }
+
+
+def lease_metrics(b, s, amounts, mode=WEB):
+    """
+    Reduce stacked schedules to per-scenario lease metrics.
+
+    Returns:
+        dict: ``(n,)`` arrays of totals, NPV, effective rent and payback
+    """
+    total_sqft = b["total_sqft"][:, 0]
+    base = b["base"][:, 0]
+    ti_credit_full = b["ti"][:, 0] * total_sqft
+    add_credit_full = b["add_cred"][:, 0] * total_sqft
+
+    # Total rent (excluding parking) plus construction cost above the TI allowance
+    construction_balance = (b["construction"] - b["ti"])[:, 0]
+    total_rent = amounts["Base Components"].sum(axis=1) + np.where(
+        construction_balance > 0, construction_balance * total_sqft, 0)
+    net_rent = amounts["Net Rent"].sum(axis=1)
+    occupancy_cost = (-s["net_cf"]).sum(axis=1) + 0.0  # no "-0" totals
+
+    # payback in months
+    monthly_base = np.where(base > 0, base * total_sqft / 12, 0)
+    total_abate = b["abate_total"][:, 0]
+    payback_credit = ti_credit_full + add_credit_full if mode.all_in_cash_flow else ti_credit_full
+    avg_basis = occupancy_cost if mode.all_in_cash_flow else net_rent
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payback = np.where(monthly_base > 0, total_abate + payback_credit / monthly_base, np.nan)
+        # average effective rent — un-prorated full years basis
+        avg = np.where(total_sqft > 0, avg_basis / (b["periods"][:, 0] * total_sqft), 0)
+
+    commission_base = s["commission_base"].sum(axis=1)
+    commission_pct = b["commission"][:, 0]
+
+    return {
+        "total_rent":        total_rent,
+        "net_rent":          net_rent,
+        "occupancy_cost":    occupancy_cost,
+        "avg_eff_rent":      avg,
+        "payback_mos":       payback,
+        "npv":               np.abs(npv(b["disc"] / 100, s["net_cf"])),
+        "ti_allowance":      ti_credit_full,
+        "move_ffe":          b["move_ffe"][:, 0] * b["initial_sqft"][:, 0],
+        "construction":      b["construction"][:, 0] * total_sqft,
+        "add_credit":        add_credit_full,
+        "commission_base":   commission_base,
+        "commission_amount": commission_base * (commission_pct / 100),
+    }
+
+
+def _mdy(iso):
+    # "YYYY-MM-DD" -> "MM/DD/YYYY"
+    return f"{iso[5:7]}/{iso[8:10]}/{iso[:4]}"
+
+
+def _period_labels(x, periods):
+    i = np.arange(periods)
+    full_years = x["term_mos"] // 12
+    start = np.datetime64(x["start_date"], "D")
+    period_start = add_months(start, 12 * i)
+    period_end = np.where(
+        i < full_years,
+        add_months(period_start, 12),
+        add_months(start, x["term_mos"]),
+    ) - np.timedelta64(1, "D")
+    return [f"{_mdy(a)} – {_mdy(b)}" for a, b in zip(
+        np.datetime_as_string(period_start), np.datetime_as_string(period_end))]
+
+
+def schedule_frame(x, s, amounts, row=0):
+    """Build the annual rent schedule DataFrame shown in the app for one scenario."""
+    periods = int(s["valid"][row].sum())
+    sqft = np.where(s["expanded"][row, :periods], x["total_sqft"], x["initial_sqft"])
+
+    return pd.DataFrame({
+        "Year":   np.arange(1, periods + 1),
+        "Period": _period_labels(x, periods),
+        "SF":     sqft,
+        **{name: col[row, :periods] for name, col in amounts.items()},
+    })
+
+
+def classic_amounts(s):
+    """Round a computed schedule to the ``lease_analysis`` package's cash flow columns."""
+    return {
+        "Base Cost":      _rint(s["base_rent"]),
+        "Opex Cost":      _rint(s["opex"]),
+        "Parking Exp":    _rint(s["parking"]),
+        "Rent Abatement": -_rint(s["abatement"]),
+        "Net CF":         _rint(s["net_cf"]),
+    }
+
+
+def classic_frame(x, s, amounts=None, row=0):
+    """Build the ``lease_analysis`` package's annual cash flow DataFrame for one scenario."""
+    periods = int(s["valid"][row].sum())
+    if amounts is None:
+        amounts = classic_amounts(s)
+
+    return pd.DataFrame({
+        "Year":   np.arange(1, periods + 1),
+        "Period": _period_labels(x, periods),
+        **{name: col[row, :periods] for name, col in amounts.items()},
+    })
+
+
+def _payback(payback):
+    return None if np.isnan(payback) else float(payback)
+
+
+def lease_summary(x, m, row=0):
+    """Collect one scenario's metrics into the app's summary record."""
+    return Summary([
+        ("Option",            x["name"],                              TEXT),
+        ("Start Date",        x["start_date"],                        DATE),
+        ("Base Term (mos)",   x["base_term_mos"],                     TEXT),
+        ("Total Term (mos)",  x["term_mos"],                          TEXT),
+        ("Abatement Type",    "Inside Term" if x["inside_term"] else "Added to Term", TEXT),
+        ("Initial SF",        x["initial_sqft"],                      SQFT),
+        ("Size Change",       x["exp_sqft"] if x["exp_month"] > 0 else None, SQFT_CHANGE),
+        ("Total SF",          x["total_sqft"],                        SQFT),
+        ("Total Cost",        float(m["total_rent"][row]),            CURRENCY),
+        ("Avg Eff. Rent",     float(m["avg_eff_rent"][row]),          RENT_PSF),
+        ("Payback",           _payback(m["payback_mos"][row]),        MONTHS),
+        (f"NPV ({x['disc']:.2f}%):", float(m["npv"][row]),           CURRENCY),
+        ("TI Allowance",      float(m["ti_allowance"][row]),          CURRENCY),
+        ("Moving & FF&E",     float(m["move_ffe"][row]),              CURRENCY),
+        ("Construction Cost", float(m["construction"][row]),          CURRENCY),
+        ("Additional Credit", float(m["add_credit"][row]),            CURRENCY),
+        ("Commission Amount", float(m["commission_amount"][row]),     CURRENCY_CENTS),
+        ("Commission Base",   float(m["commission_base"][row]),       CURRENCY_CENTS),
+        ("Commission Rate",   x["commission"],                        PERCENT),
+        ("Include OpEx",      x["include_opex"],                      TEXT),
+    ])
+
+
+def classic_summary(x, m, row=0):
+    """Collect one scenario's metrics into the ``lease_analysis`` package's summary record."""
+    return Summary([
+        ("Option",            x["name"],                              TEXT),
+        ("Start Date",        x["start_date"],                        DATE),
+        ("Term (mos)",        x["term_mos"],                          TEXT),
+        ("RSF",               x["initial_sqft"],                      TEXT),
+        ("Total Cost",        float(m["occupancy_cost"][row]),        CURRENCY),
+        ("Avg Eff. Rent",     float(m["avg_eff_rent"][row]),          RENT_PSF),
+        ("Payback",           _payback(m["payback_mos"][row]),        MONTHS),
+        (f"NPV ({x['disc']:.2f}%):", float(m["npv"][row]),           CURRENCY),
+        ("TI Allowance",      float(m["ti_allowance"][row]),          CURRENCY),
+        ("Moving Exp",        float(m["move_ffe"][row]),              CURRENCY),
+        ("Construction Cost", float(m["construction"][row]),          CURRENCY),
+        ("Additional Credit", float(m["add_credit"][row]),            CURRENCY),
+    ])
+
+
+@memoize
+def analyze_lease(p, mode=WEB):
+    """
+    Analyze a lease scenario and return summary metrics and the rent schedule.
+
+    Args:
+        p (dict): Lease parameters as collected by the lease input form
+        mode (LeaseMode): ``WEB`` for the lease web app, ``CLASSIC`` for the
+            ``lease_analysis`` package (its own summary keys and columns)
+
+    Returns:
+        tuple: (Summary, schedule_df); summary values are raw numbers, see
+            ``Summary.display`` for the formatted strings
+    """
+    x = lease_inputs(p, mode)
+    b = stack_inputs([x])
+    s = lease_schedule(b, mode)
+    amounts = schedule_amounts(s)
+    m = lease_metrics(b, s, amounts, mode)
+    if mode.name == CLASSIC.name:
+        return classic_summary(x, m), classic_frame(x, s)
+    return lease_summary(x, m), schedule_frame(x, s, amounts)
+
+
+def analyze_leases(params_list, mode=WEB):
+    """
+    Analyze many lease scenarios in one broadcasted pass.
+
+    Every scenario is stacked into scenario x period arrays, so cash flows,
+    NPVs and effective rents for the whole batch are computed together
+    rather than one ``analyze_lease`` call at a time.
+
+    Args:
+        params_list (list): Lease parameter dicts, as for ``analyze_lease``
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+
+    Returns:
+        pd.DataFrame: One row per scenario with numeric (unformatted) metrics
+    """
+    xs = [lease_inputs(p, mode) for p in params_list]
+    b = stack_inputs(xs)
+    s = lease_schedule(b, mode)
+    m = lease_metrics(b, s, schedule_amounts(s), mode)
+
+    return pd.DataFrame({
+        "Option":            [x["name"] for x in xs],
+        "Lease Type":        [GROSS if x["gross"] else NNN for x in xs],
+        "Base Term (mos)":   [x["base_term_mos"] for x in xs],
+        "Total Term (mos)":  b["term_mos"][:, 0],
+        "Total SF":          b["total_sqft"][:, 0],
+        "Total Cost":        m["occupancy_cost"] if mode.all_in_cash_flow else m["total_rent"],
+        "Net Rent":          m["net_rent"],
+        "Avg Eff. Rent":     m["avg_eff_rent"],
+        "Payback (mos)":     m["payback_mos"],
+        "Discount Rate":     b["disc"][:, 0],
+        "NPV":               m["npv"],
+        "TI Allowance":      m["ti_allowance"],
+        "Moving & FF&E":     m["move_ffe"],
+        "Construction Cost": m["construction"],
+        "Additional Credit": m["add_credit"],
+        "Commission Base":   m["commission_base"],
+        "Commission Amount": m["commission_amount"],
+    })
+
+
+def row_inputs(b, row):
+    """The normalized inputs of one stacked scenario, as the summary and frame builders read them."""
+    x = {key: b[key][row, 0].item() for key in _COLUMN_INPUTS}
+    x["name"] = b["name"][row, 0]
+    x["start_date"] = b["start_date"][row, 0].item()
+    return x
+
+
+def analyze_stacked(b, mode=WEB):
+    """
+    Summaries and schedules for every scenario in a stacked batch.
+
+    The batch counterpart of ``analyze_lease``: one vectorized pass over the
+    stacked arrays, then the same per-scenario records. Works on any row
+    slice of ``stack_inputs`` output, which is how batches are split across
+    worker processes.
+
+    Args:
+        b (dict): Stacked inputs from ``stack_inputs``
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+
+    Returns:
+        list: (Summary, schedule_df) per scenario, in row order
+    """
+    s = lease_schedule(b, mode)
+    amounts = schedule_amounts(s)
+    m = lease_metrics(b, s, amounts, mode)
+    classic = mode.name == CLASSIC.name
+    if classic:
+        amounts = classic_amounts(s)
+
+    results = []
+    for row in range(len(b["term_mos"])):
+        x = row_inputs(b, row)
+        if classic:
+            results.append((classic_summary(x, m, row), classic_frame(x, s, amounts, row)))
+        else:
+            results.append((lease_summary(x, m, row), schedule_frame(x, s, amounts, row)))
+    return results
+
+
+def advisory_inputs(p):
+    """Convert the Client Advisory Tool's lease form into engine inputs (``ADVISORY`` mode)."""
+    advanced = p["show_advanced"]
+    return lease_inputs({
+        "term_mos":      p["term_mos"],
+        "sqft":          p["sqft"],
+        "sqft_schedule": p["custom_sqft"] if advanced else [],
+        "base":          p["base_rent"],
+        "inc":           p["rent_escalation"],
+        "rent_incs":     p["custom_escalations"] if advanced else [],
+        "lease_type":    GROSS if p["use_base_year_stop"] else NNN,
+        "opex":          p["opex"],
+        "opexinc":       p["opex_escalation"],
+        "park_cost":     0.0,
+        "park_spaces":   0,
+        "park_ratio":    p["parking_ratio"],
+        "park_detail":   {"res_spaces": p["num_reserved_spaces"],
+                          "res_cost":   p["reserved_cost_monthly"],
+                          "unres_cost": p["unreserved_cost_monthly"]},
+        "free":          p["free_rent_months"],
+        "custom_abate":  False,
+        "ti":            p["ti_allowance"],
+        "add_cred":      0.0,
+        "move_exp":      p["moving_expense"],
+        "construction":  p["construction_costs"],
+        "disc":          p["discount_rate"],
+    }, ADVISORY)
+
+
+def advisory_npvs(p, b, s):
+    """
+    The advisory tool's NPV and effective rent for every stacked scenario.
+
+    Args:
+        p (dict): Advisory lease form (term, SF, one-time costs and parking switches)
+        b (dict): Stacked inputs from ``stack_inputs``
+        s (dict): Schedule from ``lease_schedule(b, ADVISORY)``
+
+    Returns:
+        dict: ``(n,)`` arrays (``npv_all_in``, ``avg_eff_rent``, ...) plus the
+            scalar ``initial_outlay``
+    """
+    term_mos = p["term_mos"]
+    months = b["months"] * s["valid"]
+
+    # Weighted Avg SF
+    if p["show_advanced"] and p["custom_sqft"] and term_mos > 0:
+        weighted_avg_sqft = (s["sqft"] * months).sum(axis=1) / term_mos
+    else:
+        weighted_avg_sqft = np.full(len(months), float(p["sqft"]))
+
+    initial_outlay = (p["ti_allowance"] - p["construction_costs"] - p["moving_expense"]) * p["sqft"]
+    rate = b["disc"] / 100
+    npv_rent = npv(rate, -(s["base_rent"] - s["abatement"]))
+    npv_opex = npv(rate, -s["opex"])
+    npv_parking = npv(rate, -s["parking"])
+
+    npv_all_in = initial_outlay + npv_rent + npv_opex
+    if p["include_parking_in_npv"]:
+        npv_all_in = npv_all_in + npv_parking
+
+    # Effective Rent Calculation
+    total_cost_eff_rent = -(initial_outlay + npv_rent + npv_opex)
+    if p["include_parking_in_eff_rent"]:
+        total_cost_eff_rent = total_cost_eff_rent - npv_parking
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_eff_rent = np.where((term_mos > 0) & (weighted_avg_sqft > 0),
+                                total_cost_eff_rent / (term_mos / 12) / weighted_avg_sqft, 0)
+
+    return {
+        "npv_all_in": npv_all_in, "avg_eff_rent": avg_eff_rent,
+        "initial_outlay": initial_outlay, "npv_rent": npv_rent, "npv_opex": npv_opex,
+        "npv_parking": npv_parking, "total_cost_eff_rent": total_cost_eff_rent,
+        "weighted_avg_sqft": weighted_avg_sqft,
+    }
+
+
+def advisory_lease_metrics(p):
+    """
+    Lease metrics for the Client Advisory Tool.
+
+    Args:
+        p (dict): Lease inputs from the advisory tool's lease form (``base_rent``,
+            ``rent_escalation``, ``free_rent_months``, ``parking_ratio``, ...)
+
+    Returns:
+        dict: NPV breakdown, effective rent and the detailed annual cost rows
+    """
+    x = advisory_inputs(p)
+    b = stack_inputs([x])
+    s = lease_schedule(b, ADVISORY)
+    m = advisory_npvs(p, b, s)
+
+    periods = int(s["valid"][0].sum())
+    months = b["months"][0, :periods]
+    sqft = s["sqft"][0, :periods]
+    rent = (s["base_rent"] - s["abatement"])[0, :periods]
+    opex = s["opex"][0, :periods]
+    parking = s["parking"][0, :periods]
+
+    # One-time costs are shown in year 1 against that year's SF
+    first_sqft = sqft[0] if periods else p["sqft"]
+    detailed_costs = [{
+        "Year":                   f"Year {year + 1} ({months[year]} mos)",
+        "Rent":                   float(rent[year]),
+        "NNN Operating Expenses": 0.0 if x["gross"] else float(opex[year]),
+        "Opex Pass-Throughs":     float(opex[year]) if x["gross"] else 0.0,
+        "Parking Costs":          float(parking[year]),
+        "TI Allowance":           p["ti_allowance"] * first_sqft if year == 0 else 0,
+        "Moving Expense":         -p["moving_expense"] * first_sqft if year == 0 else 0,
+        "Construction Costs":     -p["construction_costs"] * first_sqft if year == 0 else 0,
+        "Total Annual Cost":      float(rent[year] + opex[year] + parking[year]),
+    } for year in range(periods)]
+
+    return {
+        "npv_all_in": float(m["npv_all_in"][0]), "avg_eff_rent": float(m["avg_eff_rent"][0]),
+        "detailed_costs": detailed_costs, "initial_outlay": m["initial_outlay"],
+        "npv_rent": float(m["npv_rent"][0]), "npv_opex": float(m["npv_opex"][0]),
+        "npv_parking": float(m["npv_parking"][0]),
+        "total_cost_eff_rent": float(m["total_cost_eff_rent"][0]),
+        "term_years": p["term_mos"] / 12, "weighted_avg_sqft": float(m["weighted_avg_sqft"][0]),
+    }
@@ -0,0 +1,181 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from lease_analysis.engine.lease import (
+    ADVISORY, advisory_inputs, advisory_npvs, lease_schedule, npv, stack_inputs,
+)
+from lease_analysis.engine.purchase import advisory_cash_flows, advisory_returns
+from lease_analysis.engine.returns import irr
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+DEFAULT_PATHS = 100_000
+# Paths per chunk; per-period work arrays are chunk x periods
+DEFAULT_CHUNK = 10_000
+
+
+class Distribution(NamedTuple):
+    """
+    A sampled input, in the same units as the form field (usually %).
+
+    Use the constructors: ``Distribution.fixed(3.0)``, ``.normal(3.0, 1.0)``,
+    ``.uniform(2.0, 4.0)`` or ``.triangular(2.0, 3.0, 5.0)``.
+    """
+    kind: str
+    a: float
+    b: float = 0.0
+    c: float = 0.0
+
+    @classmethod
+    def fixed(cls, value):
+        return cls("fixed", value)
+
+    @classmethod
+    def normal(cls, mean, sd):
+        return cls("normal", mean, sd)
+
+    @classmethod
+    def uniform(cls, low, high):
+        return cls("uniform", low, high)
+
+    @classmethod
+    def triangular(cls, low, mode, high):
+        return cls("triangular", low, mode, high)
+
+    def sample(self, rng, n):
+        if self.kind == "fixed":
+            return np.full(n, float(self.a))
+        if self.kind == "normal":
+            return rng.normal(self.a, self.b, n)
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b, n)
+        if self.kind == "triangular":
+            return rng.triangular(self.a, self.b, self.c, n)
+        raise ValueError(f"unknown distribution {self.kind!r}")
+
+
+class MonteCarloResult(NamedTuple):
+    """
+    Simulated outcome distributions.
+
+    Attributes:
+        kind: "lease" or "purchase"
+        paths: Number of simulated paths
+        bands: DataFrame of percentiles (``P5`` ... ``P95``) and the mean,
+            one row per metric
+        samples: Metric name -> ``(paths,)`` array of per-path outcomes
+        failed: Paths whose metrics could not be computed (e.g. no IRR)
+    """
+    kind: str
+    paths: int
+    bands: pd.DataFrame
+    samples: dict
+    failed: int
+
+
+def _bands(samples):
+    rows = {}
+    for name, values in samples.items():
+        finite = values[np.isfinite(values)]
+        if len(finite):
+            pct = np.percentile(finite, PERCENTILES)
+            rows[name] = {**{f"P{p}": v for p, v in zip(PERCENTILES, pct)}, "Mean": finite.mean()}
+        else:
+            rows[name] = {**{f"P{p}": np.nan for p in PERCENTILES}, "Mean": np.nan}
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def _chunks(paths, chunk_size):
+    if paths < 1:
+        raise ValueError("paths must be at least 1")
+    for start in range(0, paths, chunk_size):
+        yield start, min(chunk_size, paths - start)
+
+
+def simulate_lease(p, opex_growth=None, escalation=None, paths=DEFAULT_PATHS,
+                   chunk_size=DEFAULT_CHUNK, seed=None):
+    """
+    Monte Carlo of the advisory lease NPV (all-in) and effective rent.
+
+    Sampled OPEX growth and rent escalation replace the form's flat rates for
+    the whole term (custom per-year escalations included); everything else
+    comes from ``p``, as for ``lease_engine.advisory_lease_metrics``.
+
+    Args:
+        p (dict): Advisory lease form
+        opex_growth (Distribution): Annual OPEX escalation, %; ``None`` keeps the form value
+        escalation (Distribution): Annual rent escalation, %; ``None`` keeps the form value
+        paths (int): Simulated paths
+        chunk_size (int): Paths evaluated together; bounds memory use
+        seed (int): Random seed for reproducible runs
+
+    Returns:
+        MonteCarloResult: Bands for ``npv_all_in`` and ``avg_eff_rent``
+    """
+    rng = np.random.default_rng(seed)
+    one = stack_inputs([advisory_inputs(p)])
+    width = one["inc"].shape[1]
+    samples = {"npv_all_in": np.empty(paths), "avg_eff_rent": np.empty(paths)}
+
+    for start, n in _chunks(paths, chunk_size):
+        b = {key: np.repeat(value, n, axis=0) for key, value in one.items()}
+        if escalation is not None:
+            b["inc"] = np.repeat(escalation.sample(rng, n)[:, None], width, axis=1)
+        if opex_growth is not None:
+            b["opexinc"] = opex_growth.sample(rng, n)[:, None]
+        m = advisory_npvs(p, b, lease_schedule(b, ADVISORY))
+        samples["npv_all_in"][start:start + n] = m["npv_all_in"]
+        samples["avg_eff_rent"][start:start + n] = m["avg_eff_rent"]
+
+    failed = int((~np.isfinite(samples["npv_all_in"])).sum())
+    return MonteCarloResult("lease", paths, _bands(samples), samples, failed)
+
+
+def simulate_purchase(p, appreciation=None, exit_cap_rate=None, interest_rate=None,
+                      discount_rate=8.0, paths=DEFAULT_PATHS, chunk_size=DEFAULT_CHUNK, seed=None):
+    """
+    Monte Carlo of the advisory purchase NPV and levered IRR.
+
+    Args:
+        p (dict): Advisory purchase form, as for ``calculate_purchase_metrics``
+        appreciation (Distribution): Annual NOI growth (which drives value), %
+        exit_cap_rate (Distribution): Exit cap rate, %
+        interest_rate (Distribution): Loan interest rate, %
+        discount_rate (float): Rate for the equity NPV, %
+        paths (int): Simulated paths
+        chunk_size (int): Paths evaluated together; bounds memory use
+        seed (int): Random seed for reproducible runs
+
+    Returns:
+        MonteCarloResult: Bands for ``npv``, ``irr``, ``cash_on_cash`` and ``equity_multiple``
+    """
+    rng = np.random.default_rng(seed)
+    names = ("npv", "irr", "cash_on_cash", "equity_multiple")
+    samples = {name: np.empty(paths) for name in names}
+
+    def draw(dist, n):
+        return None if dist is None else dist.sample(rng, n)
+
+    # Paths scatter around the base case, so its IRR warm-starts every solve
+    base_flows, _ = advisory_cash_flows(p)
+    guess = irr(base_flows[0])
+    if not np.isfinite(guess):
+        guess = 0.1
+
+    for start, n in _chunks(paths, chunk_size):
+        growth = draw(appreciation, n)
+        cap = draw(exit_cap_rate, n)
+        rate = draw(interest_rate, n)
+        # Sampled cap rates at or below zero give no sale price; those paths count as failed
+        with np.errstate(divide="ignore", invalid="ignore"):
+            flows, equity = advisory_cash_flows(p, interest_rate=rate, noi_growth=growth, exit_cap_rate=cap)
+            if len(flows) == 1 and n > 1:
+                flows = np.repeat(flows, n, axis=0)
+            metrics = advisory_returns(flows, equity, guess=guess)
+            metrics["npv"] = npv(discount_rate / 100, flows)
+        for name in names:
+            samples[name][start:start + n] = metrics[name]
+
+    failed = int((~np.isfinite(samples["irr"])).sum())
+    return MonteCarloResult("purchase", paths, _bands(samples), samples, failed)
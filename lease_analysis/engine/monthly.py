@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+from lease_analysis.engine.lease import (
+    WEB, add_months, annual_rates, lease_inputs, lease_schedule, npv, stack_inputs,
+)
+
+_FLOWS = ("base_rent", "opex", "parking", "abatement", "ti_credit", "move_ffe",
+          "add_credit", "net_rent", "net_cf")
+
+
+def monthly_schedule(b, mode=WEB):
+    """
+    Monthly lease cash flows on actual calendar dates for every stacked scenario.
+
+    Rates escalate on each lease anniversary exactly as in ``lease_schedule``,
+    but every month is its own column: free months are the first months of
+    the year they are granted in (a longer grant runs on into the next year),
+    and expansion SF is billed from ``exp_month`` rather than for the whole
+    year it lands in. Rent is paid in advance, so month ``k`` falls on the
+    commencement date plus ``k`` months; scenarios without a start date fall
+    back to twelve equal steps a year.
+
+    Args:
+        b (dict): Stacked inputs from ``stack_inputs``
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+
+    Returns:
+        dict: ``(n, months)`` arrays of the ``lease_schedule`` cash flows plus
+            ``date`` (datetime64[D]) and ``years`` (actual days / 365 since
+            commencement), zeroed past the end of each scenario's term
+    """
+    term = b["term_mos"]
+    width = int(term.max()) if len(term) else 0
+    k = np.arange(width)[None, :]
+    year = k[0] // 12
+    valid = k < term
+    b_year, o_year, p_year = (np.broadcast_to(rate, b["sqft"].shape) for rate in annual_rates(b, mode))
+
+    # The annual schedule bills expansion SF for the whole year; here it starts in exp_month
+    year_sqft = b["sqft"][:, year]
+    before = (b["exp_month"] > 0) & (k + 1 < b["exp_month"]) & (year_sqft == b["total_sqft"])
+    sqft = np.where(before, b["initial_sqft"], year_sqft) * valid
+
+    base_rent = b_year[:, year] / 12 * sqft
+    opex = o_year[:, year] / 12 * sqft
+    # Spaces taken by ratio follow the month's SF; a fixed count of spaces costs the same all year
+    parking = p_year[:, year] / 12 * np.where(b["park_by_ratio"], sqft, year_sqft * valid)
+
+    abate_mos = b["abate_mos"] * b["valid"]
+    if mode.cap_abatement:
+        abate_mos = np.minimum(abate_mos, b["months"] * b["valid"])
+    abate_rate = np.where(b["base_only"], b["base"], b["base"] + o_year)
+    abated = np.zeros(sqft.shape)
+    for y in np.flatnonzero(abate_mos.any(axis=0)):
+        offset = k - 12 * y
+        share = np.where(offset >= 0, np.clip(abate_mos[:, y:y + 1] - offset, 0, 1), 0.0)
+        abated += share * abate_rate[:, y:y + 1] / 12
+    abatement = abated * sqft
+
+    # One-time items land in the first month
+    first = k == 0
+    move_ffe = np.where(first, b["move_ffe"] * b["initial_sqft"], 0.0)
+    add_credit = np.where(first, b["add_cred"] * b["total_sqft"], 0.0)
+    ti_credit = np.where(first, b["ti"] * b["total_sqft"], 0.0)
+
+    gross = base_rent + opex + parking
+    if mode.all_in_cash_flow:
+        net_cf = -gross + (abatement + ti_credit + (add_credit + move_ffe))
+    else:
+        net_cf = -(base_rent + opex) + abatement + add_credit
+
+    start = b["start_date"]
+    dates = add_months(start, k)
+    days = (dates - start).astype(np.int64)
+    years = np.where(np.isnat(start), k / 12, days / 365.0)
+
+    return {
+        "date":       dates,
+        "years":      years,
+        "valid":      valid,
+        "sqft":       sqft,
+        "base_rent":  base_rent,
+        "opex":       opex,
+        "parking":    parking,
+        "abatement":  abatement,
+        "ti_credit":  ti_credit,
+        "move_ffe":   move_ffe,
+        "add_credit": add_credit,
+        "net_rent":   gross + move_ffe - (abatement + add_credit),
+        "net_cf":     net_cf,
+    }
+
+
+def monthly_npv(b, s):
+    """
+    Present value of each scenario's monthly net cash flow (XNPV at the scenario's rate).
+
+    Args:
+        b (dict): Stacked inputs from ``stack_inputs``
+        s (dict): Monthly schedule from ``monthly_schedule``
+
+    Returns:
+        np.ndarray: ``(n,)`` signed present values, discounted by actual days / 365
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        return (s["net_cf"] * (1 + b["disc"] / 100) ** -s["years"]).sum(axis=1)
+
+
+def annual_totals(s):
+    """
+    Roll a monthly schedule up into lease years (months 1-12, 13-24, ...).
+
+    Returns:
+        dict: ``(n, years)`` sums of every cash flow column
+    """
+    n, months = s["net_cf"].shape
+    years = -(-months // 12)
+    pad = ((0, 0), (0, years * 12 - months))
+    return {name: np.pad(s[name], pad).reshape(n, years, 12).sum(axis=2) for name in _FLOWS}
+
+
+def analyze_monthly(params_list, mode=WEB):
+    """
+    Compare annual-bucket and date-based NPVs for many lease scenarios.
+
+    Args:
+        params_list (list): Lease parameter dicts, as for ``analyze_lease``
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+
+    Returns:
+        pd.DataFrame: One row per scenario with the total occupancy cost, the
+            annual NPV from ``analyze_leases`` and the monthly XNPV
+    """
+    xs = [lease_inputs(p, mode) for p in params_list]
+    b = stack_inputs(xs)
+    s = monthly_schedule(b, mode)
+
+    return pd.DataFrame({
+        "Option":           [x["name"] for x in xs],
+        "Start Date":       b["start_date"][:, 0],
+        "Total Term (mos)": b["term_mos"][:, 0],
+        "Occupancy Cost":   (-s["net_cf"]).sum(axis=1) + 0.0,
+        "Discount Rate":    b["disc"][:, 0],
+        "NPV (Annual)":     np.abs(npv(b["disc"] / 100, lease_schedule(b, mode)["net_cf"])),
+        "NPV (Monthly)":    np.abs(monthly_npv(b, s)),
+    })
@@ -0,0 +1,373 @@
+from collections.abc import Mapping
+from datetime import date, datetime
+
+import numpy as np
+
+from lease_analysis.engine.cache import param_key
+from lease_analysis.engine.lease import GROSS, NNN
+
+REQUIRED = object()
+
+
+def _int(value):
+    if isinstance(value, bool):
+        raise ValueError("expected a whole number")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError("expected a whole number")
+        return int(value)
+    return int(value)
+
+
+def _float(value):
+    if isinstance(value, bool):
+        raise ValueError("expected a number")
+    return float(value)
+
+
+def _bool(value):
+    if not isinstance(value, (bool, np.bool_)):
+        raise ValueError("expected True or False")
+    return bool(value)
+
+
+def _str(value):
+    return str(value)
+
+
+def _date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    raise ValueError("expected a date")
+
+
+def _optional_date(value):
+    return None if value is None else _date(value)
+
+
+def _floats(value):
+    return tuple(_float(v) for v in (value or ()))
+
+
+def _ints(value):
+    return tuple(_int(v) for v in (value or ()))
+
+
+def _lease_type(value):
+    if value not in (NNN, GROSS):
+        raise ValueError(f"expected {NNN!r} or {GROSS!r}")
+    return value
+
+
+def _restore(cls, values):
+    obj = object.__new__(cls)
+    for name, value in zip(cls._NAMES, values):
+        object.__setattr__(obj, name, value)
+    object.__setattr__(obj, "_hash", None)
+    object.__setattr__(obj, "_key", None)
+    return obj
+
+
+class InvalidParams(ValueError):
+    """Raised for parameters that fail validation; ``errors`` has one message per bad field."""
+
+    def __init__(self, cls_name, errors):
+        super().__init__(f"Invalid {cls_name}: {'; '.join(errors)}")
+        self.errors = errors
+
+
+class FrozenParams(Mapping):
+    """
+    Immutable, slotted scenario parameters validated once at construction.
+
+    Subclasses declare ``_FIELDS`` as ``(name, converter, default, minimum)``.
+    Instances are read-only mappings, so calculators written against
+    ``p["..."]`` / ``p.get(...)`` accept them unchanged; ``ALIASES`` lets older
+    key names resolve to the canonical field.
+    """
+
+    __slots__ = ("_hash", "_key")
+    _FIELDS = ()
+    _NAMES = ()
+    ALIASES = {}
+    ARRAY_FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._NAMES = tuple(field[0] for field in cls._FIELDS)
+
+    def __init__(self, **kwargs):
+        unknown = set(kwargs) - set(self._NAMES)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} got unknown parameters: {', '.join(sorted(unknown))}")
+
+        errors = []
+        for name, convert, default, minimum in self._FIELDS:
+            value = kwargs.get(name, default)
+            if value is REQUIRED:
+                errors.append(f"{name}: required")
+                continue
+            try:
+                value = convert(value)
+            except (TypeError, ValueError) as e:
+                errors.append(f"{name}: {e} (got {value!r})")
+                continue
+            if minimum is not None and value is not None and value < minimum:
+                errors.append(f"{name}: must be at least {minimum} (got {value!r})")
+            object.__setattr__(self, name, value)
+        if not errors:
+            errors = self._check()
+        if errors:
+            raise InvalidParams(type(self).__name__, errors)
+        object.__setattr__(self, "_hash", None)
+        object.__setattr__(self, "_key", None)
+
+    def _check(self):
+        """Cross-field validation; returns a list of error messages."""
+        return []
+
+    @classmethod
+    def from_dict(cls, p):
+        """Build from a parameter dict, resolving aliases and ignoring UI-only keys."""
+        kwargs = {}
+        for key, value in p.items():
+            name = cls.ALIASES.get(key, key)
+            if name in cls._NAMES and name not in kwargs:
+                kwargs[name] = value
+        return cls(**kwargs)
+
+    def to_dict(self):
+        """Plain dict of canonical parameters (tuples become lists)."""
+        return {name: list(v) if isinstance(v, tuple) else
+                v.to_dict() if isinstance(v, FrozenParams) else v
+                for name, v in zip(self._NAMES, self._values())}
+
+    def replace(self, **changes):
+        """Copy with some fields changed (validated like a new instance)."""
+        return type(self)(**{**dict(zip(self._NAMES, self._values())), **changes})
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self._NAMES)
+
+    def as_array(self):
+        """The numeric fields (``ARRAY_FIELDS``) as a float64 vector."""
+        return np.array([getattr(self, name) for name in self.ARRAY_FIELDS], dtype=float)
+
+    @classmethod
+    def stack(cls, items):
+        """Stack many scenarios' ``as_array`` vectors into an ``(n, fields)`` matrix."""
+        rows = [[getattr(item, name) for name in cls.ARRAY_FIELDS] for item in items]
+        return np.array(rows, dtype=float).reshape(len(rows), len(cls.ARRAY_FIELDS))
+
+    @classmethod
+    def to_columns(cls, items):
+        """
+        Column batch of many scenarios (see ``engine.executor``): the ``stack``
+        matrix under ``"values"`` plus one object array per non-array field.
+        """
+        columns = {"values": cls.stack(items)}
+        for name in cls._NAMES:
+            if name not in cls.ARRAY_FIELDS:
+                column = np.empty(len(items), dtype=object)
+                for row, item in enumerate(items):
+                    column[row] = getattr(item, name)
+                columns[name] = column
+        return columns
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Rebuild the scenarios of a ``to_columns`` batch, or of a row slice of one."""
+        others = [name for name in cls._NAMES if name not in cls.ARRAY_FIELDS]
+        return [cls(**dict(zip(cls.ARRAY_FIELDS, values)), **{name: columns[name][row] for name in others})
+                for row, values in enumerate(columns["values"].tolist())]
+
+    def cache_key(self):
+        """Stable digest of the parameters, computed once."""
+        if self._key is None:
+            object.__setattr__(self, "_key", param_key(type(self).__name__, self.to_dict()))
+        return self._key
+
+    def __getitem__(self, key):
+        name = self.ALIASES.get(key, key)
+        if name not in self._NAMES:
+            raise KeyError(key)
+        return getattr(self, name)
+
+    def __iter__(self):
+        return iter(self._NAMES)
+
+    def __len__(self):
+        return len(self._NAMES)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable; use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((type(self).__name__, self._values())))
+        return self._hash
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __reduce__(self):
+        return _restore, (type(self), self._values())
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._NAMES)
+        return f"{type(self).__name__}({fields})"
+
+
+class ParkingParams(FrozenParams):
+    """Reserved/unreserved parking detail for a lease."""
+
+    __slots__ = ("unres_spaces", "unres_cost", "res_spaces", "res_cost", "park_inc")
+    _FIELDS = (
+        ("unres_spaces", _int,   0,   0),
+        ("unres_cost",   _float, 0.0, 0),
+        ("res_spaces",   _int,   0,   0),
+        ("res_cost",     _float, 0.0, 0),
+        ("park_inc",     _float, 0.0, None),
+    )
+
+
+def _parking(value):
+    if value is None or isinstance(value, ParkingParams):
+        return value
+    return ParkingParams.from_dict(value)
+
+
+class LeaseParams(FrozenParams):
+    """Lease scenario parameters in the engine's schema (see ``lease_engine.analyze_lease``)."""
+
+    __slots__ = (
+        "name", "start_date", "term_mos", "sqft", "base", "inc", "rent_incs",
+        "lease_type", "opex_base", "opex", "opexinc", "park_cost", "park_spaces",
+        "park_detail", "free", "custom_abate", "abates", "inside_term",
+        "base_only_abate", "exp_month", "exp_sqft", "ti", "add_cred", "move_exp",
+        "ffe", "construction", "disc", "commission", "include_opex",
+    )
+    _FIELDS = (
+        ("name",            _str,        "Option", None),
+        ("start_date",      _date,       REQUIRED, None),
+        ("term_mos",        _int,        REQUIRED, 1),
+        ("sqft",            _int,        REQUIRED, 1),
+        ("base",            _float,      REQUIRED, 0),
+        ("inc",             _float,      0.0,      None),
+        ("rent_incs",       _floats,     (),       None),
+        ("lease_type",      _lease_type, NNN,      None),
+        ("opex_base",       _float,      0.0,      0),
+        ("opex",            _float,      0.0,      0),
+        ("opexinc",         _float,      0.0,      None),
+        ("park_cost",       _float,      0.0,      0),
+        ("park_spaces",     _int,        0,        0),
+        ("park_detail",     _parking,    None,     None),
+        ("free",            _int,        0,        0),
+        ("custom_abate",    _bool,       False,    None),
+        ("abates",          _ints,       (),       None),
+        ("inside_term",     _bool,       False,    None),
+        ("base_only_abate", _bool,       False,    None),
+        ("exp_month",       _int,        0,        0),
+        ("exp_sqft",        _int,        0,        None),
+        ("ti",              _float,      0.0,      0),
+        ("add_cred",        _float,      0.0,      0),
+        ("move_exp",        _float,      0.0,      0),
+        ("ffe",             _float,      0.0,      0),
+        ("construction",    _float,      0.0,      0),
+        ("disc",            _float,      0.0,      0),
+        ("commission",      _float,      0.0,      0),
+        ("include_opex",    _bool,       False,    None),
+    )
+    ALIASES = {"move": "move_exp"}
+    ARRAY_FIELDS = (
+        "term_mos", "sqft", "base", "inc", "opex_base", "opex", "opexinc",
+        "park_cost", "park_spaces", "free", "exp_month", "exp_sqft", "ti",
+        "add_cred", "move_exp", "ffe", "construction", "disc", "commission",
+    )
+
+    @classmethod
+    def from_dict(cls, p):
+        # The original lease form used "term" in years; everything since uses months
+        if "term_mos" not in p and "term" in p:
+            p = {**p, "term_mos": p["term"] * 12}
+        # The web form sends inc=None when custom increases are entered
+        if p.get("inc", 0.0) is None:
+            p = {**p, "inc": 0.0}
+        return super().from_dict(p)
+
+    def _check(self):
+        errors = []
+        if self.exp_month > 0 and self.sqft + self.exp_sqft < 1:
+            errors.append("exp_sqft: size change would leave no space")
+        if self.custom_abate and not self.abates:
+            errors.append("abates: required when custom_abate is set")
+        return errors
+
+
+class PurchaseParams(FrozenParams):
+    """
+    Purchase scenario parameters.
+
+    Field names follow ``utils.purchase_calculator``; the web app's names
+    (``purchase_price``, ``mortgage_rate``, ...) resolve through ``ALIASES``,
+    so one instance feeds either calculator.
+    """
+
+    __slots__ = (
+        "name", "property_value", "down_payment_pct", "loan_term_years",
+        "interest_rate", "purchase_date", "holding_period_years",
+        "annual_appreciation", "annual_rental_income", "annual_rental_increase",
+        "annual_property_tax", "annual_insurance", "annual_maintenance",
+        "annual_hoa", "closing_costs_pct", "property_tax_rate", "insurance_rate",
+        "maintenance_rate", "discount_rate",
+    )
+    _FIELDS = (
+        ("name",                   _str,           "Option", None),
+        ("property_value",         _float,         REQUIRED, 0),
+        ("down_payment_pct",       _float,         REQUIRED, 0),
+        ("loan_term_years",        _int,           REQUIRED, 0),
+        ("interest_rate",          _float,         REQUIRED, 0),
+        ("purchase_date",          _optional_date, None,     None),
+        ("holding_period_years",   _int,           REQUIRED, 1),
+        ("annual_appreciation",    _float,         0.0,      None),
+        ("annual_rental_income",   _float,         0.0,      0),
+        ("annual_rental_increase", _float,         0.0,      None),
+        ("annual_property_tax",    _float,         0.0,      0),
+        ("annual_insurance",       _float,         0.0,      0),
+        ("annual_maintenance",     _float,         0.0,      0),
+        ("annual_hoa",             _float,         0.0,      0),
+        ("closing_costs_pct",      _float,         3.0,      0),
+        # Web app costs, as % of property value per year
+        ("property_tax_rate",      _float,         0.0,      0),
+        ("insurance_rate",         _float,         0.0,      0),
+        ("maintenance_rate",       _float,         0.0,      0),
+        ("discount_rate",          _float,         REQUIRED, 0),
+    )
+    ALIASES = {
+        "purchase_price":    "property_value",
+        "mortgage_rate":     "interest_rate",
+        "mortgage_term":     "loan_term_years",
+        "analysis_period":   "holding_period_years",
+        "appreciation_rate": "annual_appreciation",
+    }
+    ARRAY_FIELDS = (
+        "property_value", "down_payment_pct", "loan_term_years", "interest_rate",
+        "holding_period_years", "annual_appreciation", "annual_rental_income",
+        "annual_rental_increase", "annual_property_tax", "annual_insurance",
+        "annual_maintenance", "annual_hoa", "closing_costs_pct",
+        "property_tax_rate", "insurance_rate", "maintenance_rate", "discount_rate",
+    )
+
+    def _check(self):
+        if self.down_payment_pct > 100:
+            return ["down_payment_pct: must be at most 100"]
+        return []
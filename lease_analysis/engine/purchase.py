@@ -0,0 +1,79 @@
+import numpy as np
+
+from lease_analysis.engine.amortization import payment, remaining_balance
+from lease_analysis.engine.returns import irr
+
+
+def advisory_cash_flows(p, interest_rate=None, noi_growth=None, exit_cap_rate=None):
+    """
+    Levered annual cash flows for the Client Advisory Tool's purchase form.
+
+    The rate arguments override the form's values and may be arrays, in
+    which case every element is a separate scenario (one row each).
+
+    Args:
+        p (dict): Purchase form (``purchase_price``, ``ltv``, ``interest_rate``,
+            ``amortization_years``, ``noi``, ``noi_growth``, ``exit_cap_rate``,
+            ``analysis_period``)
+        interest_rate, noi_growth, exit_cap_rate: Optional overrides, in %
+
+    Returns:
+        tuple: (cash_flows, equity) where cash_flows is ``(n, analysis_period + 1)``
+            with the equity outlay at t=0 and sale proceeds in the final year
+    """
+    rate_pct = np.atleast_1d(np.asarray(p["interest_rate"] if interest_rate is None else interest_rate, dtype=float))
+    growth = np.atleast_1d(np.asarray(p["noi_growth"] if noi_growth is None else noi_growth, dtype=float))
+    cap = np.atleast_1d(np.asarray(p["exit_cap_rate"] if exit_cap_rate is None else exit_cap_rate, dtype=float))
+    rate_pct, growth, cap = np.broadcast_arrays(rate_pct, growth, cap)
+
+    loan_amount = p["purchase_price"] * (p["ltv"] / 100)
+    equity = p["purchase_price"] - loan_amount
+    years = p["analysis_period"]
+    amort_years = p["amortization_years"]
+
+    num_payments = amort_years * 12
+    annual_debt_service = payment(loan_amount, rate_pct, num_payments) * 12
+
+    t = np.arange(years)
+    noi = p["noi"] * (1 + growth[:, None] / 100) ** t
+    flows = np.empty((len(growth), years + 1))
+    flows[:, 0] = -equity
+    flows[:, 1:] = noi - annual_debt_service[:, None]
+
+    exit_noi = p["noi"] * (1 + growth / 100) ** years
+    exit_price = exit_noi / (cap / 100)
+    # Balance after the holding period's payments; zero once the loan is paid off
+    remaining_loan = remaining_balance(loan_amount, rate_pct, num_payments, years * 12)
+    flows[:, -1] += exit_price - remaining_loan
+    return flows, equity
+
+
+def advisory_returns(flows, equity, guess=0.1):
+    """
+    IRR, year-one cash-on-cash and equity multiple for stacked cash flows.
+
+    Args:
+        flows: ``(n, periods)`` cash flows from ``advisory_cash_flows``
+        equity (float): Equity invested
+        guess: IRR starting point (fraction), a scalar or one per row
+
+    Returns:
+        dict: ``(n,)`` arrays ``irr`` and ``cash_on_cash`` (in %) and ``equity_multiple``
+    """
+    positive = np.where(flows > 0, flows, 0).sum(axis=1)
+    return {
+        "irr":             irr(flows, guess=guess) * 100,
+        "cash_on_cash":    flows[:, 1] / equity * 100 if equity > 0 else np.zeros(len(flows)),
+        "equity_multiple": positive / equity if equity > 0 else np.zeros(len(flows)),
+    }
+
+
+def advisory_purchase_metrics(p):
+    """
+    Purchase returns for the Client Advisory Tool.
+
+    Returns:
+        dict: ``irr`` and ``cash_on_cash`` (in %) and ``equity_multiple``
+    """
+    flows, equity = advisory_cash_flows(p)
+    return {key: float(value[0]) for key, value in advisory_returns(flows, equity).items()}
@@ -0,0 +1,239 @@
+from typing import NamedTuple
+
+import numpy as np
+
+# Bracket search grid for rows Newton cannot settle: evenly spaced in
+# log(1 + rate) between -99.9% and +9,900%
+GRID_POINTS = 1024
+GRID_BLOCK = 64
+_GRID = np.expm1(np.linspace(np.log(1e-3), np.log(100.0), GRID_POINTS))
+# Cells per (rows x grid points x periods) block when scanning the grid
+MAX_SCAN_CELLS = 4_000_000
+
+
+class IRRResult(NamedTuple):
+    """
+    Solved rates and how they were found, one entry per cash flow series.
+
+    Attributes:
+        rate: Rates as fractions (0.08 = 8%); NaN where no rate solves the series
+        converged: True where ``rate`` solves the series to tolerance
+        iterations: Newton steps taken (rows finished by the bracket search
+            report ``max_iter``)
+    """
+    rate: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+    @property
+    def failed(self):
+        """Indices of the series with no solution."""
+        return np.flatnonzero(~self.converged)
+
+
+def _npv(flows, times, rate):
+    # NPV of every row at its own rate (rate is (n, 1) or broadcastable)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return (flows * (1 + rate) ** -times).sum(axis=-1)
+
+
+def _newton(flows, times, rate, tol, max_iter):
+    rate = rate.copy()
+    done = np.zeros(len(flows), dtype=bool)
+    steps = np.zeros(len(flows), dtype=np.int64)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            active = np.flatnonzero(~done)
+            if not len(active):
+                break
+            r = rate[active, None]
+            t = times[active] if times.shape[0] > 1 else times
+            discount = flows[active] * (1 + r) ** -t
+            f = discount.sum(axis=1)
+            df = (-t * discount / (1 + r)).sum(axis=1)
+            step = f / df
+            new = rate[active] - step
+            # A step past -100% goes halfway to the boundary instead
+            new = np.where(new <= -1, (rate[active] - 1) / 2, new)
+            rate[active] = new
+            steps[active] += 1
+            done[active] = np.abs(step) < tol
+            # Diverged: stop iterating and leave the row to the bracket search
+            lost = active[~np.isfinite(new)]
+            rate[lost] = np.nan
+            done[lost] = True
+    converged = done & np.isfinite(rate)
+    return rate, converged, steps
+
+
+def _brackets_around_zero(flows, times):
+    """
+    Grid brackets of the nearest root at or above 0% and the nearest below it.
+
+    Scans the NPV over the rate grid and returns ``(low, high)`` rate arrays
+    of shape ``(2, n)``: row 0 is the first sign change going up from 0%,
+    row 1 the first going down. Missing brackets are NaN.
+    """
+    n, periods = flows.shape
+    values = np.empty((n, GRID_POINTS))
+    block = max(1, min(GRID_BLOCK, MAX_SCAN_CELLS // max(n * periods, 1)))
+    t = times[:, None, :] if times.shape[0] > 1 else times[None, :, :]
+    for start in range(0, GRID_POINTS, block):
+        grid = _GRID[start:start + block]
+        with np.errstate(over="ignore", invalid="ignore"):
+            values[:, start:start + block] = (flows[:, None, :] * (1 + grid[None, :, None]) ** -t).sum(axis=2)
+
+    sign = np.sign(values)
+    crossing = (sign[:, :-1] * sign[:, 1:] <= 0) & ((sign[:, :-1] != 0) | (sign[:, 1:] != 0))
+    cells = np.arange(GRID_POINTS - 1)
+    up = np.where(crossing & (_GRID[1:] > 0), cells, GRID_POINTS).min(axis=1)
+    down = np.where(crossing & (_GRID[:-1] < 0), cells, -1).max(axis=1)
+
+    low = np.full((2, n), np.nan)
+    high = np.full((2, n), np.nan)
+    for side, cell, found in ((0, up, up < GRID_POINTS), (1, down, down >= 0)):
+        low[side, found] = _GRID[cell[found]]
+        high[side, found] = _GRID[cell[found] + 1]
+    return low, high
+
+
+def _bisect(flows, times, low, high, tol):
+    # Bisection in log(1 + rate), all rows at once
+    lo, hi = np.log1p(low), np.log1p(high)
+    f_lo = _npv(flows, times, low[:, None])
+    on_grid = f_lo == 0
+    iterations = int(np.ceil(np.log2(max(np.nanmax(hi - lo, initial=0.0), tol) / tol))) + 1
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        f_mid = _npv(flows, times, np.expm1(mid)[:, None])
+        left = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(left, mid, lo)
+        f_lo = np.where(left, f_mid, f_lo)
+        hi = np.where(left, hi, mid)
+    return np.where(on_grid, low, np.expm1((lo + hi) / 2))
+
+
+def sign_changes(flows):
+    """Number of sign changes along each row, skipping zero flows."""
+    signs = np.sign(np.atleast_2d(flows))
+    last_nonzero = np.maximum.accumulate(
+        np.where(signs != 0, np.arange(signs.shape[1]), 0), axis=1)
+    filled = np.take_along_axis(signs, last_nonzero, axis=1)
+    return (filled[:, 1:] * filled[:, :-1] < 0).sum(axis=1)
+
+
+def solve_irr(cash_flows, times=None, guess=0.1, tol=1e-10, max_iter=50):
+    """
+    Internal rates of return for many cash flow series, with convergence flags.
+
+    Newton's method runs on every row at once, starting from ``guess``; pass
+    the previous solutions as ``guess`` to warm-start a run over nearby
+    scenarios. Rows Newton cannot settle, and rows with several sign changes
+    (which can have several roots), go to a bracketed search: the NPV is
+    scanned over a rate grid and the bracket around the root closest to 0%
+    is bisected, matching ``npf.irr``'s choice of root. Rows with no root
+    come back as NaN with ``converged`` False rather than raising.
+
+    Args:
+        cash_flows: ``(periods,)`` or ``(n, periods)`` array
+        times: Period of each flow in years, ``(periods,)`` or ``(n, periods)``;
+            defaults to 0, 1, 2, ... (see ``xirr`` for dated flows)
+        guess: Starting rate, a scalar or one per row
+        tol (float): Convergence tolerance on the rate
+        max_iter (int): Newton steps before handing a row to the bracket search
+
+    Returns:
+        IRRResult: ``(n,)`` rates, convergence flags and iteration counts
+    """
+    flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    n, periods = flows.shape
+    times = np.arange(periods, dtype=float)[None, :] if times is None else \
+        np.atleast_2d(np.asarray(times, dtype=float))
+    start = np.broadcast_to(np.asarray(guess, dtype=float), (n,))
+
+    rate, converged, steps = _newton(flows, times, start, tol, max_iter)
+    retry = np.flatnonzero(~converged | (sign_changes(flows) > 1))
+    if len(retry):
+        # The root closest to 0% is the nearest one above or below it, as
+        # npf.irr picks it; solve both brackets and keep the closer root
+        t = times[retry] if times.shape[0] > 1 else times
+        low, high = _brackets_around_zero(flows[retry], t)
+        roots = np.full((2, len(retry)), np.nan)
+        for side in (0, 1):
+            found = np.isfinite(low[side])
+            if found.any():
+                t_found = t[found] if t.shape[0] > 1 else t
+                roots[side, found] = _bisect(flows[retry][found], t_found, low[side, found], high[side, found], tol)
+        nearest = np.where(np.abs(roots[0]) <= np.abs(roots[1]), roots[0], roots[1])
+        nearest = np.where(np.isnan(roots[0]), roots[1], np.where(np.isnan(roots[1]), roots[0], nearest))
+        # Keep Newton's answer when it found that same root
+        same = converged[retry] & (np.abs(rate[retry] - nearest) <= 1e-6 * (1 + np.abs(nearest)))
+        rate[retry] = np.where(same, rate[retry], nearest)
+        steps[retry] = np.where(same, steps[retry], max_iter)
+        converged[retry] = np.isfinite(nearest)
+    return IRRResult(rate, converged, steps)
+
+
+def irr(cash_flows, guess=0.1, tol=1e-10, max_iter=50):
+    """
+    Internal rate of return for one or many cash flow series (periods 0, 1, 2, ...).
+
+    Args:
+        cash_flows: ``(periods,)`` or ``(n, periods)`` array, first flow at t=0
+        guess: Starting rate, a scalar or one per row (warm start)
+        tol (float): Convergence tolerance on the rate
+        max_iter (int): Newton steps before falling back to a bracket search
+
+    Returns:
+        float or np.ndarray: Rates as fractions (0.08 = 8%); NaN where no rate
+            solves the series (see ``solve_irr`` for convergence flags)
+    """
+    result = solve_irr(cash_flows, guess=guess, tol=tol, max_iter=max_iter)
+    return float(result.rate[0]) if np.ndim(cash_flows) == 1 else result.rate
+
+
+def year_fractions(dates):
+    """Years from the first date to each date (actual/365, as Excel's XIRR counts them)."""
+    days = np.asarray(dates, dtype="datetime64[D]")
+    first = days[..., :1]
+    return (days - first).astype(np.int64) / 365.0
+
+
+def xirr(cash_flows, dates, guess=0.1, tol=1e-10, max_iter=50):
+    """
+    Annualized internal rate of return for dated cash flows (Excel's XIRR).
+
+    Args:
+        cash_flows: ``(periods,)`` or ``(n, periods)`` array
+        dates: Date of each flow, ``(periods,)`` or ``(n, periods)``
+        guess: Starting rate, a scalar or one per row (warm start)
+        tol (float): Convergence tolerance on the rate
+        max_iter (int): Newton steps before falling back to a bracket search
+
+    Returns:
+        float or np.ndarray: Annual rates as fractions; NaN where unsolvable
+    """
+    result = solve_irr(cash_flows, times=year_fractions(dates), guess=guess, tol=tol, max_iter=max_iter)
+    return float(result.rate[0]) if np.ndim(cash_flows) == 1 else result.rate
+
+
+def xnpv(rate, cash_flows, dates):
+    """
+    Net present value of dated cash flows (Excel's XNPV).
+
+    Each flow is discounted by the actual days since the first date over 365,
+    so the first flow is undiscounted.
+
+    Args:
+        rate: Annual discount rate as a fraction, a scalar or one per row
+        cash_flows: ``(periods,)`` or ``(n, periods)`` array
+        dates: Date of each flow, ``(periods,)`` or ``(n, periods)``
+
+    Returns:
+        float or np.ndarray: Present value(s)
+    """
+    flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    times = np.atleast_2d(year_fractions(dates))
+    rate = np.asarray(rate, dtype=float).reshape(-1, 1)
+    value = _npv(flows, times, rate)
+    return float(value[0]) if np.ndim(cash_flows) == 1 else value
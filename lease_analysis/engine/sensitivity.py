@@ -0,0 +1,150 @@
+from itertools import product
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from lease_analysis.engine.lease import (
+    WEB, lease_inputs, lease_metrics, lease_schedule, schedule_amounts, stack_inputs,
+)
+
+# Swept parameters, in grid axis order
+AXES = ("base", "inc", "free", "ti", "disc")
+AXIS_LABELS = {
+    "base": "Base Rent ($/SF/yr)",
+    "inc":  "Escalation (%)",
+    "free": "Free Months",
+    "ti":   "TI ($/SF)",
+    "disc": "Discount Rate (%)",
+}
+
+# Cells per (rows x periods) array in one chunk; bounds memory for long terms
+MAX_CHUNK_CELLS = 2_000_000
+
+
+class SensitivityGrid(NamedTuple):
+    """
+    NPV and effective rent over the Cartesian grid of swept lease inputs.
+
+    Attributes:
+        axes: Axis name -> 1-D array of values, in ``AXES`` order
+        npv: NPV surface, shape ``(len(base), len(inc), len(free), len(ti), len(disc))``
+        eff_rent: Average effective rent ($/SF/yr) surface, same shape as ``npv``
+    """
+    axes: dict
+    npv: np.ndarray
+    eff_rent: np.ndarray
+
+    def surface(self, metric, rows, cols, **at):
+        """
+        A 2-D slice of ``metric`` ("npv" or "eff_rent") for charting.
+
+        Args:
+            metric (str): "npv" or "eff_rent"
+            rows (str): Axis along the rows, e.g. "base"
+            cols (str): Axis along the columns, e.g. "free"
+            **at: Index along each remaining axis (default 0)
+
+        Returns:
+            pd.DataFrame: Values indexed by the ``rows`` axis, columns by ``cols``
+        """
+        index = tuple(slice(None) if name in (rows, cols) else at.get(name, 0) for name in AXES)
+        values = getattr(self, metric)[index]
+        if AXES.index(rows) > AXES.index(cols):
+            values = values.T
+        return pd.DataFrame(values,
+                            index=pd.Index(self.axes[rows], name=AXIS_LABELS[rows]),
+                            columns=pd.Index(self.axes[cols], name=AXIS_LABELS[cols]))
+
+    def to_frame(self):
+        """Long-format table: one row per grid point."""
+        mesh = np.meshgrid(*(self.axes[name] for name in AXES), indexing="ij")
+        return pd.DataFrame({
+            **{AXIS_LABELS[name]: values.ravel() for name, values in zip(AXES, mesh)},
+            "NPV":           self.npv.ravel(),
+            "Avg Eff. Rent": self.eff_rent.ravel(),
+        })
+
+
+def _axis(values, default):
+    if values is None:
+        return np.array([default], dtype=float)
+    values = np.atleast_1d(np.asarray(values, dtype=float))
+    if values.ndim != 1 or not len(values):
+        raise ValueError("sweep ranges must be non-empty 1-D sequences")
+    return values
+
+
+def sweep_lease(p, base=None, inc=None, free=None, ti=None, disc=None, mode=WEB,
+                max_cells=MAX_CHUNK_CELLS):
+    """
+    Evaluate a lease over every combination of the given input ranges.
+
+    Each free-month value fixes the term (and so the schedule width); the
+    base rent, escalation and TI combinations for it are stacked into
+    scenario x period arrays and run through ``lease_schedule`` in chunks.
+    NPV is then taken for every discount rate at once, since the rate does
+    not change the cash flows.
+
+    Args:
+        p (dict): Base lease parameters, as for ``lease_engine.analyze_lease``
+        base, inc, free, ti, disc: Values to sweep for base rent ($/SF/yr),
+            annual escalation (%), free months, TI allowance ($/SF) and
+            discount rate (%); ``None`` keeps the base scenario's value.
+            Sweeping ``inc`` replaces any custom per-year increases, and
+            sweeping ``free`` replaces a custom abatement schedule. TI only
+            moves NPV and effective rent in modes that count it as a cash
+            flow (``all_in_cash_flow``, e.g. ``CLASSIC``); under ``WEB`` the
+            ``ti`` axis is flat.
+        mode (LeaseMode): Calculation switches, see ``LeaseMode``
+        max_cells (int): Upper bound on rows x periods per chunk
+
+    Returns:
+        SensitivityGrid: Axes plus NPV and effective rent surfaces
+    """
+    axes = {
+        "base": _axis(base, p["base"]),
+        "inc":  _axis(inc, p["inc"] or 0.0),
+        "free": _axis(free, p["free"]),
+        "ti":   _axis(ti, p["ti"]),
+        "disc": _axis(disc, p["disc"]),
+    }
+    if np.any(axes["free"] < 0) or np.any(axes["free"] % 1):
+        raise ValueError("free months must be whole numbers >= 0")
+
+    shape = tuple(len(axes[name]) for name in AXES)
+    npv_grid = np.empty(shape)
+    eff_grid = np.empty(shape)
+
+    # Every (base, inc, ti) combination, as flat columns
+    combos = np.array(list(product(axes["base"], axes["inc"], axes["ti"])))
+    rates = axes["disc"] / 100
+
+    for k, months_free in enumerate(axes["free"]):
+        scenario = dict(p, free=int(months_free))
+        if free is not None:
+            scenario["custom_abate"] = False
+        one = stack_inputs([lease_inputs(scenario, mode)])
+        width = one["inc"].shape[1]
+        discount = (1 + rates[None, :]) ** -np.arange(width)[:, None]
+        rows = max(1, max_cells // max(width, 1))
+
+        npv_flat = np.empty((len(combos), len(rates)))
+        eff_flat = np.empty(len(combos))
+        for start in range(0, len(combos), rows):
+            chunk = combos[start:start + rows]
+            b = {key: np.repeat(value, len(chunk), axis=0) for key, value in one.items()}
+            b["base"] = chunk[:, 0:1]
+            b["ti"] = chunk[:, 2:3]
+            if inc is not None:
+                b["inc"] = np.repeat(chunk[:, 1:2], width, axis=1)
+            s = lease_schedule(b, mode)
+            m = lease_metrics(b, s, schedule_amounts(s), mode)
+            npv_flat[start:start + len(chunk)] = np.abs(s["net_cf"] @ discount)
+            eff_flat[start:start + len(chunk)] = m["avg_eff_rent"]
+
+        grid = shape[0], shape[1], shape[3]
+        npv_grid[:, :, k, :, :] = npv_flat.reshape(*grid, len(rates))
+        eff_grid[:, :, k, :, :] = eff_flat.reshape(grid)[..., None]
+
+    return SensitivityGrid(axes, npv_grid, eff_grid)
@@ -0,0 +1,76 @@
+import math
+
+# Display kinds for summary values
+TEXT = "text"
+CURRENCY = "currency"
+CURRENCY_CENTS = "currency_cents"
+RENT_PSF = "rent_psf"
+PERCENT = "percent"
+MONTHS = "months"
+YEARS = "years"
+SQFT = "sqft"
+SQFT_CHANGE = "sqft_change"
+DATE = "date"
+
+FORMATTERS = {
+    TEXT:           str,
+    CURRENCY:       lambda v: f"${v:,.0f}",
+    CURRENCY_CENTS: lambda v: f"${v:,.2f}",
+    RENT_PSF:       lambda v: f"${v:,.2f} /SF/yr",
+    PERCENT:        lambda v: f"{v:.2f}%",
+    MONTHS:         lambda v: f"{int(round(v))} mo",
+    YEARS:          lambda v: f"{v} years",
+    SQFT:           lambda v: f"{v:,}",
+    SQFT_CHANGE:    lambda v: f"{v:+,}",
+    DATE:           lambda v: f"{v:%m/%d/%Y}",
+}
+
+# What to show when a value is missing (None or NaN)
+MISSING = {SQFT_CHANGE: "-"}
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def format_value(value, kind=TEXT):
+    """Format one summary value for display."""
+    if _is_missing(value):
+        return MISSING.get(kind, "N/A")
+    return FORMATTERS[kind](value)
+
+
+class Summary(dict):
+    """
+    Summary metrics for one scenario, kept as raw values.
+
+    Values stay numeric (floats, ints, dates), so they can be compared, charted
+    and exported without parsing; ``kinds`` records how each key is displayed,
+    and ``display``/``formatted`` produce the strings the UI and reports show.
+    """
+
+    def __init__(self, fields=()):
+        """
+        Args:
+            fields: Iterable of (key, value, kind) in display order
+        """
+        super().__init__()
+        self.kinds = {}
+        for key, value, kind in fields:
+            self[key] = value
+            self.kinds[key] = kind
+
+    def display(self, key):
+        """The formatted string for ``key``."""
+        return format_value(self[key], self.kinds.get(key, TEXT))
+
+    def formatted(self):
+        """A plain dict of formatted strings, in the same order."""
+        return {key: self.display(key) for key in self}
+
+
+def format_summary(summary):
+    """Formatted copy of a ``Summary``; plain dicts are shown as text."""
+    if isinstance(summary, Summary):
+        return summary.formatted()
+    return {key: format_value(value) for key, value in summary.items()}
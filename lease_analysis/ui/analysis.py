@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from lease_analysis.utils.timing import stage
 from lease_analysis.utils.ui_helpers import create_metric_section
 from lease_analysis.visualization.charts import create_rent_breakdown_chart
 
@@ -19,11 +20,13 @@ def render_analysis_tab():
         
         # Create and display charts
         st.markdown("### 📈 Annual Rent Breakdown")
-        rent_fig = create_rent_breakdown_chart(wf)
-        st.plotly_chart(rent_fig, use_container_width=True)
+        with stage("chart.build", chart="rent_breakdown", scenario=s["Option"]):
+            rent_fig = create_rent_breakdown_chart(wf)
+        with stage("chart.render", chart="rent_breakdown", scenario=s["Option"]):
+            st.plotly_chart(rent_fig, use_container_width=True)
         
         # Display cash flow table
-        with st.expander("📋 Show Cash-Flow Table"):
+        with st.expander("📋 Show Cash-Flow Table"), stage("table.style", table="cash_flow", scenario=s["Option"]):
             disp = wf.copy()
             for c in disp.columns:
                 if c != "Period":
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from lease_analysis.utils.timing import stage
 from lease_analysis.utils.ui_helpers import create_metric_section
 from lease_analysis.visualization.charts import create_comparison_chart
 
@@ -31,5 +32,7 @@ def render_comparison_tab():
     
     # Create and display comparison chart
     st.markdown("### 📈 Cost Comparison")
-    fig = create_comparison_chart(results)
-    st.plotly_chart(fig, use_container_width=True) 
\ No newline at end of file
+    with stage("chart.build", chart="comparison"):
+        fig = create_comparison_chart(results)
+    with stage("chart.render", chart="comparison"):
+        st.plotly_chart(fig, use_container_width=True) 
\ No newline at end of file
@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 from lease_analysis.utils.lease_calculator import calculate_lease_metrics, analyze_lease
 from lease_analysis.utils.ui_helpers import create_metric_section
+from lease_analysis.utils.scenario_import import read_scenarios
+from lease_analysis.utils.timing import stage
 from datetime import date
 
 def create_input_form(i):
@@ -198,5 +200,21 @@ def render_inputs_tab():
     for i in range(int(count)):
         inputs.append(create_input_form(i))
     if st.button("Run Analysis"):
-        st.session_state["results"] = [(p, *analyze_lease(p)) for p in inputs]
-        st.success("Analysis complete! View results in the Analysis tab.") 
\ No newline at end of file
+        with stage("compute.analyze_lease", scenarios=len(inputs)):
+            st.session_state["results"] = [(p, *analyze_lease(p)) for p in inputs]
+        st.success("Analysis complete! View results in the Analysis tab.")
+
+    st.markdown("---")
+    st.markdown("#### Bulk Import")
+    upload = st.file_uploader("Import lease scenarios from CSV or Excel (one row per option)",
+                              type=["csv", "xlsx"])
+    if upload is not None and st.button("Analyze Imported Scenarios"):
+        scenarios, bad_rows = read_scenarios(upload, kind="lease", name=upload.name)
+        for number, errors in bad_rows[:20]:
+            st.warning(f"Row {number} skipped: {'; '.join(errors)}")
+        if len(bad_rows) > 20:
+            st.warning(f"...and {len(bad_rows) - 20} more rows skipped.")
+        if scenarios:
+            with stage("compute.analyze_lease", scenarios=len(scenarios)):
+                st.session_state["results"] = [(p, *analyze_lease(p)) for p in scenarios]
+            st.success(f"Analyzed {len(scenarios)} imported scenarios. View results in the Analysis tab.") 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from lease_analysis.utils.timing import stage
 from lease_analysis.utils.ui_helpers import create_metric_section
 from lease_analysis.visualization.purchase_charts import create_purchase_breakdown_chart
 
@@ -20,30 +21,32 @@ def render_purchase_analysis_tab():
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Property Value", s["Property Value"])
-            st.metric("Down Payment", s["Down Payment"])
-            st.metric("Loan Amount", s["Loan Amount"])
-            st.metric("Monthly Payment", s["Monthly Payment"])
+            st.metric("Property Value", s.display("Property Value"))
+            st.metric("Down Payment", s.display("Down Payment"))
+            st.metric("Loan Amount", s.display("Loan Amount"))
+            st.metric("Monthly Payment", s.display("Monthly Payment"))
         
         with col2:
-            st.metric("Total Investment", s["Total Investment"])
-            st.metric("Final Property Value", s["Final Property Value"])
-            st.metric("Total Return", s["Total Return"])
-            st.metric("Cap Rate", s["Cap Rate"])
+            st.metric("Total Investment", s.display("Total Investment"))
+            st.metric("Final Property Value", s.display("Final Property Value"))
+            st.metric("Total Return", s.display("Total Return"))
+            st.metric("Cap Rate", s.display("Cap Rate"))
         
         with col3:
-            st.metric("NPV", s[f"NPV ({p['discount_rate']:.2f}%)"])
-            st.metric("IRR", s["IRR"])
-            st.metric("ROI", s["ROI"])
-            st.metric("Cash-on-Cash", s["Cash-on-Cash"])
+            st.metric("NPV", s.display(f"NPV ({p['discount_rate']:.2f}%)"))
+            st.metric("IRR", s.display("IRR"))
+            st.metric("ROI", s.display("ROI"))
+            st.metric("Cash-on-Cash", s.display("Cash-on-Cash"))
         
         # Create and display charts
         st.markdown("### 📈 Annual Cash Flow Breakdown")
-        purchase_fig = create_purchase_breakdown_chart(wf)
-        st.plotly_chart(purchase_fig, use_container_width=True)
+        with stage("chart.build", chart="purchase_breakdown", scenario=s["Option"]):
+            purchase_fig = create_purchase_breakdown_chart(wf)
+        with stage("chart.render", chart="purchase_breakdown", scenario=s["Option"]):
+            st.plotly_chart(purchase_fig, use_container_width=True)
         
         # Display cash flow table
-        with st.expander("📋 Show Detailed Cash Flow Table"):
+        with st.expander("📋 Show Detailed Cash Flow Table"), stage("table.style", table="cash_flow", scenario=s["Option"]):
             disp = wf.copy()
             for c in disp.columns:
                 if c not in ["Year", "Period"]:
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from lease_analysis.utils.timing import stage
 from lease_analysis.utils.ui_helpers import create_metric_section
 from lease_analysis.visualization.purchase_charts import create_purchase_comparison_chart
 
@@ -15,35 +16,33 @@ def render_purchase_comparison_tab():
     # Create comparison metrics
     metrics = []
     for idx, (p, s, wf) in enumerate(results):
-        # Extract numeric values for comparison
-        total_return = float(s["Total Return"].replace("$", "").replace(",", ""))
-        npv = float(s[f"NPV ({p['discount_rate']:.2f}%)"].replace("$", "").replace(",", ""))
-        irr = float(s["IRR"].replace("%", ""))
-        roi = float(s["ROI"].replace("%", ""))
-        cap_rate = float(s["Cap Rate"].replace("%", ""))
-        coc_return = float(s["Cash-on-Cash"].replace("%", ""))
-        
         metrics.append({
             "Scenario": s["Option"],
             "Property Value": s["Property Value"],
             "Total Investment": s["Total Investment"],
-            "Total Return": total_return,
-            "NPV": npv,
-            "IRR": irr,
-            "ROI": roi,
-            "Cap Rate": cap_rate,
-            "Cash-on-Cash": coc_return,
+            "Total Return": s["Total Return"],
+            "NPV": s[f"NPV ({p['discount_rate']:.2f}%)"],
+            "IRR": s["IRR"],
+            "ROI": s["ROI"],
+            "Cap Rate": s["Cap Rate"],
+            "Cash-on-Cash": s["Cash-on-Cash"],
             "Payback (years)": s["Payback (years)"]
         })
     
     # Display comparison table
     df = pd.DataFrame(metrics)
-    st.dataframe(df, use_container_width=True)
+    money = ["Property Value", "Total Investment", "Total Return", "NPV"]
+    rates = ["IRR", "ROI", "Cap Rate", "Cash-on-Cash"]
+    with stage("table.style", table="comparison"):
+        st.dataframe(df.style.format("${:,.0f}", subset=money).format("{:.2f}%", subset=rates),
+                     use_container_width=True)
     
     # Create and display comparison chart
     st.markdown("### 📈 Investment Metrics Comparison")
-    fig = create_purchase_comparison_chart(results)
-    st.plotly_chart(fig, use_container_width=True)
+    with stage("chart.build", chart="comparison"):
+        fig = create_purchase_comparison_chart(results)
+    with stage("chart.render", chart="comparison"):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Additional insights
     st.markdown("### 💡 Key Insights")
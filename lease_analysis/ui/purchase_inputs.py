@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from lease_analysis.utils.purchase_calculator import analyze_purchase
+from lease_analysis.utils.timing import stage
 from datetime import date
 
 def create_purchase_input_form(i):
@@ -118,7 +119,8 @@ def render_purchase_inputs_tab():
         results = []
         for params in inputs:
             try:
-                summary, cash_flow = analyze_purchase(params)
+                with stage("compute.analyze_purchase", scenario=params.get("name")):
+                    summary, cash_flow = analyze_purchase(params)
                 results.append((params, summary, cash_flow))
             except Exception as e:
                 st.error(f"Error analyzing purchase scenario: {str(e)}")
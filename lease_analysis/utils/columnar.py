@@ -0,0 +1,266 @@
+import numbers
+import os
+from datetime import date, datetime
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from lease_analysis.engine.summary import TEXT, Summary
+
+# The analysis each result came from
+LEASE = "lease"
+PURCHASE = "purchase"
+PURCHASE_VS_LEASE = "purchase_vs_lease"
+
+# Cash flow frames of each kind of result, by their name in the long table
+FRAMES = {
+    LEASE:             ("waterfall",),
+    PURCHASE:          ("cash_flows",),
+    PURCHASE_VS_LEASE: ("purchase_df", "lease_df"),
+}
+# analyze_purchase_vs_lease's yearly cash flow lists, stored under this item
+FLOW_LISTS = ("purchase_cash_flows", "lease_cash_flows")
+FLOW_ITEM = "Cash Flow"
+
+# Arrow IPC files are memory-mapped and read without copying; Parquet is smaller
+ARROW_SUFFIXES = (".arrow", ".feather")
+PARQUET_SUFFIX = ".parquet"
+TABLE_NAMES = ("summary", "cash_flows")
+
+_LABEL = pa.dictionary(pa.int32(), pa.string())
+_KEY = [("analysis", _LABEL), ("scenario", pa.int32()), ("option", pa.string())]
+
+SUMMARY_SCHEMA = pa.schema(_KEY + [
+    ("metric", _LABEL),
+    ("type",   _LABEL),   # "number" (NaN kept), "integer", "bool", "date", "text" or "null"
+    ("kind",   _LABEL),   # Summary display kind, e.g. "currency"
+    ("value",  pa.float64()),
+    ("text",   pa.string()),
+    ("date",   pa.date32()),
+])
+
+CASH_FLOW_SCHEMA = pa.schema(_KEY + [
+    ("table",  _LABEL),
+    ("year",   pa.int32()),
+    ("period", pa.string()),
+    ("item",   _LABEL),
+    ("value",  pa.float64()),
+])
+
+
+class ResultTables(NamedTuple):
+    """
+    Analysis results as two long-format Arrow tables.
+
+    Attributes:
+        summary: One row per scenario and summary metric; numbers and flags
+            in ``value``, strings in ``text``, dates in ``date``
+        cash_flows: One row per scenario, cash flow table, year and line item
+    """
+    summary: pa.Table
+    cash_flows: pa.Table
+
+
+def _summary_columns(value):
+    """``(type, value, text, date)`` columns of one summary value; ``_summary_value`` reverses it."""
+    if value is None:
+        return "null", None, None, None
+    if isinstance(value, (bool, np.bool_)):
+        return "bool", float(value), None, None
+    if isinstance(value, numbers.Integral):
+        return "integer", float(value), None, None
+    if isinstance(value, numbers.Real):
+        return "number", float(value), None, None
+    if isinstance(value, datetime):
+        return "date", None, None, value.date()
+    if isinstance(value, date):
+        return "date", None, None, value
+    return "text", None, str(value), None
+
+
+def _summary_value(row):
+    if row.type == "bool":
+        return bool(row.value)
+    if row.type == "integer":
+        return int(row.value)
+    if row.type == "number":
+        return float(row.value)
+    if row.type == "date":
+        return row.date
+    if row.type == "text":
+        return row.text
+    return None
+
+
+def _long_flows(df):
+    """A wide yearly cash flow frame as ``year, period, item, value`` columns, year by year."""
+    items = [col for col in df.columns if col not in ("Year", "Period")]
+    n, k = len(df), len(items)
+    values = df[items].to_numpy(float)
+    period = df["Period"].astype(str).to_numpy() if "Period" in df else np.full(n, None)
+    return {
+        "year":   np.repeat(df["Year"].to_numpy(np.int32), k),
+        "period": np.repeat(period, k),
+        "item":   np.tile(np.array(items, dtype=object), n),
+        "value":  values.ravel(),
+    }
+
+
+def _frames(analysis, result):
+    if analysis == PURCHASE_VS_LEASE:
+        frames = {name: result[name] for name in FRAMES[analysis]}
+        for name in FLOW_LISTS:
+            flows = result[name]
+            frames[name] = pd.DataFrame({"Year": np.arange(1, len(flows) + 1), FLOW_ITEM: flows})
+        return result["summary"], frames
+    summary, df = result
+    return summary, {FRAMES[analysis][0]: df}
+
+
+def result_tables(leases=(), purchases=(), comparisons=()):
+    """
+    Flatten analysis results into long-format summary and cash flow tables.
+
+    Scenarios are numbered from 1 within each analysis, in the order given.
+    Each cash flow frame keeps its name (``table``), so a result's tables can
+    be rebuilt with ``results_from_tables``.
+
+    Args:
+        leases (list): ``analyze_lease`` results, ``(summary, waterfall)``
+        purchases (list): ``analyze_purchase`` results, ``(summary, cash_flows)``
+        comparisons (list): ``analyze_purchase_vs_lease`` result dicts
+
+    Returns:
+        ResultTables: The summary and cash flow ``pyarrow.Table``s
+    """
+    summary_rows = {name: [] for name in SUMMARY_SCHEMA.names}
+    flow_parts = []
+    for analysis, results in ((LEASE, leases), (PURCHASE, purchases), (PURCHASE_VS_LEASE, comparisons)):
+        for scenario, result in enumerate(results, start=1):
+            summary, frames = _frames(analysis, result)
+            option = str(summary.get("Option", ""))
+            kinds = getattr(summary, "kinds", {})
+            for metric, value in summary.items():
+                typ, number, text, day = _summary_columns(value)
+                for name, v in zip(SUMMARY_SCHEMA.names, (analysis, scenario, option, metric,
+                                                          typ, kinds.get(metric, TEXT), number, text, day)):
+                    summary_rows[name].append(v)
+            for table, df in frames.items():
+                flows = _long_flows(df)
+                n = len(flows["value"])
+                flow_parts.append({"analysis": np.full(n, analysis, dtype=object),
+                                   "scenario": np.full(n, scenario, dtype=np.int32),
+                                   "option":   np.full(n, option, dtype=object),
+                                   "table":    np.full(n, table, dtype=object), **flows})
+
+    flows = {name: np.concatenate([part[name] for part in flow_parts]) if flow_parts else []
+             for name in CASH_FLOW_SCHEMA.names}
+    return ResultTables(pa.Table.from_pydict(summary_rows, schema=SUMMARY_SCHEMA),
+                        pa.Table.from_pydict(flows, schema=CASH_FLOW_SCHEMA))
+
+
+def _wide_flows(group):
+    items = list(dict.fromkeys(group["item"]))
+    values = group["value"].to_numpy().reshape(-1, len(items))
+    rows = group.iloc[::len(items)]
+    df = pd.DataFrame({"Year": rows["year"].to_numpy(np.int64)})
+    if rows["period"].notna().any():
+        df["Period"] = rows["period"].to_numpy()
+    for j, item in enumerate(items):
+        df[item] = values[:, j]
+    return df
+
+
+def results_from_tables(tables):
+    """
+    Rebuild analysis results from ``result_tables`` output.
+
+    Summary values come back with their original types and display kinds;
+    cash flow amounts come back as floats.
+
+    Args:
+        tables (ResultTables): Tables from ``result_tables`` or ``read_results``
+
+    Returns:
+        dict: Analysis (``LEASE``, ``PURCHASE``, ``PURCHASE_VS_LEASE``) to its
+            results in scenario order, shaped as the analyze function returns them
+    """
+    flows = {}
+    df = tables.cash_flows.to_pandas()
+    for (analysis, scenario, table), group in df.groupby(["analysis", "scenario", "table"],
+                                                         observed=True, sort=False):
+        flows.setdefault((analysis, scenario), {})[table] = _wide_flows(group)
+
+    results = {LEASE: [], PURCHASE: [], PURCHASE_VS_LEASE: []}
+    df = tables.summary.to_pandas()
+    for (analysis, scenario), group in df.groupby(["analysis", "scenario"], observed=True, sort=True):
+        summary = Summary((row.metric, _summary_value(row), row.kind) for row in group.itertuples(index=False))
+        frames = flows.get((analysis, scenario), {})
+        if analysis == PURCHASE_VS_LEASE:
+            result = {"summary": summary, **{name: frames[name] for name in FRAMES[analysis]}}
+            result.update({name: frames[name][FLOW_ITEM].tolist() for name in FLOW_LISTS})
+        else:
+            result = (summary, frames[FRAMES[analysis][0]])
+        results[analysis].append(result)
+    return results
+
+
+def _paths(path):
+    stem, suffix = os.path.splitext(path)
+    suffix = suffix.lower()
+    if suffix != PARQUET_SUFFIX and suffix not in ARROW_SUFFIXES:
+        raise ValueError(f"unsupported results file type {suffix or '(none)'}; use .parquet or .arrow")
+    return suffix, [f"{stem}_{name}{suffix}" for name in TABLE_NAMES]
+
+
+def write_results(tables, path):
+    """
+    Write result tables as ``<stem>_summary<suffix>`` and ``<stem>_cash_flows<suffix>``.
+
+    ``.arrow``/``.feather`` paths get uncompressed Arrow IPC files, which
+    ``read_results`` maps into memory without copying; ``.parquet`` paths get
+    Parquet files for tools that read Parquet.
+
+    Args:
+        tables (ResultTables): Tables from ``result_tables``
+        path (str): Output path; its suffix picks the format
+
+    Returns:
+        list: Paths written
+    """
+    suffix, paths = _paths(path)
+    for table, out in zip(tables, paths):
+        if suffix == PARQUET_SUFFIX:
+            pq.write_table(table, out)
+        else:
+            with pa.OSFile(out, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    return paths
+
+
+def read_results(path):
+    """
+    Load tables written by ``write_results``.
+
+    Arrow IPC files are memory-mapped: the columns point into the mapped
+    files rather than copies of them, so loading is instant whatever the size
+    and pages are read only as columns are used.
+
+    Args:
+        path (str): The path given to ``write_results``
+
+    Returns:
+        ResultTables: The summary and cash flow tables
+    """
+    suffix, paths = _paths(path)
+    tables = []
+    for src in paths:
+        if suffix == PARQUET_SUFFIX:
+            tables.append(pq.read_table(src, memory_map=True))
+        else:
+            with pa.memory_map(src, "r") as source:
+                tables.append(pa.ipc.open_file(source).read_all())
+    return ResultTables(*tables)
@@ -4,8 +4,14 @@ import numpy_financial as npf
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 
+from lease_analysis.engine import returns
+from lease_analysis.engine.amortization import amortize, payment
+from lease_analysis.engine.cache import memoize
+from lease_analysis.engine.summary import CURRENCY, DATE, PERCENT, TEXT, Summary
+
+@memoize
 def analyze_purchase(p):
-    """Analyze property purchase parameters and return summary and cash flow data."""
+    """Analyze property purchase parameters and return a numeric ``Summary`` and cash flow data."""
     # Extract parameters
     property_value = p["property_value"]
     down_payment_pct = p["down_payment_pct"]
@@ -26,84 +32,57 @@ def analyze_purchase(p):
     # Calculate loan details
     down_payment = property_value * (down_payment_pct / 100)
     loan_amount = property_value - down_payment
-    monthly_rate = interest_rate / 100 / 12
-    total_payments = loan_term_years * 12
     
-    # Calculate monthly mortgage payment
-    if loan_amount > 0:
-        monthly_payment = npf.pmt(monthly_rate, total_payments, -loan_amount)
-    else:
-        monthly_payment = 0
+    # Monthly schedule for the loan, rolled up into years 0..holding period
+    years = np.arange(holding_period_years + 1)
+    loan = amortize(max(loan_amount, 0), interest_rate, loan_term_years,
+                    months=(holding_period_years + 1) * 12).annual()
+    monthly_payment = payment(loan_amount, interest_rate, loan_term_years * 12) if loan_amount > 0 else 0
+    annual_principal = loan["principal"][0]
+    annual_interest = loan["interest"][0]
+    annual_mortgage_payments = loan["payment"][0]
     
     # Calculate closing costs
     closing_costs = property_value * (closing_costs_pct / 100)
     
-    # Initialize cash flow tracking
-    cfs, rows = [], []
-    remaining_balance = loan_amount
-    cumulative_equity = down_payment
-    
-    for year in range(holding_period_years + 1):
-        # Calculate property value at this year
-        current_property_value = property_value * (1 + annual_appreciation / 100) ** year
-        
-        # Calculate rental income for this year
-        current_rental_income = annual_rental_income * (1 + annual_rental_increase / 100) ** year
-        
-        # Calculate annual expenses
-        annual_expenses = annual_property_tax + annual_insurance + annual_maintenance + annual_hoa
-        
-        # Calculate mortgage payments for this year
-        annual_mortgage_payments = monthly_payment * 12 if year < loan_term_years else 0
-        
-        # Calculate principal and interest breakdown for this year
-        if year < loan_term_years:
-            annual_interest = 0
-            annual_principal = 0
-            for month in range(12):
-                interest_payment = remaining_balance * monthly_rate
-                principal_payment = monthly_payment - interest_payment
-                annual_interest += interest_payment
-                annual_principal += principal_payment
-                remaining_balance -= principal_payment
-        else:
-            annual_interest = 0
-            annual_principal = 0
-        
-        # Calculate net cash flow for this year
-        net_cash_flow = current_rental_income - annual_expenses - annual_mortgage_payments
-        
-        # For year 0, include purchase costs
-        if year == 0:
-            net_cash_flow -= (down_payment + closing_costs)
-        
-        # Calculate equity at end of year
-        if year < loan_term_years:
-            cumulative_equity = down_payment + (loan_amount - remaining_balance)
-        else:
-            cumulative_equity = current_property_value
-        
-        cfs.append(net_cash_flow)
-        
-        # Create row for detailed breakdown
+    # Property value, rent and expenses for every year at once
+    current_property_value = property_value * (1 + annual_appreciation / 100) ** years
+    current_rental_income = annual_rental_income * (1 + annual_rental_increase / 100) ** years
+    annual_expenses = annual_property_tax + annual_insurance + annual_maintenance + annual_hoa
+    
+    # Net cash flow; year 0 includes purchase costs
+    cfs = current_rental_income - annual_expenses - annual_mortgage_payments
+    cfs[0] -= down_payment + closing_costs
+    
+    # Equity at end of year: paid-down principal while the loan runs, then the property
+    cumulative_equity = np.where(years < loan_term_years,
+                                 down_payment + (loan_amount - loan["balance"][0]),
+                                 current_property_value)
+    
+    periods = []
+    for year in years.tolist():
         period_start = purchase_date + relativedelta(years=year)
         period_end = period_start + relativedelta(years=1) - timedelta(days=1)
-        
-        rows.append({
-            "Year": year,
-            "Period": f"{period_start:%m/%d/%Y} – {period_end:%m/%d/%Y}",
-            "Property Value": round(current_property_value),
-            "Rental Income": round(current_rental_income),
-            "Property Tax": -round(annual_property_tax),
-            "Insurance": -round(annual_insurance),
-            "Maintenance": -round(annual_maintenance),
-            "HOA": -round(annual_hoa),
-            "Mortgage Payment": -round(annual_mortgage_payments),
-            "Principal": round(annual_principal),
-            "Interest": -round(annual_interest),
-            "Net Cash Flow": round(net_cash_flow),
-            "Cumulative Equity": round(cumulative_equity)
-        })
+        periods.append(f"{period_start:%m/%d/%Y} – {period_end:%m/%d/%Y}")
+    
+    def whole(values):
+        return np.rint(np.broadcast_to(values, years.shape)).astype(np.int64)
+    
+    cash_flow = pd.DataFrame({
+        "Year": years,
+        "Period": periods,
+        "Property Value": whole(current_property_value),
+        "Rental Income": whole(current_rental_income),
+        "Property Tax": -whole(annual_property_tax),
+        "Insurance": -whole(annual_insurance),
+        "Maintenance": -whole(annual_maintenance),
+        "HOA": -whole(annual_hoa),
+        "Mortgage Payment": -whole(annual_mortgage_payments),
+        "Principal": whole(annual_principal),
+        "Interest": -whole(annual_interest),
+        "Net Cash Flow": whole(cfs),
+        "Cumulative Equity": whole(cumulative_equity),
+    })
     
     # Calculate financial metrics
     total_investment = down_payment + closing_costs
@@ -113,11 +92,8 @@ def analyze_purchase(p):
     # Calculate NPV
     npv = npf.npv(discount_rate / 100, cfs)
     
-    # Calculate IRR
-    try:
-        irr = npf.irr(cfs) * 100 if len(cfs) > 1 else 0
-    except:
-        irr = 0
+    # Calculate IRR; NaN (shown as N/A) when no rate solves the cash flows
+    irr = returns.irr(cfs) * 100 if len(cfs) > 1 else 0
     
     # Calculate ROI
     roi = (total_return / total_investment) * 100 if total_investment > 0 else 0
@@ -134,26 +110,26 @@ def analyze_purchase(p):
     coc_return = (annual_rental_income - annual_property_tax - annual_insurance - 
                   annual_maintenance - annual_hoa - (monthly_payment * 12)) / total_investment * 100
     
-    summary = {
-        "Option": p["name"],
-        "Purchase Date": purchase_date.strftime("%m/%d/%Y"),
-        "Property Value": f"${property_value:,.0f}",
-        "Down Payment": f"${down_payment:,.0f}",
-        "Loan Amount": f"${loan_amount:,.0f}",
-        "Monthly Payment": f"${monthly_payment:,.0f}",
-        "Closing Costs": f"${closing_costs:,.0f}",
-        "Total Investment": f"${total_investment:,.0f}",
-        "Final Property Value": f"${final_property_value:,.0f}",
-        "Total Return": f"${total_return:,.0f}",
-        f"NPV ({discount_rate:.2f}%)": f"${npv:,.0f}",
-        "IRR": f"{irr:.2f}%",
-        "ROI": f"{roi:.2f}%",
-        "Payback (years)": payback,
-        "Cap Rate": f"{cap_rate:.2f}%",
-        "Cash-on-Cash": f"{coc_return:.2f}%"
-    }
-    
-    return summary, pd.DataFrame(rows)
+    summary = Summary([
+        ("Option",                    p["name"],              TEXT),
+        ("Purchase Date",             purchase_date,          DATE),
+        ("Property Value",            property_value,         CURRENCY),
+        ("Down Payment",              down_payment,           CURRENCY),
+        ("Loan Amount",               loan_amount,            CURRENCY),
+        ("Monthly Payment",           float(monthly_payment), CURRENCY),
+        ("Closing Costs",             closing_costs,          CURRENCY),
+        ("Total Investment",          total_investment,       CURRENCY),
+        ("Final Property Value",      final_property_value,   CURRENCY),
+        ("Total Return",              float(total_return),    CURRENCY),
+        (f"NPV ({discount_rate:.2f}%)", float(npv),           CURRENCY),
+        ("IRR",                       float(irr),             PERCENT),
+        ("ROI",                       float(roi),             PERCENT),
+        ("Payback (years)",           int(payback),           TEXT),
+        ("Cap Rate",                  cap_rate,               PERCENT),
+        ("Cash-on-Cash",              float(coc_return),      PERCENT),
+    ])
+    
+    return summary, cash_flow
 
 def calculate_purchase_metrics(params):
     """Calculate purchase metrics based on input parameters."""
@@ -0,0 +1,252 @@
+import csv
+import io
+import os
+from datetime import date, datetime
+
+from openpyxl import load_workbook
+
+from lease_analysis.engine import params as schema
+from lease_analysis.engine.lease import GROSS, NNN
+from lease_analysis.engine.params import InvalidParams, LeaseParams, PurchaseParams
+
+# Spreadsheet headers people actually use, mapped onto parameter names
+HEADER_ALIASES = {
+    "term_(mos)":  "term_mos",
+    "term_months": "term_mos",
+    "rsf":         "sqft",
+    "sf":          "sqft",
+    "move":        "move_exp",
+    "base_rent":   "base",
+    "free_rent":   "free",
+    "discount":    "disc",
+    "option":      "name",
+}
+
+LEASE_TYPES = {
+    "nnn": NNN, "triple net": NNN, NNN.lower(): NNN,
+    "gross": GROSS, "full service": GROSS, GROSS.lower(): GROSS,
+}
+
+_TRUE = {"true", "yes", "y", "1", "x"}
+_FALSE = {"false", "no", "n", "0", ""}
+
+
+def _to_float(value):
+    if isinstance(value, bool):
+        raise ValueError("expected a number")
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace("$", "").replace(",", "").rstrip("%")
+    return float(text)
+
+
+def _to_int(value):
+    number = _to_float(value)
+    if not number.is_integer():
+        raise ValueError("expected a whole number")
+    return int(number)
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError("expected yes/no")
+
+
+def _to_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    for parse in (date.fromisoformat, lambda t: datetime.strptime(t, "%m/%d/%Y").date()):
+        try:
+            return parse(text)
+        except ValueError:
+            pass
+    raise ValueError("expected a date (YYYY-MM-DD or MM/DD/YYYY)")
+
+
+def _to_str(value):
+    return str(value).strip()
+
+
+def _to_lease_type(value):
+    lease_type = LEASE_TYPES.get(str(value).strip().lower())
+    if lease_type is None:
+        raise ValueError(f"expected {NNN!r} or {GROSS!r}")
+    return lease_type
+
+
+def _list_of(convert):
+    # Per-year values in one cell, e.g. "3; 3; 4" or "3|3|4"
+    def to_list(value):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return [convert(value)]
+        parts = str(value).replace("|", ";").split(";")
+        return [convert(part) for part in parts if part.strip()]
+    return to_list
+
+
+# Scenario classes by row type; their fields are the columns a sheet may have
+PARAMS = {"lease": LeaseParams, "purchase": PurchaseParams}
+
+# Spreadsheet cell parser for each engine.params field converter. Cells
+# arrive as text ("$1,250", "yes", "3; 3; 4") or as Excel's native values.
+CELL_PARSERS = {
+    schema._int:           _to_int,
+    schema._float:         _to_float,
+    schema._bool:          _to_bool,
+    schema._str:           _to_str,
+    schema._date:          _to_date,
+    schema._optional_date: _to_date,
+    schema._floats:        _list_of(_to_float),
+    schema._ints:          _list_of(_to_int),
+    schema._lease_type:    _to_lease_type,
+}
+
+# Optional in PurchaseParams, but the batch purchase calculator dates its cash flows
+REQUIRED_CELLS = {"lease": (), "purchase": ("purchase_date",)}
+
+
+def normalize_header(header):
+    """Map a column header onto a parameter name."""
+    key = str(header or "").strip().lower().replace(" ", "_").replace("-", "_")
+    return HEADER_ALIASES.get(key, key)
+
+
+def _is_blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def coerce_row(raw, kind="lease", row_number=None):
+    """
+    Validate and coerce one raw row into calculator parameters.
+
+    Cells are parsed into the field types of ``LeaseParams`` or
+    ``PurchaseParams``, which then apply their defaults and validation.
+
+    Args:
+        raw (dict): Normalized header -> cell value
+        kind (str): "lease" or "purchase"
+        row_number (int): Used for the default scenario name
+
+    Returns:
+        tuple: (params, errors) where errors is a list of messages; params is
+            only meaningful when errors is empty
+    """
+    cls = PARAMS[kind]
+    values, errors = {}, []
+    for field, convert, _, _ in cls._FIELDS:
+        value = raw.get(field)
+        parse = CELL_PARSERS.get(convert)
+        if parse is None or _is_blank(value):
+            if field in REQUIRED_CELLS[kind]:
+                errors.append(f"{field}: required")
+            continue
+        try:
+            values[field] = parse(value)
+        except (TypeError, ValueError) as e:
+            errors.append(f"{field}: {e} (got {value!r})")
+
+    if not values.get("name"):
+        values["name"] = f"Option {row_number}" if row_number else "Option"
+    if kind == "lease":
+        values["custom_abate"] = bool(values.get("abates"))
+    try:
+        params = cls(**values).to_dict()
+    except InvalidParams as e:
+        # A cell that did not parse is reported once, not again as missing
+        bad = {message.split(":", 1)[0] for message in errors}
+        errors += [message for message in e.errors if message.split(":", 1)[0] not in bad]
+        params = values
+    return params, errors
+
+
+def _source_suffix(source, name):
+    name = name or getattr(source, "name", None) or (source if isinstance(source, str) else "")
+    return os.path.splitext(str(name))[1].lower()
+
+
+def iter_records(source, name=None):
+    """
+    Stream raw rows from a CSV or XLSX file without loading it whole.
+
+    Args:
+        source: Path or binary file object (e.g. a Streamlit upload)
+        name (str): File name used to detect the format when ``source`` has none
+
+    Yields:
+        tuple: (row_number, {normalized_header: value}); row 1 is the header
+    """
+    suffix = _source_suffix(source, name)
+    if suffix in (".xlsx", ".xlsm"):
+        wb = load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = [normalize_header(h) for h in next(rows, ())]
+            for number, values in enumerate(rows, start=2):
+                if not all(_is_blank(v) for v in values):
+                    yield number, dict(zip(header, values))
+        finally:
+            wb.close()
+    elif suffix == ".csv":
+        if isinstance(source, str):
+            f = open(source, newline="", encoding="utf-8-sig")
+        else:
+            f = io.TextIOWrapper(source, newline="", encoding="utf-8-sig")
+        with f:
+            reader = csv.reader(f)
+            header = [normalize_header(h) for h in next(reader, [])]
+            for number, values in enumerate(reader, start=2):
+                if not all(_is_blank(v) for v in values):
+                    yield number, dict(zip(header, values))
+    else:
+        raise ValueError(f"unsupported scenario file type {suffix or '(none)'}; use .csv or .xlsx")
+
+
+def iter_scenarios(source, kind=None, name=None):
+    """
+    Stream validated scenarios from a CSV or XLSX file.
+
+    Args:
+        source: Path or binary file object
+        kind (str): "lease" or "purchase"; ``None`` reads a ``type`` column,
+            defaulting to lease
+        name (str): File name used to detect the format
+
+    Yields:
+        tuple: (row_number, params, errors)
+    """
+    for number, raw in iter_records(source, name):
+        row_kind = kind or str(raw.get("type") or "lease").strip().lower()
+        if row_kind not in PARAMS:
+            yield number, {}, [f"type: expected lease or purchase (got {row_kind!r})"]
+            continue
+        params, errors = coerce_row(raw, row_kind, number)
+        params["type"] = row_kind
+        yield number, params, errors
+
+
+def read_scenarios(source, kind=None, name=None):
+    """
+    Read every valid scenario from a CSV or XLSX file.
+
+    Returns:
+        tuple: (scenarios, bad_rows) where bad_rows is a list of
+            (row_number, [messages])
+    """
+    scenarios, bad_rows = [], []
+    for number, params, errors in iter_scenarios(source, kind, name):
+        if errors:
+            bad_rows.append((number, errors))
+        else:
+            scenarios.append(params)
+    return scenarios, bad_rows
@@ -0,0 +1,221 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from typing import NamedTuple
+
+# Deck kinds: the analyzer mode whose inputs a deck holds
+LEASE = "lease"
+PURCHASE = "purchase"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    id       INTEGER PRIMARY KEY,
+    kind     TEXT NOT NULL,
+    name     TEXT NOT NULL,
+    version  INTEGER NOT NULL,
+    client   TEXT NOT NULL DEFAULT '',
+    building TEXT NOT NULL DEFAULT '',
+    saved_at TEXT NOT NULL,
+    options  INTEGER NOT NULL,
+    UNIQUE (kind, name, version)
+);
+CREATE INDEX IF NOT EXISTS decks_name     ON decks (name, version);
+CREATE INDEX IF NOT EXISTS decks_client   ON decks (client, saved_at);
+CREATE INDEX IF NOT EXISTS decks_building ON decks (building, saved_at);
+CREATE INDEX IF NOT EXISTS decks_saved_at ON decks (saved_at);
+CREATE TABLE IF NOT EXISTS options (
+    deck_id  INTEGER NOT NULL REFERENCES decks (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name     TEXT NOT NULL,
+    inputs   TEXT NOT NULL,
+    PRIMARY KEY (deck_id, position)
+);
+CREATE INDEX IF NOT EXISTS options_name ON options (name);
+"""
+
+_DECK_COLUMNS = "d.kind, d.name, d.version, d.client, d.building, d.saved_at, d.options"
+
+
+class DeckInfo(NamedTuple):
+    """
+    One saved version of a deck, without its inputs.
+
+    Attributes:
+        kind: ``LEASE`` or ``PURCHASE``
+        name: Deck name; saving under a name again adds a version
+        version: 1 for the first save of ``name``, counting up
+        client: Client the deck was prepared for
+        building: Building or property the deck is about
+        saved_at: When this version was saved (ISO 8601, UTC)
+        options: Number of scenarios in the deck
+    """
+    kind: str
+    name: str
+    version: int
+    client: str
+    building: str
+    saved_at: str
+    options: int
+
+
+class Deck(NamedTuple):
+    """A saved deck: its ``DeckInfo`` and each scenario's input values, in order."""
+    info: DeckInfo
+    options: list
+
+
+def _encode(value):
+    if isinstance(value, (date, datetime)):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"cannot store {type(value).__name__} input values")
+
+
+def _decode(obj):
+    if obj.keys() == {"$date"}:
+        text = obj["$date"]
+        return datetime.fromisoformat(text) if "T" in text else date.fromisoformat(text)
+    return obj
+
+
+class ScenarioStore:
+    """
+    Saved scenario decks in a local SQLite file.
+
+    A deck is the inputs of every scenario on the Inputs tab at save time,
+    one row per scenario, stored under a name with the client and building
+    it was prepared for. Saving a name again adds a new version; older
+    versions stay loadable. Decks are indexed by name, client, building and
+    save date, and a whole deck loads in one query.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def save(self, kind, name, options, client="", building="", saved_at=None, name_key="name"):
+        """
+        Save ``options`` as the next version of deck ``name``.
+
+        Args:
+            kind (str): ``LEASE`` or ``PURCHASE``
+            name (str): Deck name
+            options (list): One dict of input values per scenario; values
+                are JSON types, dates or datetimes
+            client (str): Client the deck is for
+            building (str): Building or property the deck is about
+            saved_at (datetime): Save time; default now (UTC)
+            name_key (str): Entry of each option holding the scenario's name
+
+        Returns:
+            DeckInfo: The saved version
+        """
+        if not name:
+            raise ValueError("a deck needs a name")
+        saved_at = (saved_at or datetime.now(timezone.utc).replace(tzinfo=None)).isoformat(timespec="seconds")
+        rows = [(position, str(option.get(name_key, "")), json.dumps(option, default=_encode))
+                for position, option in enumerate(options)]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                version = conn.execute(
+                    "SELECT COALESCE(MAX(version), 0) + 1 FROM decks WHERE kind = ? AND name = ?",
+                    (kind, name)).fetchone()[0]
+                deck_id = conn.execute(
+                    "INSERT INTO decks (kind, name, version, client, building, saved_at, options)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (kind, name, version, client, building, saved_at, len(rows))).lastrowid
+                conn.executemany("INSERT INTO options (deck_id, position, name, inputs) VALUES (?, ?, ?, ?)",
+                                 [(deck_id, *row) for row in rows])
+        return DeckInfo(kind, name, version, client, building, saved_at, len(rows))
+
+    def load(self, kind, name, version=None):
+        """
+        Load every scenario of a deck in one query.
+
+        Args:
+            kind (str): ``LEASE`` or ``PURCHASE``
+            name (str): Deck name
+            version (int): Version to load; default the latest
+
+        Returns:
+            Deck: The deck, or None if there is no such deck or version
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {_DECK_COLUMNS}, o.inputs FROM decks d"
+                " LEFT JOIN options o ON o.deck_id = d.id"
+                " WHERE d.kind = ? AND d.name = ? AND d.version = COALESCE(?,"
+                "  (SELECT MAX(version) FROM decks WHERE kind = d.kind AND name = d.name))"
+                " ORDER BY o.position",
+                (kind, name, version)).fetchall()
+        if not rows:
+            return None
+        options = [json.loads(row[-1], object_hook=_decode) for row in rows if row[-1] is not None]
+        return Deck(DeckInfo(*rows[0][:-1]), options)
+
+    def find(self, kind=None, name=None, client=None, building=None, since=None, until=None,
+             all_versions=False):
+        """
+        Saved decks matching every given filter, newest first.
+
+        Args:
+            kind (str): ``LEASE`` or ``PURCHASE``
+            name, client, building (str): Exact matches
+            since, until (date or datetime): Saved on or after / before
+            all_versions (bool): List every version, not just each deck's latest
+
+        Returns:
+            list: ``DeckInfo`` per match
+        """
+        where, args = [], []
+        for column, value in (("kind", kind), ("name", name), ("client", client), ("building", building)):
+            if value is not None:
+                where.append(f"d.{column} = ?")
+                args.append(value)
+        if since is not None:
+            where.append("d.saved_at >= ?")
+            args.append(since.isoformat())
+        if until is not None:
+            where.append("d.saved_at < ?")
+            args.append(until.isoformat())
+        if not all_versions:
+            where.append("d.version = (SELECT MAX(version) FROM decks WHERE kind = d.kind AND name = d.name)")
+        sql = f"SELECT {_DECK_COLUMNS} FROM decks d"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            rows = self._connect().execute(sql + " ORDER BY d.saved_at DESC, d.version DESC", args).fetchall()
+        return [DeckInfo(*row) for row in rows]
+
+    def delete(self, kind, name, version=None):
+        """Delete one version of a deck, or every version; returns how many were deleted."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute(
+                    "DELETE FROM decks WHERE kind = ? AND name = ? AND (? IS NULL OR version = ?)",
+                    (kind, name, version, version)).rowcount
+
+
+def default_store_path():
+    """``$LEASE_ANALYZER_STORE``, or ``scenarios.sqlite`` in the user's data directory."""
+    return os.environ.get("LEASE_ANALYZER_STORE") or os.path.join(
+        os.path.expanduser("~"), ".local", "share", "lease_analyzer", "scenarios.sqlite")
+
+
+# Shared by every session in the process (the file is opened on first use);
+# lives in an imported module so it survives Streamlit reruns of the page script.
+scenario_store = ScenarioStore(default_store_path())
@@ -0,0 +1,157 @@
+import contextvars
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+from typing import NamedTuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Log level (e.g. INFO) that turns on JSON stage timing logs on stderr
+LOG_ENV = "LEASE_ANALYZER_LOG"
+# Stage fields that split the per-stage totals, e.g. the rent schedule's Styler from the others
+GROUP_FIELDS = ("table", "chart")
+
+_current = contextvars.ContextVar("lease_analyzer_timings", default=None)
+
+
+class StageTiming(NamedTuple):
+    """One timed stage: its name, wall time in seconds and any context fields."""
+    stage: str
+    seconds: float
+    fields: dict
+
+
+class Timings:
+    """
+    Stage timings collected over one run, e.g. one Streamlit rerun.
+
+    Attributes:
+        run (str): Run id, repeated in every log record of the run
+        stages (list): ``StageTiming`` per finished stage, in finishing order
+    """
+
+    def __init__(self, name="run"):
+        self.name = name
+        self.run = uuid.uuid4().hex[:12]
+        self.stages = []
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        """Seconds since the run started."""
+        return time.perf_counter() - self.started
+
+    def to_frame(self):
+        """One row per finished stage, with its context fields as columns."""
+        return pd.DataFrame([{"Stage": t.stage, "ms": t.seconds * 1000, **t.fields}
+                             for t in self.stages])
+
+    def totals(self):
+        """Calls, total and slowest milliseconds per stage and table/chart, slowest total first."""
+        frame = self.to_frame()
+        if frame.empty:
+            return pd.DataFrame(columns=["Stage", "Calls", "Total ms", "Max ms"])
+        keys = ["Stage"] + [field for field in GROUP_FIELDS if field in frame]
+        grouped = frame.fillna({field: "" for field in keys}).groupby(keys)["ms"]
+        return (pd.DataFrame({"Calls": grouped.size(), "Total ms": grouped.sum(), "Max ms": grouped.max()})
+                .sort_values("Total ms", ascending=False)
+                .reset_index())
+
+
+def start_run(name="run"):
+    """Start collecting stage timings for a new run in this context; returns its ``Timings``."""
+    timings = Timings(name)
+    _current.set(timings)
+    return timings
+
+
+def current_timings():
+    """The ``Timings`` of the run in progress, or None outside ``start_run``."""
+    return _current.get()
+
+
+@contextmanager
+def stage(name, **fields):
+    """
+    Time the enclosed block as stage ``name``.
+
+    The timing is added to the current run (see ``start_run``) and logged at
+    INFO on ``lease_analysis.utils.timing`` with the run id and ``fields``,
+    whether or not the block raises.
+
+    Args:
+        name (str): Stage name, dotted by kind, e.g. "compute.analyze_lease"
+        **fields: Context to log with the timing, e.g. ``scenario="Option 1"``
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        timings = _current.get()
+        if timings is not None:
+            timings.stages.append(StageTiming(name, seconds, fields))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s took %.1f ms", name, seconds * 1000, extra={"fields": {
+                "run": timings.run if timings else None, "stage": name,
+                "elapsed_ms": round(seconds * 1000, 3), **fields}})
+
+
+def timed(name=None):
+    """Decorator timing every call as ``stage(name)`` (default: the function's qualified name)."""
+    def decorate(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a log record as one JSON object per line, merging its ``fields`` extra."""
+
+    def format(self, record):
+        entry = {
+            "time":    self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level":   record.levelname,
+            "logger":  record.name,
+            "message": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level=None):
+    """
+    Send the package's logs to stderr as JSON lines.
+
+    Does nothing unless ``level`` or ``$LEASE_ANALYZER_LOG`` names a level;
+    safe to call on every Streamlit rerun.
+
+    Args:
+        level (str): Logging level name, e.g. "INFO"
+
+    Returns:
+        logging.Logger: The configured ``lease_analysis`` logger, or None
+    """
+    level = level or os.environ.get(LOG_ENV)
+    if not level:
+        return None
+    package = logging.getLogger("lease_analysis")
+    package.setLevel(level.upper())
+    if not any(isinstance(h.formatter, JsonFormatter) for h in package.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        package.addHandler(handler)
+    return package
@@ -58,23 +58,23 @@ def create_metric_section(summary_dict, lease_type):
     Create a section of metrics in the UI.
     
     Args:
-        summary_dict (dict): Dictionary containing lease summary metrics
+        summary_dict (Summary): Lease summary metrics (see ``lease_engine.analyze_lease``)
         lease_type (str): Type of lease (Triple Net or Full Service)
     """
     left, right = st.columns([1, 1])
     
     with left:
         st.markdown(explain("**Total Cost**", "Total cost over the lease term."), unsafe_allow_html=True)
-        st.metric("", summary_dict["Total Cost"])
+        st.metric("", summary_dict.display("Total Cost"))
         
         st.markdown(explain("**Avg Eff. Rent**", "Effective gross rent per SF per year, averaged across full years."), unsafe_allow_html=True)
-        st.metric("", summary_dict["Avg Eff. Rent"])
+        st.metric("", summary_dict.display("Avg Eff. Rent"))
         
         st.markdown(explain("**Payback**", "Months to recoup total credits (TI, additional, abatement) via rent."), unsafe_allow_html=True)
-        st.metric("", summary_dict["Payback"])
+        st.metric("", summary_dict.display("Payback"))
         
         st.markdown(explain("**Construction Cost**", "Total construction cost based on $/SF input."), unsafe_allow_html=True)
-        st.metric("", summary_dict["Construction Cost"])
+        st.metric("", summary_dict.display("Construction Cost"))
         
         st.markdown(explain("**Lease Type**", "Gross (Full Service) or NNN (Triple Net)"), unsafe_allow_html=True)
         st.metric("", lease_type)
@@ -82,13 +82,33 @@ def create_metric_section(summary_dict, lease_type):
     with right:
         npv_label = next(k for k in summary_dict if k.startswith("NPV"))
         st.markdown(explain(f"**{npv_label}**", "Net present value of net cash flows using the given discount rate."), unsafe_allow_html=True)
-        st.metric("", summary_dict[npv_label])
+        st.metric("", summary_dict.display(npv_label))
         
         st.markdown(explain("**TI Allowance**", "Total tenant improvement allowance (TI $/SF × SF)."), unsafe_allow_html=True)
-        st.metric("", summary_dict["TI Allowance"])
+        st.metric("", summary_dict.display("TI Allowance"))
         
         st.markdown(explain("**Moving Exp**", "Moving cost calculated as $/SF × SF."), unsafe_allow_html=True)
-        st.metric("", summary_dict["Moving Exp"])
+        st.metric("", summary_dict.display("Moving Exp"))
         
         st.markdown(explain("**Additional Credit**", "Other landlord incentives such as cash allowances or early occupancy."), unsafe_allow_html=True)
-        st.metric("", summary_dict["Additional Credit"]) 
\ No newline at end of file
+        st.metric("", summary_dict.display("Additional Credit"))
+
+
+def render_diagnostics(timings):
+    """
+    Show a run's stage timings in a collapsed "Diagnostics" sidebar expander.
+
+    Call it last in the script so every stage of the rerun has finished.
+
+    Args:
+        timings (Timings): The run's timings (see ``lease_analysis.utils.timing``)
+    """
+    with st.sidebar.expander("🩺 Diagnostics", expanded=False):
+        if timings is None or not timings.stages:
+            st.caption("No stages were timed in this run.")
+            return
+        st.caption(f"Run {timings.run}: {timings.elapsed * 1000:,.0f} ms")
+        st.dataframe(timings.totals().round(1), hide_index=True, use_container_width=True)
+        slowest = timings.to_frame().nlargest(10, "ms").round(1)
+        st.markdown("**Slowest calls**")
+        st.dataframe(slowest, hide_index=True, use_container_width=True)
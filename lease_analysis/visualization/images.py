@@ -0,0 +1,92 @@
+import hashlib
+import io
+import zlib
+
+from lease_analysis.engine.cache import ResultCache
+from lease_analysis.utils.timing import stage
+
+# Size charts are rasterized at for reports, in pixels
+CHART_WIDTH = 700
+CHART_HEIGHT = 400
+
+# Rendered report images, keyed on the figure's content: the same chart of
+# the same result is rasterized once per process, however many reports use it
+chart_cache = ResultCache(max_bytes=128 * 1024 * 1024)
+
+
+def figure_key(fig, width=CHART_WIDTH, height=CHART_HEIGHT):
+    """Hash of a plotly figure's full spec (data and layout) at a render size."""
+    spec = fig.to_json()
+    return hashlib.sha256(f"{width}x{height}:{spec}".encode("utf-8")).hexdigest()
+
+
+def png_image(png):
+    """
+    Decode PNG bytes into an image FPDF can embed without reading a file.
+
+    Transparency is flattened onto white, as it prints.
+
+    Args:
+        png (bytes): PNG file contents
+
+    Returns:
+        dict: FPDF image info (size, colour space and Flate-compressed RGB samples)
+    """
+    from PIL import Image
+    with Image.open(io.BytesIO(png)) as img:
+        if img.mode in ("RGBA", "LA", "P"):
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, "white")
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            img = img.convert("RGB")
+        return {"w": img.width, "h": img.height, "cs": "DeviceRGB", "bpc": 8,
+                "f": "FlateDecode", "pal": "", "trns": "", "data": zlib.compress(img.tobytes(), 6)}
+
+
+def chart_image(fig, width=CHART_WIDTH, height=CHART_HEIGHT):
+    """
+    A plotly figure as an embeddable image, rendered once per figure content.
+
+    Rasterizing needs Kaleido; cache hits do not.
+
+    Args:
+        fig (plotly.graph_objects.Figure): Chart to render
+        width (int): Render width in pixels
+        height (int): Render height in pixels
+
+    Returns:
+        tuple: ``(key, image)`` -- the content hash and the ``png_image`` info
+    """
+    key = figure_key(fig, width, height)
+    image = chart_cache.get(key)
+    if image is None:
+        with stage("export.chart_image", width=width, height=height):
+            image = png_image(fig.to_image(format="png", width=width, height=height))
+        chart_cache.put(key, image)
+    return key, image
+
+
+def embed_image(pdf, key, image, x=None, y=None, w=0, h=0):
+    """
+    Place an in-memory image on an FPDF page, as ``pdf.image`` does for files.
+
+    An image embedded twice in one document is stored once.
+
+    Args:
+        pdf (fpdf.FPDF): Document to draw on
+        key (str): Identifies the image within the document
+        image (dict): ``png_image`` info
+        x, y, w, h: Position and size, as for ``FPDF.image``
+    """
+    name = f"memory:{key}"
+    if name not in pdf.images:
+        # FPDF drops the samples once the document is written, so give it a copy
+        pdf.images[name] = dict(image, i=len(pdf.images) + 1)
+    pdf.image(name, x=x, y=y, w=w, h=h)
+
+
+def embed_chart(pdf, fig, w=0, h=0, width=CHART_WIDTH, height=CHART_HEIGHT):
+    """Render ``fig`` (cached, see ``chart_image``) and place it at the current position."""
+    key, image = chart_image(fig, width, height)
+    embed_image(pdf, key, image, w=w, h=h)
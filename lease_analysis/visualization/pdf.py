@@ -1,9 +1,10 @@
 from fpdf import FPDF
-import tempfile
-from PIL import Image
 import plotly.graph_objects as go
 import pandas as pd
 
+from lease_analysis.engine.summary import format_summary
+from lease_analysis.visualization.images import embed_chart
+
 class LeaseReportPDF(FPDF):
     """Custom PDF class for generating lease analysis reports."""
     
@@ -24,9 +25,9 @@ class LeaseReportPDF(FPDF):
         col_width = self.w / 2
         self.ln(5)
         
-        for key, value in summary_dict.items():
+        for key, value in format_summary(summary_dict).items():
             self.cell(col_width, 8, str(key), border=1)
-            self.cell(col_width, 8, str(value), border=1)
+            self.cell(col_width, 8, value, border=1)
             self.ln()
     
     def add_chart(self, fig, title):
@@ -35,10 +36,8 @@ class LeaseReportPDF(FPDF):
         self.set_font("Arial", 'B', 12)
         self.cell(0, 10, title, ln=True)
         
-        # Save chart to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            fig.write_image(tmp.name, format="png", width=700, height=400)
-            self.image(tmp.name, w=self.w - 30)
+        # Rendered once per figure and embedded from memory
+        embed_chart(self, fig, w=self.w - 30)
     
     def add_cash_flow_table(self, cash_flow_df):
         """Add a cash flow table to the PDF."""
@@ -111,22 +111,14 @@ def create_purchase_comparison_chart(results):
     # Extract metrics for comparison
     metrics = []
     for idx, (p, s, wf) in enumerate(results):
-        # Extract numeric values
-        total_return = float(s["Total Return"].replace("$", "").replace(",", ""))
-        npv = float(s[f"NPV ({p['discount_rate']:.2f}%)"].replace("$", "").replace(",", ""))
-        irr = float(s["IRR"].replace("%", ""))
-        roi = float(s["ROI"].replace("%", ""))
-        cap_rate = float(s["Cap Rate"].replace("%", ""))
-        coc_return = float(s["Cash-on-Cash"].replace("%", ""))
-        
         metrics.append({
             "Scenario": s["Option"],
-            "Total Return": total_return,
-            "NPV": npv,
-            "IRR": irr,
-            "ROI": roi,
-            "Cap Rate": cap_rate,
-            "Cash-on-Cash": coc_return
+            "Total Return": s["Total Return"],
+            "NPV": s[f"NPV ({p['discount_rate']:.2f}%)"],
+            "IRR": s["IRR"],
+            "ROI": s["ROI"],
+            "Cap Rate": s["Cap Rate"],
+            "Cash-on-Cash": s["Cash-on-Cash"]
         })
     
     # Create DataFrame
@@ -184,24 +176,21 @@ def create_lease_vs_purchase_chart(lease_results, purchase_results):
     # Process lease results
     lease_metrics = []
     for p, s, wf in lease_results:
-        total_cost = float(s["Total Cost"].replace("$", "").replace(",", ""))
-        npv = float(s[f"NPV ({p['disc']:.2f}%)"].replace("$", "").replace(",", ""))
+        npv_key = next(k for k in s if k.startswith("NPV"))
         lease_metrics.append({
             "Scenario": f"Lease: {s['Option']}",
-            "Total Cost": total_cost,
-            "NPV": npv,
+            "Total Cost": s["Total Cost"],
+            "NPV": s[npv_key],
             "Type": "Lease"
         })
     
     # Process purchase results
     purchase_metrics = []
     for p, s, wf in purchase_results:
-        total_investment = float(s["Total Investment"].replace("$", "").replace(",", ""))
-        npv = float(s[f"NPV ({p['discount_rate']:.2f}%)"].replace("$", "").replace(",", ""))
         purchase_metrics.append({
             "Scenario": f"Purchase: {s['Option']}",
-            "Total Investment": total_investment,
-            "NPV": npv,
+            "Total Investment": s["Total Investment"],
+            "NPV": s[f"NPV ({p['discount_rate']:.2f}%)"],
             "Type": "Purchase"
         })
     
@@ -0,0 +1,3 @@
+"""
+Lease web app (lease_web_app.py): headless analysis functions and page sections.
+"""
@@ -0,0 +1,289 @@
+import numpy as np
+import pandas as pd
+
+from lease_analysis.engine import lease as lease_engine
+from lease_analysis.engine import returns
+from lease_analysis.engine.amortization import payment
+from lease_analysis.engine.cache import memoize
+from lease_analysis.engine.goalseek import breakeven
+from lease_analysis.engine.summary import CURRENCY, PERCENT, TEXT, YEARS, Summary
+
+
+def analyze_lease(p):
+    """Analyze a lease scenario; see lease_analysis.engine.lease for the math."""
+    return lease_engine.analyze_lease(p)
+
+
+@memoize
+def solve_breakeven(p, other, variable):
+    """
+    Goal seek between two lease scenarios, memoized so reruns don't re-solve.
+
+    Args:
+        p: Lease parameters to adjust
+        other: Lease parameters whose NPV ``p`` should match
+        variable (str): Input of ``p`` to solve for, see ``engine.goalseek``
+
+    Returns:
+        tuple: ``(value, converged, achieved_npv)``; value is fractional for
+            free months
+    """
+    solved = breakeven(p, other, variable)
+    return float(solved.value[0]), bool(solved.converged[0]), float(solved.achieved[0])
+
+
+def analyze_purchase_vs_lease(purchase_params, lease_scenario, analysis_period):
+    """
+    Analyze purchase vs lease comparison
+    
+    Args:
+        purchase_params: dict with purchase parameters
+        lease_scenario: existing lease analysis results
+        analysis_period: number of years to analyze
+    
+    Returns:
+        dict with comparison results and DataFrames
+    """
+    # Extract purchase parameters
+    purchase_price = purchase_params['purchase_price']
+    down_payment_pct = purchase_params['down_payment_pct']
+    mortgage_rate = purchase_params['mortgage_rate']
+    mortgage_term = purchase_params['mortgage_term']
+    property_tax_rate = purchase_params['property_tax_rate']
+    insurance_rate = purchase_params['insurance_rate']
+    maintenance_rate = purchase_params['maintenance_rate']
+    appreciation_rate = purchase_params['appreciation_rate']
+    discount_rate = purchase_params['discount_rate']
+    
+    # Calculate mortgage details
+    down_payment = purchase_price * (down_payment_pct / 100)
+    loan_amount = purchase_price - down_payment
+    
+    # Calculate monthly mortgage payment
+    monthly_payment = payment(loan_amount, mortgage_rate, mortgage_term * 12) if loan_amount > 0 else 0
+    
+    annual_mortgage = monthly_payment * 12
+    
+    # Initialize cash flow arrays
+    purchase_cash_flows = []
+    lease_cash_flows = []
+    purchase_rows = []
+    lease_rows = []
+    
+    # Calculate purchase cash flows
+    for year in range(1, analysis_period + 1):
+        # Property value with appreciation
+        property_value = purchase_price * (1 + appreciation_rate/100)**year
+        
+        # Annual costs
+        property_tax = property_value * (property_tax_rate / 100)
+        insurance = property_value * (insurance_rate / 100)
+        maintenance = property_value * (maintenance_rate / 100)
+        
+        # Mortgage payment (only for mortgage term years)
+        mortgage_payment = annual_mortgage if year <= mortgage_term else 0
+        
+        # Total annual cost
+        total_cost = mortgage_payment + property_tax + insurance + maintenance
+        
+        # Cash flow (negative for costs)
+        cash_flow = -total_cost
+        
+        # Add to arrays
+        purchase_cash_flows.append(cash_flow)
+        purchase_rows.append({
+            "Year": year,
+            "Property Value": property_value,
+            "Mortgage Payment": mortgage_payment,
+            "Property Tax": property_tax,
+            "Insurance": insurance,
+            "Maintenance": maintenance,
+            "Total Cost": total_cost,
+            "Cash Flow": cash_flow
+        })
+    
+    # Calculate lease cash flows (use existing lease analysis)
+    lease_summary, lease_waterfall = lease_scenario
+    
+    # Extract lease cash flows from the waterfall
+    if 'Net CF' in lease_waterfall.columns:
+        lease_cash_flows = lease_waterfall['Net CF'].tolist()
+        # Extend to analysis period if needed
+        while len(lease_cash_flows) < analysis_period:
+            # Use the last year's cash flow for remaining years
+            lease_cash_flows.append(lease_cash_flows[-1] if lease_cash_flows else 0)
+        lease_cash_flows = lease_cash_flows[:analysis_period]
+    else:
+        lease_cash_flows = [0] * analysis_period
+    
+    # Create lease rows for comparison
+    for year in range(1, analysis_period + 1):
+        if year <= len(lease_waterfall):
+            row = lease_waterfall.iloc[year-1]
+            lease_rows.append({
+                "Year": year,
+                "Period": row.get("Period", f"Year {year}"),
+                "Base Rent": row.get('Base Cost', 0),
+                "OpEx": row.get('Opex Cost', 0),
+                "Parking": row.get('Parking Exp', 0),
+                "Abatement": abs(row.get('Rent Abatement', 0)),
+                "Net CF": row.get('Net CF', 0)
+            })
+        else:
+            # Extend with last year's values
+            lease_rows.append({
+                "Year": year,
+                "Period": f"Year {year}",
+                "Base Rent": 0,
+                "OpEx": 0,
+                "Parking": 0,
+                "Abatement": 0,
+                "Net CF": 0
+            })
+    
+    # Calculate financial metrics
+    # Purchase metrics
+    total_purchase_cost = sum(abs(cf) for cf in purchase_cash_flows)
+    purchase_npv = lease_engine.npv(discount_rate/100, purchase_cash_flows)
+    
+    # Lease metrics
+    total_lease_cost = sum(abs(cf) for cf in lease_cash_flows)
+    lease_npv = lease_engine.npv(discount_rate/100, lease_cash_flows)
+    
+    # Equity at end of analysis period
+    final_property_value = purchase_price * (1 + appreciation_rate/100)**analysis_period
+    remaining_loan = 0  # Simplified - assume loan is paid off
+    equity = final_property_value - remaining_loan
+    
+    # Net purchase position (including equity)
+    net_purchase_position = purchase_npv + equity
+    
+    # Comparison summary
+    comparison_summary = Summary([
+        ("Analysis Period", analysis_period, YEARS),
+        ("Purchase Price", purchase_price, CURRENCY),
+        ("Down Payment", down_payment, CURRENCY),
+        ("Loan Amount", loan_amount, CURRENCY),
+        ("Monthly Payment", monthly_payment, CURRENCY),
+        ("Total Purchase Cost", total_purchase_cost, CURRENCY),
+        ("Purchase NPV", abs(purchase_npv), CURRENCY),
+        ("Final Property Value", final_property_value, CURRENCY),
+        ("Equity", equity, CURRENCY),
+        ("Net Purchase Position", net_purchase_position, CURRENCY),
+        ("Total Lease Cost", total_lease_cost, CURRENCY),
+        ("Lease NPV", abs(lease_npv), CURRENCY),
+        ("Difference (Purchase - Lease)", net_purchase_position - lease_npv, CURRENCY),
+        ("Recommendation", "Purchase" if net_purchase_position < lease_npv else "Lease", TEXT),
+    ])
+    
+    return {
+        'summary': comparison_summary,
+        'purchase_df': pd.DataFrame(purchase_rows),
+        'lease_df': pd.DataFrame(lease_rows),
+        'purchase_cash_flows': purchase_cash_flows,
+        'lease_cash_flows': lease_cash_flows
+    }
+
+
+@memoize
+def analyze_purchase(p):
+    """
+    Analyze a purchase scenario
+    
+    Args:
+        p: dict with purchase parameters
+    
+    Returns:
+        dict with summary and DataFrame
+    """
+    # Extract parameters
+    purchase_price = p["purchase_price"]
+    down_payment_pct = p["down_payment_pct"]
+    mortgage_rate = p["mortgage_rate"]
+    mortgage_term = p["mortgage_term"]
+    property_tax_rate = p["property_tax_rate"]
+    insurance_rate = p["insurance_rate"]
+    maintenance_rate = p["maintenance_rate"]
+    appreciation_rate = p["appreciation_rate"]
+    analysis_period = p["analysis_period"]
+    discount_rate = p["discount_rate"]
+    
+    # Calculate mortgage details
+    down_payment = purchase_price * (down_payment_pct / 100)
+    loan_amount = purchase_price - down_payment
+    
+    # Calculate monthly mortgage payment
+    monthly_payment = payment(loan_amount, mortgage_rate, mortgage_term * 12) if loan_amount > 0 else 0
+    
+    annual_mortgage = monthly_payment * 12
+    
+    # Initialize arrays
+    cash_flows = []
+    rows = []
+    
+    # Calculate cash flows for each year
+    for year in range(1, analysis_period + 1):
+        # Property value with appreciation
+        property_value = purchase_price * (1 + appreciation_rate/100)**year
+        
+        # Annual costs
+        property_tax = property_value * (property_tax_rate / 100)
+        insurance = property_value * (insurance_rate / 100)
+        maintenance = property_value * (maintenance_rate / 100)
+        
+        # Mortgage payment (only for mortgage term years)
+        mortgage_payment = annual_mortgage if year <= mortgage_term else 0
+        
+        # Total annual cost
+        total_cost = mortgage_payment + property_tax + insurance + maintenance
+        
+        # Cash flow (negative for costs)
+        cash_flow = -total_cost
+        
+        # Add to arrays
+        cash_flows.append(cash_flow)
+        rows.append({
+            "Year": year,
+            "Property Value": property_value,
+            "Mortgage Payment": mortgage_payment,
+            "Property Tax": property_tax,
+            "Insurance": insurance,
+            "Maintenance": maintenance,
+            "Total Cost": total_cost,
+            "Cash Flow": cash_flow
+        })
+    
+    # Calculate financial metrics
+    total_cost = sum(abs(cf) for cf in cash_flows)
+    npv = lease_engine.npv(discount_rate/100, cash_flows)
+    
+    # Equity at end of analysis period
+    final_property_value = purchase_price * (1 + appreciation_rate/100)**analysis_period
+    remaining_loan = 0  # Simplified - assume loan is paid off
+    equity = final_property_value - remaining_loan
+    
+    # Net position (including equity)
+    net_position = npv + equity
+    
+    # Calculate IRR; None (shown as N/A) when no rate solves the cash flows
+    irr = returns.irr(cash_flows) * 100 if len(cash_flows) > 1 else None
+    if irr is not None and np.isnan(irr):
+        irr = None
+    
+    # Summary
+    summary = Summary([
+        ("Option", p["name"], TEXT),
+        ("Purchase Price", purchase_price, CURRENCY),
+        ("Down Payment", down_payment, CURRENCY),
+        ("Loan Amount", loan_amount, CURRENCY),
+        ("Monthly Payment", monthly_payment, CURRENCY),
+        ("Analysis Period", analysis_period, YEARS),
+        ("Total Cost", total_cost, CURRENCY),
+        ("NPV", abs(npv), CURRENCY),
+        ("Final Property Value", final_property_value, CURRENCY),
+        ("Equity", equity, CURRENCY),
+        ("Net Position", net_position, CURRENCY),
+        ("IRR", irr, PERCENT),
+    ])
+    
+    return summary, pd.DataFrame(rows)
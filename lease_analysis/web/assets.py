@@ -0,0 +1,21 @@
+import os
+
+# Repository root, where the app's image assets live
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Function to get asset path
+def get_asset_path(filename):
+    try:
+        # Check if running on Streamlit Cloud
+        if os.getenv('STREAMLIT_SHARING') or os.getenv('STREAMLIT_SERVER_URL'):
+            return os.path.join(ROOT, filename)
+        return filename
+    except Exception:
+        return filename
+
+
+# Load logo safely; st.image reads the file itself, so PIL is not needed here
+def load_logo():
+    logo_path = get_asset_path("savills_logo.png")
+    return logo_path if os.path.exists(logo_path) else None
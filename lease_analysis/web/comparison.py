@@ -0,0 +1,116 @@
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+
+from lease_analysis.web.analysis import solve_breakeven
+from lease_analysis.web.exports import (
+    XLSX_MIME, comparison_excel, lease_comparison_pdf, purchase_comparison_pdf,
+)
+
+# Inputs the goal seek can solve for (TI is not part of this app's NPV)
+GOAL_SEEK_LABELS = {
+    "base": "Base Rent ($/SF/yr)",
+    "free": "Free Months",
+}
+# How each solved input is shown; the solver's free months are fractional
+GOAL_SEEK_FORMATS = {
+    "base": "${:,.2f}",
+    "free": "{:,.1f} (fractional months)",
+}
+
+
+def render_comparison_tab(mode):
+    """Render the side-by-side comparison and exports for the selected mode."""
+    if mode == "🏠 Buy Analyzer":
+        # Purchase Comparison
+        buy_results = st.session_state.get("buy_results", [])
+        if len(buy_results) < 2:
+            st.info("Configure & run ≥2 purchase scenarios to compare.")
+        else:
+            # Build comparison DataFrames for purchases: raw numbers for Excel, formatted for display
+            rows = [(r[1], {"Property Type": "Purchase"}) for r in buy_results]
+            raw_df = pd.DataFrame([{**s, **extra} for s, extra in rows])
+            df = pd.DataFrame([{**s.formatted(), **extra} for s, extra in rows])
+
+            st.markdown("## Purchase Comparison Summary")
+            st.dataframe(df, use_container_width=True)
+
+            # Excel export
+            if not df.empty:
+                # Built when clicked: every scenario's cash flows can make a large workbook
+                st.download_button("📥 Download Purchase Comparison Excel",
+                                   partial(comparison_excel, raw_df, buy_results),
+                                   file_name="purchase_comparison.xlsx", mime=XLSX_MIME)
+
+                # PDF export
+                if st.button("📄 Generate Purchase PDF Summary"):
+                    st.download_button("📥 Download Purchase PDF Summary",
+                                       data=purchase_comparison_pdf(df, buy_results),
+                                       file_name="Purchase_Summary.pdf", mime="application/pdf")
+            else:
+                st.info("No purchase data available for export.")
+    else:
+        # Original lease comparison
+        results = st.session_state.get("results", [])
+        if len(results) < 2:
+            st.info("Enable compare & run ≥2 scenarios.")
+        else:
+            # Build comparison DataFrames with Lease Type: raw numbers for Excel, formatted for display
+            rows = [(r[1], {"Lease Type": r[0].get("lease_type", "")}) for r in results]
+            raw_df = pd.DataFrame([{**s, **extra} for s, extra in rows])
+            df = pd.DataFrame([{**s.formatted(), **extra} for s, extra in rows])
+
+            st.markdown("## Comparison Summary")
+            st.dataframe(df, use_container_width=True)
+
+            with st.expander("🎯 Goal Seek", expanded=False):
+                names = [f"{i+1}. {r[1]['Option']}" for i, r in enumerate(results)]
+                gs1, gs2, gs3 = st.columns(3)
+                adjust = gs1.selectbox("Adjust scenario", range(len(names)), format_func=lambda i: names[i])
+                match = gs2.selectbox("To match the NPV of", range(len(names)), index=1,
+                                      format_func=lambda i: names[i])
+                variable = gs3.selectbox("By changing", list(GOAL_SEEK_LABELS),
+                                         format_func=lambda v: GOAL_SEEK_LABELS[v])
+                if adjust == match:
+                    st.info("Pick two different scenarios.")
+                else:
+                    # Solve only when asked; the answer stays up on later reruns
+                    if st.button("Solve", key="goal_seek_solve"):
+                        st.session_state["goal_seek"] = (adjust, match, variable)
+                    if st.session_state.get("goal_seek") == (adjust, match, variable):
+                        value, converged, achieved = solve_breakeven(results[adjust][0], results[match][0],
+                                                                     variable)
+                        if converged:
+                            st.success(f"{GOAL_SEEK_LABELS[variable]} of "
+                                       f"{GOAL_SEEK_FORMATS[variable].format(value)} gives {names[adjust]} "
+                                       f"the same NPV as {names[match]} (${achieved:,.0f}).")
+                        else:
+                            st.warning(f"No {GOAL_SEEK_LABELS[variable].lower()} in the search range "
+                                       f"matches {names[match]}'s NPV.")
+
+            # Excel export
+            if not df.empty:
+                # Built when clicked: annual and monthly cash flows of every scenario
+                st.download_button("📥 Download Comparison Excel",
+                                   partial(comparison_excel, raw_df, results, monthly=True),
+                                   file_name="comparison.xlsx", mime=XLSX_MIME)
+
+                # PDF export
+                if st.button("📄 Generate PDF Summary"):
+                    bar = st.progress(0.0, text="Rendering scenario pages...")
+
+                    def progress(done, total):
+                        bar.progress(done / total, text=f"Rendered {done} of {total} scenario pages")
+
+                    try:
+                        pdf_bytes = lease_comparison_pdf(df, results, progress=progress)
+                    except (ImportError, RuntimeError, ValueError):
+                        # Chart images need Kaleido; fall back to tables only
+                        st.warning("Chart export is unavailable; the PDF has tables only.")
+                        pdf_bytes = lease_comparison_pdf(df, results, charts=False, progress=progress)
+                    bar.empty()
+                    st.download_button("📥 Download PDF Summary", data=pdf_bytes,
+                                       file_name="Lease_Summary.pdf", mime="application/pdf")
+            else:
+                st.info("No data available for export.")
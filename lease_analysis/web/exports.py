@@ -0,0 +1,319 @@
+import io
+import numbers
+from functools import partial
+from typing import NamedTuple
+
+import pandas as pd
+
+from lease_analysis.engine.executor import map_threads
+from lease_analysis.engine.summary import format_summary
+from lease_analysis.utils.timing import stage, timed
+from lease_analysis.visualization.images import chart_image, embed_image
+from lease_analysis.web.assets import get_asset_path
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# Most threads rendering report pages at once. Kaleido 0.2 rasterizes one
+# chart at a time in its single subprocess, so charts do not overlap there
+MAX_REPORT_WORKERS = 8
+# Waterfall columns printed in reports as plain counts rather than dollars
+COUNT_COLUMNS = ("Year", "SF")
+
+# Monthly cash flow sheet columns: (header, monthly_schedule key, sign), signed
+# like the annual waterfall (costs positive, abatement and credits negative)
+MONTHLY_COLUMNS = [
+    ("SF",                "sqft",        1),
+    ("Base Rent",         "base_rent",   1),
+    ("Opex",              "opex",        1),
+    ("Parking Exp",       "parking",     1),
+    ("Rent Abatement",    "abatement",  -1),
+    ("TI Allowance",      "ti_credit",  -1),
+    ("Moving & FF&E",     "move_ffe",    1),
+    ("Additional Credit", "add_credit", -1),
+    ("Net Rent",          "net_rent",    1),
+    ("Net CF",            "net_cf",      1),
+]
+
+# Characters Excel does not allow in sheet names, and the longest name it allows
+_BAD_SHEET_CHARS = str.maketrans({c: "-" for c in "[]:*?/\\"})
+_SHEET_NAME_LEN = 31
+
+
+def _sheet_title(idx, name, kind):
+    suffix = f" {kind}"
+    label = f"{idx+1} {name}".translate(_BAD_SHEET_CHARS).strip("'")
+    return label[:_SHEET_NAME_LEN - len(suffix)].rstrip() + suffix
+
+
+def _append_frame(ws, df):
+    """Stream ``df`` into a write-only sheet: a header row, then its values (blank for NaN)."""
+    ws.freeze_panes = "A2"
+    ws.append([str(col) for col in df.columns])
+    values = df.astype(object)
+    for row in values.where(values.notna(), None).itertuples(index=False, name=None):
+        ws.append(row)
+
+
+def _append_monthly(ws, s, i, term):
+    ws.freeze_panes = "A2"
+    ws.append(["Month", "Date"] + [header for header, _, _ in MONTHLY_COLUMNS])
+    dates = s["date"][i, :term]
+    dates = [None] * term if pd.isna(dates).all() else pd.to_datetime(dates).date.tolist()
+    columns = [(sign * s[key][i, :term] + 0.0).tolist() for _, key, sign in MONTHLY_COLUMNS]
+    for k, row in enumerate(zip(dates, *columns)):
+        ws.append([k + 1, *row])
+
+
+@timed("export.excel")
+def comparison_excel(raw_df, results=(), monthly=False, path=None):
+    """
+    Comparison workbook: the summary table, then each scenario's cash flows.
+
+    Built with openpyxl's write-only workbook, which streams rows out sheet by
+    sheet instead of holding every cell, so memory stays flat however many
+    scenarios and months are exported. Numbers are written as numeric cells.
+
+    Args:
+        raw_df (pd.DataFrame): Comparison table with raw (unformatted) values
+        results (list): ``(params, summary, cash_flows)`` per scenario; each
+            gets an "Annual" sheet of its cash flow table
+        monthly (bool): Also write a "Monthly" sheet per scenario, from the
+            lease engine's calendar-month schedule (lease results only)
+        path (str): Save the workbook here instead of returning it
+
+    Returns:
+        bytes: The .xlsx file, or None when ``path`` is given
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    _append_frame(wb.create_sheet("Summary"), raw_df)
+
+    s = term = None
+    if monthly and results:
+        from lease_analysis.engine.lease import lease_inputs, stack_inputs
+        from lease_analysis.engine.monthly import monthly_schedule
+        b = stack_inputs([lease_inputs(r[0]) for r in results])
+        s = monthly_schedule(b)
+        term = b["term_mos"][:, 0]
+
+    for idx, (params, summary, cash_flows) in enumerate(results):
+        name = summary["Option"]
+        _append_frame(wb.create_sheet(_sheet_title(idx, name, "Annual")), cash_flows)
+        if s is not None:
+            _append_monthly(wb.create_sheet(_sheet_title(idx, name, "Monthly")), s, idx, int(term[idx]))
+
+    if path is not None:
+        wb.save(path)
+        return None
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def summary_excel(raw_df):
+    """Comparison table as an .xlsx workbook with one "Summary" sheet, as bytes."""
+    return comparison_excel(raw_df)
+
+
+def _text(value):
+    """``value`` as text FPDF's core fonts can encode (Latin-1)."""
+    return str(value).replace("\u2013", "-").encode("latin-1", "replace").decode("latin-1")
+
+
+def _add_logo(pdf):
+    try:
+        pdf.image(get_asset_path("savills_logo.png"), x=10, y=10, w=40)
+    except Exception:
+        # Continue without logo if not available
+        pass
+    pdf.ln(20)  # space below the logo
+
+
+def _summary_page(title, df):
+    """New FPDF document opening with ``title`` and the comparison table ``df``."""
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    _add_logo(pdf)
+
+    pdf.set_font("Arial", 'B', 16)
+    pdf.cell(0, 10, _text(title), ln=True)
+
+    pdf.set_font("Arial", '', 10)
+    col_width = pdf.w / (len(df.columns) + 1)
+    pdf.ln(5)
+    for col in df.columns:
+        pdf.cell(col_width, 8, _text(col), border=1)
+    pdf.ln()
+    for _, row in df.iterrows():
+        for val in row:
+            pdf.cell(col_width, 8, _text(val), border=1)
+        pdf.ln()
+    return pdf
+
+
+class ScenarioPage(NamedTuple):
+    """
+    One scenario's report page, rendered and ready to lay out.
+
+    Attributes:
+        heading: Page title
+        summary: "Label: value" summary lines
+        charts: ``(title, key, image)`` per chart, see ``chart_image``
+        columns: Cash flow table header; empty for no table
+        rows: Cash flow table cells, as text
+    """
+    heading: str
+    summary: list
+    charts: list = []
+    columns: list = []
+    rows: list = []
+
+
+def _summary_lines(summary):
+    return [_text(f"{k}: {v}") for k, v in format_summary(summary).items()]
+
+
+def _write_page(pdf, page):
+    pdf.add_page()
+    _add_logo(pdf)
+
+    pdf.set_font("Arial", 'B', 14)
+    pdf.cell(0, 10, _text(page.heading), ln=True)
+
+    pdf.set_font("Arial", '', 11)
+    for line in page.summary:
+        pdf.cell(0, 8, line, ln=True)
+
+    for title, key, image in page.charts:
+        pdf.ln(5)
+        pdf.set_font("Arial", 'B', 12)
+        pdf.cell(0, 10, title, ln=True)
+        embed_image(pdf, key, image, w=pdf.w - 30)
+
+    if page.columns:
+        pdf.ln(5)
+        pdf.set_font("Arial", 'B', 12)
+        pdf.cell(0, 10, "Annual Cash Flow Table", ln=True)
+        pdf.set_font("Arial", '', 8)
+        for col in page.columns:
+            pdf.cell(25, 6, col, border=1)
+        pdf.ln()
+        for row in page.rows:
+            for v in row:
+                pdf.cell(25, 6, v, border=1)
+            pdf.ln()
+
+
+def lease_charts(wf):
+    """The annual cost and net cash flow bar charts of one lease's waterfall."""
+    import plotly.graph_objects as go
+
+    # Annual Cost Breakdown Chart
+    cost_fig = go.Figure()
+    for name in ["Base Rent", "Opex", "Parking Exp"]:
+        if name in wf.columns:
+            cost_fig.add_trace(go.Bar(name=name, x=wf["Year"], y=wf[name]))
+    cost_fig.update_layout(
+        barmode="stack",
+        title="Annual Cost Breakdown",
+        xaxis_title="Year",
+        yaxis_title="Cost ($)",
+        margin=dict(t=30, b=30),
+        legend_title_text="Category"
+    )
+
+    # Net CF Breakdown Chart
+    netcf_fig = go.Figure()
+    netcf_fig.add_trace(go.Bar(name="Rent Abatement", x=wf["Year"], y=wf["Rent Abatement"]))
+    netcf_fig.add_trace(go.Bar(name="Net CF", x=wf["Year"], y=wf["Net Rent"]))
+    netcf_fig.update_layout(
+        barmode="relative",
+        title="Net Cash Flow",
+        xaxis_title="Year",
+        yaxis_title="Net Impact ($)",
+        margin=dict(t=30, b=30),
+        legend_title_text="Component"
+    )
+    return {"Annual Cost Breakdown": cost_fig, "Net Cash Flow Breakdown": netcf_fig}
+
+
+def _cell(val, col=None):
+    if not isinstance(val, numbers.Number):
+        return _text(val)[:15]
+    return (f"{int(val):,}" if col in COUNT_COLUMNS else f"${int(val):,}")[:15]
+
+
+def lease_page(item, charts=True):
+    """
+    Render one scenario's page of the lease comparison report.
+
+    Chart rasterizing and table formatting happen here, off the document,
+    so pages can be rendered on worker threads and laid out in order afterwards.
+
+    Args:
+        item (tuple): ``(index, (params, summary, waterfall))``
+        charts (bool): Render the cost and cash flow charts (needs Kaleido)
+
+    Returns:
+        ScenarioPage: The page's content
+    """
+    idx, (p, s, wf) = item
+    with stage("export.page", scenario=s["Option"]):
+        rendered = []
+        if charts:
+            rendered = [(title, *chart_image(fig)) for title, fig in lease_charts(wf).items()]
+        rows = [[_cell(val, col) for val, col in zip(row, wf.columns)] for row in wf.itertuples(index=False)]
+        return ScenarioPage(f"Scenario {idx+1}: {s['Option']}", _summary_lines(s), rendered,
+                            [_text(col)[:15] for col in wf.columns], rows)
+
+
+@timed("export.pdf")
+def lease_comparison_pdf(df, results, charts=True, workers=None, progress=None):
+    """
+    Lease comparison report: the summary table, then a page per scenario.
+
+    Scenario pages are rendered on a thread pool (``lease_page``) and laid
+    out in scenario order. Chart rasterizing still takes the sum of the
+    charts' times with Kaleido 0.2, which renders one image at a time.
+
+    Args:
+        df (pd.DataFrame): Formatted comparison table
+        results (list): ``(params, summary, waterfall)`` per scenario
+        charts (bool): Include each scenario's cost and cash flow charts;
+            rasterizing them needs Kaleido, and each chart is rendered once
+            per result (see ``lease_analysis.visualization.images``)
+        workers (int): Threads rendering pages; default one per scenario,
+            up to ``MAX_REPORT_WORKERS``
+        progress: Optional ``progress(done, total)``, called as pages finish
+
+    Returns:
+        bytes: The PDF document
+    """
+    if workers is None:
+        workers = min(len(results), MAX_REPORT_WORKERS)
+    pages = map_threads(partial(lease_page, charts=charts), list(enumerate(results)), workers, progress)
+    pdf = _summary_page("Lease Scenario Comparison Summary", df)
+    for page in pages:
+        _write_page(pdf, page)
+    return pdf.output(dest='S').encode('latin1')
+
+
+@timed("export.pdf")
+def purchase_comparison_pdf(df, buy_results):
+    """
+    Purchase comparison report: the summary table, then a page per scenario.
+
+    Args:
+        df (pd.DataFrame): Formatted comparison table
+        buy_results (list): ``(params, summary, cash_flows)`` per scenario
+
+    Returns:
+        bytes: The PDF document
+    """
+    pdf = _summary_page("Purchase Scenario Comparison Summary", df)
+    for idx, (buy_params, summary, waterfall) in enumerate(buy_results):
+        _write_page(pdf, ScenarioPage(f"Purchase Scenario {idx+1}: {summary['Option']}",
+                                      _summary_lines(summary)))
+    return pdf.output(dest='S').encode('latin1')
@@ -0,0 +1,499 @@
+from datetime import date
+
+import streamlit as st
+
+from lease_analysis.utils.timing import stage
+from lease_analysis.web.analysis import analyze_lease, analyze_purchase
+
+# Most scenarios per mode, so a saved 50-option deck loads in full
+MAX_SCENARIOS = 50
+
+# Widgets saved and restored with a deck (see ``sidebar``), by mode: the
+# scenario count widget, each scenario's widget keys (``f"{prefix}{i}"``) and
+# its per-year list widgets (``f"{prefix}_{i}_{year}"``)
+SCENARIO_WIDGETS = {
+    "lease": ("count", (
+        "name", "sd", "tm", "sq", "exp", "em", "es", "b", "ci", "r", "lt", "ox", "oi",
+        "fxp", "ps_unres", "pc_unres", "ps_res", "pc_res", "rt_unres", "pi",
+        "ccfx", "cc_tot", "cc", "mvfx", "mv_tot", "mv", "ffefx", "ffe_tot", "ffe",
+        "fr", "cab", "inside_term", "base_only", "tifx", "titot", "ti", "acfx", "ac_tot", "ac",
+        "dr", "cm", "io",
+    ), ("yrinc", "abate")),
+    "purchase": ("buy_count", (
+        "buy_name", "buy_price", "buy_down", "buy_rate", "buy_term", "buy_tax", "buy_ins",
+        "buy_maint", "buy_app", "buy_period", "buy_disc",
+    ), ()),
+}
+
+
+def render_inputs_tab(mode):
+    """Render the scenario input forms for the selected mode."""
+    if mode == "🏠 Buy Analyzer":
+        st.header("Configure Purchase Scenarios")
+        count = st.number_input("Number of Purchase Scenarios", 1, MAX_SCENARIOS, key="buy_count")
+        
+        buy_inputs = []
+        for i in range(int(count)):
+            with st.expander(f"Purchase Scenario {i+1}", expanded=(i==0)):
+                # Basic Information
+                name = st.text_input("Property Name", key=f"buy_name{i}")
+                if not name:
+                    name = f"Property {i+1}"
+                
+                # Property Details
+                st.markdown("#### Property Details")
+                purchase_price = st.number_input(
+                    "Purchase Price ($)", 
+                    min_value=100000, 
+                    max_value=50000000, 
+                    value=2000000, 
+                    step=50000,
+                    key=f"buy_price{i}"
+                )
+                
+                # Financing Details
+                st.markdown("#### Financing")
+                down_payment_pct = st.number_input(
+                    "Down Payment (%)", 
+                    min_value=5, 
+                    max_value=50, 
+                    value=20, 
+                    step=5,
+                    key=f"buy_down{i}"
+                )
+                
+                mortgage_rate = st.number_input(
+                    "Mortgage Rate (%)", 
+                    min_value=2.0, 
+                    max_value=10.0, 
+                    value=5.5, 
+                    step=0.1,
+                    key=f"buy_rate{i}"
+                )
+                
+                mortgage_term = st.number_input(
+                    "Mortgage Term (years)", 
+                    min_value=15, 
+                    max_value=30, 
+                    value=30, 
+                    step=5,
+                    key=f"buy_term{i}"
+                )
+                
+                # Property Costs
+                st.markdown("#### Property Costs")
+                property_tax_rate = st.number_input(
+                    "Property Tax Rate (%)", 
+                    min_value=0.5, 
+                    max_value=3.0, 
+                    value=1.2, 
+                    step=0.1,
+                    key=f"buy_tax{i}"
+                )
+                
+                insurance_rate = st.number_input(
+                    "Insurance Rate (%)", 
+                    min_value=0.2, 
+                    max_value=1.0, 
+                    value=0.5, 
+                    step=0.1,
+                    key=f"buy_ins{i}"
+                )
+                
+                maintenance_rate = st.number_input(
+                    "Annual Maintenance (% of value)", 
+                    min_value=0.5, 
+                    max_value=3.0, 
+                    value=1.0, 
+                    step=0.1,
+                    key=f"buy_maint{i}"
+                )
+                
+                # Investment Parameters
+                st.markdown("#### Investment Parameters")
+                appreciation_rate = st.number_input(
+                    "Annual Appreciation (%)", 
+                    min_value=0.0, 
+                    max_value=10.0, 
+                    value=3.0, 
+                    step=0.5,
+                    key=f"buy_app{i}"
+                )
+                
+                analysis_period = st.number_input(
+                    "Analysis Period (years)", 
+                    min_value=5, 
+                    max_value=30, 
+                    value=10, 
+                    step=1,
+                    key=f"buy_period{i}"
+                )
+                
+                discount_rate = st.number_input(
+                    "Discount Rate (%)", 
+                    min_value=2.0, 
+                    max_value=15.0, 
+                    value=8.0, 
+                    step=0.5,
+                    key=f"buy_disc{i}"
+                )
+                
+                # Store purchase parameters
+                buy_params = {
+                    "name": name,
+                    "purchase_price": purchase_price,
+                    "down_payment_pct": down_payment_pct,
+                    "mortgage_rate": mortgage_rate,
+                    "mortgage_term": mortgage_term,
+                    "property_tax_rate": property_tax_rate,
+                    "insurance_rate": insurance_rate,
+                    "maintenance_rate": maintenance_rate,
+                    "appreciation_rate": appreciation_rate,
+                    "analysis_period": analysis_period,
+                    "discount_rate": discount_rate
+                }
+                buy_inputs.append(buy_params)
+        
+        # Store in session state
+        st.session_state.buy_inputs = buy_inputs
+        
+        # Run Analysis Button for purchase scenarios
+        st.markdown("---")
+        st.markdown("""
+            <style>
+            /* Main button styling */
+            .stButton > button {
+                background-color: #0066cc !important;
+                color: white !important;
+                font-size: 1.2em !important;
+                font-weight: 500 !important;
+                padding: 0.7em 1em !important;
+                border-radius: 6px !important;
+                border: none !important;
+                box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1) !important;
+                transition: all 0.2s ease !important;
+                width: 100% !important;
+                margin: 0.5em 0 !important;
+            }
+
+            /* Hover state */
+            .stButton > button:hover {
+                background-color: #0052a3 !important;
+                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.15) !important;
+                transform: translateY(-1px) !important;
+            }
+
+            /* Active/Click state */
+            .stButton > button:active {
+                transform: translateY(0px) !important;
+                box-shadow: 0 1px 2px rgba(0, 0, 0, 0.1) !important;
+                background-color: #004080 !important;
+            }
+            </style>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns([1, 1, 1])
+        with col2:
+            if st.button("🚀 Run Purchase Analysis", use_container_width=True):
+                if len(buy_inputs) > 0:
+                    with stage("compute.analyze_purchase", scenarios=len(buy_inputs)):
+                        st.session_state["buy_results"] = [(p, *analyze_purchase(p)) for p in buy_inputs]
+                    st.query_params.update({"tab": "analysis"})
+                    st.success("Purchase analysis complete! Switch to the Analysis tab to view results.")
+                else:
+                    st.error("Please configure at least one purchase scenario before running analysis.")
+        
+        st.markdown("---")
+        st.markdown("<p style='font-size: 0.8em; color: gray;'>© 2025 Savills. All rights reserved.</p>", unsafe_allow_html=True)
+        
+    else:
+        # Original lease inputs
+        st.header("Configure & Compare Scenarios")
+        count = st.number_input("Number of Scenarios", 1, MAX_SCENARIOS, key="count")
+
+        inputs = []
+        for i in range(int(count)):
+            with st.expander(f"Scenario {i+1}", expanded=(i==0)):
+                # Space & Term Section
+                st.markdown("#### Space & Term")
+                
+                # Basic Information
+                name = st.text_input("Name", key=f"name{i}")
+                if not name:  # If no name is provided, use default
+                    name = f"Option {i+1}"
+                if f"sd{i}" not in st.session_state:
+                    st.session_state[f"sd{i}"] = date.today()
+                start_dt = st.date_input("Lease Commencement", key=f"sd{i}")
+                term_mos = st.number_input("Lease Term (months)", min_value=0, max_value=600, step=1, key=f"tm{i}")
+                
+                initial_sqft = st.number_input("Initial RSF", min_value=0, max_value=200000, step=1, key=f"sq{i}")
+                has_size_change = st.checkbox("Include Size Change", key=f"exp{i}")
+                
+                if has_size_change:
+                    if term_mos > 0:
+                        default_change_month = min(12, term_mos)
+                        change_month = st.number_input("Change Month", min_value=1, max_value=term_mos, step=1, key=f"em{i}")
+                        # Calculate which year the change occurs in
+                        change_year = (change_month - 1) // 12 + 1
+                        max_reduction = -initial_sqft if initial_sqft > 0 else 0
+                        change_sqft = st.number_input("Size Change (±RSF)", min_value=max_reduction, max_value=200000, step=1, key=f"es{i}")
+                        total_sqft = initial_sqft + change_sqft
+                        if total_sqft > 0:
+                            change_type = "expansion" if change_sqft > 0 else "reduction" if change_sqft < 0 else "no change"
+                            if change_sqft != 0:
+                                st.caption(f"→ {abs(change_sqft):,} SF {change_type} in month {change_month} (Year {change_year})")
+                            st.caption(f"→ Total SF after change: {total_sqft:,}")
+                        else:
+                            st.error("Total SF cannot be negative or zero")
+                            total_sqft = initial_sqft
+                            change_sqft = 0
+                    else:
+                        st.warning("Please set lease term before adding size change")
+                        change_month = 0
+                        change_sqft = 0
+                        total_sqft = initial_sqft
+                else:
+                    change_month = 0
+                    change_sqft = 0
+                    total_sqft = initial_sqft
+                
+                st.markdown("---")
+
+                # Rent & Operating Costs Section
+                st.markdown("#### Rent & Operating Costs")
+                
+                # Base Rent Subsection
+                st.markdown("##### Base Rent")
+                base = st.number_input("Base Rent ($/SF/yr)", min_value=0.0, max_value=1000.0, step=0.01, format="%.2f", key=f"b{i}")
+                custom_inc = st.checkbox("Custom Rent ↑ per Year", key=f"ci{i}")
+                if custom_inc:
+                    yrs = term_mos//12 + (1 if term_mos%12 else 0)
+                    rent_incs = [st.number_input(f"Year {y} ↑ (%)", min_value=0.0, max_value=100.0, step=0.01, format="%.2f", key=f"yrinc_{i}_{y}") for y in range(1, int(yrs)+1)]
+                else:
+                    rent_incs = None
+                    inc = st.number_input("Base Rent ↑ (%)", min_value=0.0, max_value=100.0, step=0.01, format="%.2f", key=f"r{i}")
+
+                # Operating Expenses Subsection
+                st.markdown("##### Operating Expenses")
+                lease_type = st.selectbox(
+                    "Lease Type",
+                    ["Full Service (Gross)", "Triple Net (NNN)"],
+                    key=f"lt{i}"
+                )
+
+                if lease_type == "Triple Net (NNN)":
+                    opex = st.number_input("OPEX ($/SF/yr)", min_value=0.0, max_value=500.0, step=0.01, format="%.2f", key=f"ox{i}")
+                    opexinc = st.number_input("Estimated OpEx ↑ (%)", min_value=0.0, max_value=100.0, step=0.01, format="%.2f", key=f"oi{i}")
+                    opex_base = None  # NNN pays everything
+                else:
+                    opex = 0.0  # Full Service doesn't pay OPEX
+                    opexinc = 0.0  # No OPEX increase for Full Service
+                    opex_base = None  # No base year for Full Service
+
+                # Parking Subsection
+                st.markdown("##### Parking")
+                fxp = st.checkbox("Fixed Parking Spaces", key=f"fxp{i}")
+                if fxp:
+                    unres_spaces = st.number_input("Unreserved Spaces", min_value=0, max_value=500, step=1, key=f"ps_unres{i}")
+                    unres_cost = st.number_input("Unreserved $/space/mo", min_value=0.0, max_value=500.0, step=0.01, format="%.2f", key=f"pc_unres{i}")
+                    res_spaces = st.number_input("Reserved Spaces", min_value=0, max_value=500, step=1, key=f"ps_res{i}")
+                    res_cost = st.number_input("Reserved $/space/mo", min_value=0.0, max_value=1000.0, step=0.01, format="%.2f", key=f"pc_res{i}")
+                else:
+                    unres_ratio = st.number_input("Unreserved Ratio (spaces/1k SF)", min_value=0.0, max_value=100.0, step=0.01, format="%.2f", key=f"rt_unres{i}")
+                    total_spaces = unres_ratio * (initial_sqft or 0) / 1000
+                    res_spaces = st.number_input("Reserved Spaces", min_value=0, max_value=500, step=1, key=f"ps_res{i}")
+                    unres_spaces = int(round(max(total_spaces - res_spaces, 0)))
+                    st.caption(f"→ {unres_spaces} unreserved, {res_spaces} reserved spaces")
+                    unres_cost = st.number_input("Unreserved $/space/mo", min_value=0.0, max_value=500.0, step=0.01, format="%.2f", key=f"pc_unres{i}")
+                    res_cost = st.number_input("Reserved $/space/mo", min_value=0.0, max_value=1000.0, step=0.01, format="%.2f", key=f"pc_res{i}")
+                
+                # Add parking escalation input
+                park_inc = st.number_input("Estimated Annual Parking Cost ↑ (%)", min_value=0.0, max_value=100.0, step=0.01, format="%.2f", key=f"pi{i}")
+                
+                park_spaces = unres_spaces + res_spaces
+                park_cost = (unres_cost * unres_spaces + res_cost * res_spaces) / (park_spaces if park_spaces else 1)
+                park_detail = {
+                    'unres_spaces': unres_spaces,
+                    'unres_cost': unres_cost,
+                    'res_spaces': res_spaces,
+                    'res_cost': res_cost,
+                    'park_inc': park_inc
+                }
+
+                st.markdown("---")
+
+                # Capital Expenses Section
+                st.markdown("#### Capital Expenses")
+                
+                # Total Construction Cost Subsection
+                st.markdown("##### Total Construction Cost")
+                cc_fx = st.checkbox("Fixed Total Construction Cost (total $)", key=f"ccfx{i}")
+                if cc_fx:
+                    cc_tot = st.number_input("Total Construction Cost (total $)", min_value=0.0, max_value=10000000.0, step=0.01, format="%.2f", key=f"cc_tot{i}")
+                    const_sf = cc_tot/(initial_sqft or 1)
+                    if initial_sqft > 0:
+                        st.caption(f"→ ${const_sf:.2f}/SF")
+                else:
+                    const_sf = st.number_input("Total Construction Cost ($/SF)", min_value=0.0, max_value=1000.0, step=0.01, format="%.2f", key=f"cc{i}")
+
+                # Moving Expense Subsection
+                st.markdown("##### Moving Cost")
+                mv_fx = st.checkbox("Fixed Moving Cost (total $)", key=f"mvfx{i}")
+                if mv_fx:
+                    mv_tot = st.number_input("Moving Cost (total $)", min_value=0.0, max_value=10000000.0, step=0.01, format="%.2f", key=f"mv_tot{i}")
+                    mv_sf = mv_tot/(initial_sqft or 1)
+                    if initial_sqft > 0:
+                        st.caption(f"→ ${mv_sf:.2f}/SF")
+                else:
+                    mv_sf = st.number_input("Moving Cost ($/SF)", min_value=0.0, max_value=500.0, step=0.01, format="%.2f", key=f"mv{i}")
+
+                # FF&E Subsection
+                st.markdown("##### FF&E")
+                ffe_fx = st.checkbox("Fixed FF&E Expense (total $)", key=f"ffefx{i}")
+                if ffe_fx:
+                    ffe_tot = st.number_input("FF&E Expense (total $)", min_value=0.0, max_value=10000000.0, step=0.01, format="%.2f", key=f"ffe_tot{i}")
+                    ffe_sf = ffe_tot/(initial_sqft or 1)
+                    if initial_sqft > 0:
+                        st.caption(f"→ ${ffe_sf:.2f}/SF")
+                else:
+                    ffe_sf = st.number_input("FF&E Exp ($/SF)", min_value=0.0, max_value=500.0, step=0.01, format="%.2f", key=f"ffe{i}")
+
+                st.markdown("---")
+
+                # Concessions Section
+                st.markdown("#### Concessions")
+                
+                # Abatement Subsection
+                st.markdown("##### Rent Abatement")
+                lease_type = st.session_state.get(f"lt{i}", "Triple Net (NNN)")
+                base_only = False  # Initialize base_only
+                
+                free_mo = st.number_input("Rent Abatement (mo)", min_value=0, max_value=24, step=1, key=f"fr{i}")
+                cust_ab = st.checkbox("Custom Abatement per Year", key=f"cab{i}")
+                
+                if cust_ab:
+                    yrs = term_mos//12 + (1 if term_mos%12 else 0)
+                    abates = [st.number_input(f"Year {y} Abate (mo)", min_value=0, max_value=term_mos, step=1, key=f"abate_{i}_{y}") for y in range(1,yrs+1)]
+                    free_mo = 0
+                else:
+                    abates = None
+                
+                inside_term = st.checkbox("Abatement inside of the Term", key=f"inside_term{i}", help="If checked, abatement months will not extend the lease term")
+                if lease_type == "Triple Net (NNN)":
+                    base_only = st.checkbox("Abatement applies to Base Rent only", key=f"base_only{i}", help="If checked, tenant will continue to pay OpEx during abatement period")
+
+                # TI Allowance Subsection
+                st.markdown("##### TI Allowance")
+                ti_fx = st.checkbox("Fixed TI Allowance (total $)", key=f"tifx{i}")
+                if ti_fx:
+                    tot = st.number_input("TI Allowance (total $)", min_value=0.0, max_value=10000000.0, step=0.01, format="%.2f", key=f"titot{i}")
+                    ti_sf = tot/(initial_sqft or 1)
+                    if initial_sqft > 0:
+                        st.caption(f"→ ${ti_sf:.2f}/SF")
+                else:
+                    ti_sf = st.number_input("TI Allowance ($/SF)", min_value=0.0, max_value=500.0, step=0.01, format="%.2f", key=f"ti{i}")
+
+                # Additional Credits Subsection
+                st.markdown("##### Additional Credits")
+                ac_fx = st.checkbox("Fixed Additional Credits (total $)", key=f"acfx{i}")
+                if ac_fx:
+                    ac_tot = st.number_input("Additional Credits (total $)", min_value=0.0, max_value=10000000.0, step=0.01, format="%.2f", key=f"ac_tot{i}")
+                    add_cred = ac_tot/(initial_sqft or 1)
+                    if initial_sqft > 0:
+                        st.caption(f"→ ${add_cred:.2f}/SF")
+                else:
+                    add_cred = st.number_input("Additional Credits ($/SF)", min_value=0.0, max_value=500.0, step=0.01, format="%.2f", key=f"ac{i}")
+
+                st.markdown("---")
+
+                # Financial Parameters
+                st.markdown("#### Financial Parameters")
+                disc_pct = st.number_input("Discount Rate (%)", min_value=0.0, max_value=100.0, step=0.01, format="%.2f", key=f"dr{i}")
+                
+                # Commission Parameters (Internal Use)
+                st.markdown("#### Commission (Internal)")
+                st.caption("Internal use only - not shown in client-facing outputs")
+                comm_pct = st.number_input("Commission Rate (%)", min_value=0.0, max_value=100.0, step=0.01, format="%.2f", key=f"cm{i}")
+                include_opex = st.checkbox("Include OpEx in Commission Calculation", key=f"io{i}")
+
+                inputs.append({
+                    "name":          name,
+                    "start_date":    start_dt,
+                    "term_mos":      term_mos,
+                    "sqft":          initial_sqft,
+                    "exp_month":     change_month,
+                    "exp_sqft":      change_sqft,
+                    "total_sqft":    total_sqft,
+                    "base":          base,
+                    "inc":           inc if not custom_inc else None,
+                    "rent_incs":     rent_incs,
+                    "lease_type":    lease_type,
+                    "opex_base":     opex_base,
+                    "opex":          opex,
+                    "opexinc":       opexinc,
+                    "park_cost":     park_cost,
+                    "park_spaces":   park_spaces,
+                    "park_detail":   park_detail,
+                    "move_exp":      mv_sf,
+                    "construction":  const_sf,
+                    "ffe":           ffe_sf,
+                    "free":          free_mo,
+                    "ti":            ti_sf,
+                    "add_cred":      add_cred,
+                    "disc":          disc_pct,
+                    "custom_abate":  cust_ab,
+                    "abates":        abates,
+                    "inside_term":   inside_term,
+                    "base_only_abate": base_only if lease_type == "Triple Net (NNN)" else False,
+                    "commission":    comm_pct,
+                    "include_opex":  include_opex,
+                })
+
+    # Run Analysis Button after inputs are created
+    st.markdown("---")
+    st.markdown("""
+        <style>
+        /* Main button styling */
+        .stButton > button {
+            background-color: #0066cc !important;
+            color: white !important;
+            font-size: 1.2em !important;
+            font-weight: 500 !important;
+            padding: 0.7em 1em !important;
+            border-radius: 6px !important;
+            border: none !important;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1) !important;
+            transition: all 0.2s ease !important;
+            width: 100% !important;
+            margin: 0.5em 0 !important;
+        }
+
+        /* Hover state */
+        .stButton > button:hover {
+            background-color: #0052a3 !important;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.15) !important;
+            transform: translateY(-1px) !important;
+        }
+
+        /* Active/Click state */
+        .stButton > button:active {
+            transform: translateY(0px) !important;
+            box-shadow: 0 1px 2px rgba(0, 0, 0, 0.1) !important;
+            background-color: #004080 !important;
+        }
+        </style>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col2:
+        if st.button("🚀 Run Analysis", use_container_width=True):
+            if len(inputs) > 0:
+                with stage("compute.analyze_lease", scenarios=len(inputs)):
+                    st.session_state["results"] = [(p, *analyze_lease(p)) for p in inputs]
+                st.query_params.update({"tab": "analysis"})
+                st.success("Analysis complete! Switch to the Analysis tab to view results.")
+            else:
+                st.error("Please configure at least one scenario before running analysis.")
+
+    st.markdown("---")
+    st.markdown("<p style='font-size: 0.8em; color: gray;'>© 2025 Savills. All rights reserved.</p>", unsafe_allow_html=True)
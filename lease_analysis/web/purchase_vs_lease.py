@@ -0,0 +1,63 @@
+import pandas as pd
+import streamlit as st
+
+from lease_analysis.engine.summary import format_summary
+from lease_analysis.utils.timing import stage
+
+
+def render_purchase_vs_lease_tab():
+    """Render the first lease scenario against the first purchase scenario."""
+    st.header("Purchase vs. Lease Comparison")
+    lease_results = st.session_state.get("results", [])
+    buy_results = st.session_state.get("buy_results", [])
+    
+    if lease_results and buy_results:
+        # Use the first scenario from each for comparison
+        lease_summary = lease_results[0][1]
+        lease_waterfall = lease_results[0][2]
+        buy_summary = buy_results[0][1]
+        buy_waterfall = buy_results[0][2]
+        
+        st.subheader("Summary Table")
+        summary_df = pd.DataFrame([
+            {"Type": "Lease", **format_summary(lease_summary)},
+            {"Type": "Purchase", **format_summary(buy_summary)}
+        ])
+        st.dataframe(summary_df, use_container_width=True)
+        
+        st.markdown("---")
+        st.subheader("Annual Cash Flow Comparison")
+        years = list(range(1, max(len(lease_waterfall), len(buy_waterfall)) + 1))
+        lease_cf = lease_waterfall["Net CF"].tolist() if "Net CF" in lease_waterfall else [0]*len(years)
+        buy_cf = (-buy_waterfall["Total Cost"]).tolist()
+        # Pad shorter list
+        if len(lease_cf) < len(years):
+            lease_cf += [lease_cf[-1]] * (len(years) - len(lease_cf))
+        if len(buy_cf) < len(years):
+            buy_cf += [buy_cf[-1]] * (len(years) - len(buy_cf))
+        
+        import plotly.graph_objects as go
+        with stage("chart.build", chart="purchase_vs_lease"):
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=years, y=lease_cf, mode='lines+markers', name='Lease', line=dict(color='blue')))
+            fig.add_trace(go.Scatter(x=years, y=buy_cf, mode='lines+markers', name='Purchase', line=dict(color='green')))
+            fig.update_layout(title="Annual Cash Flow Comparison", xaxis_title="Year", yaxis_title="Cash Flow ($)", template="plotly_white")
+        with stage("chart.render", chart="purchase_vs_lease"):
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown("---")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("Lease Cash Flow Table")
+            st.dataframe(lease_waterfall, use_container_width=True)
+        with col2:
+            st.subheader("Purchase Cash Flow Table")
+            with stage("table.style", table="purchase_cash_flow"):
+                st.dataframe(buy_waterfall.style.format("${:,.0f}", subset=buy_waterfall.columns.drop("Year")),
+                             use_container_width=True)
+        
+        st.markdown("---")
+        st.caption("This comparison uses the first scenario from each analysis. Run more scenarios and use the Comparison tabs for multi-scenario analysis.")
+    else:
+        st.info("To compare purchase and lease, run at least one analysis for each.\n\nGo to the Inputs tab for Lease and Buy Analyzer, configure your scenarios, and run the analysis. The comparison will appear here once both are available.")
+        st.caption("This feature lets you see a side-by-side comparison of your first lease and purchase scenarios, including cash flows and summary metrics.")
@@ -0,0 +1,476 @@
+import pandas as pd
+import streamlit as st
+from dateutil.relativedelta import relativedelta
+
+from lease_analysis.utils.timing import stage
+
+
+def render_analysis_tab(mode):
+    """Render the per-scenario results for the selected mode."""
+    if mode == "🏠 Buy Analyzer":
+        # Purchase Analysis
+        buy_results = st.session_state.get("buy_results", [])
+        if not buy_results:
+            st.warning("Run purchase analysis first in Inputs.")
+        else:
+            for idx, (buy_params, summary, waterfall) in enumerate(buy_results):
+                st.header(f"Purchase Scenario {idx+1}: {buy_params['name']}")
+                
+                # Display summary metrics
+                st.markdown("### Purchase Summary")
+                
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.markdown("#### Property Details")
+                    st.metric("Purchase Price", summary.display("Purchase Price"))
+                    st.metric("Down Payment", summary.display("Down Payment"))
+                    st.metric("Loan Amount", summary.display("Loan Amount"))
+                    st.metric("Monthly Payment", summary.display("Monthly Payment"))
+                
+                with col2:
+                    st.markdown("#### Financial Metrics")
+                    st.metric("Total Cost", summary.display("Total Cost"))
+                    st.metric("NPV", summary.display("NPV"))
+                    st.metric("Final Property Value", summary.display("Final Property Value"))
+                    st.metric("Equity", summary.display("Equity"))
+                
+                with col3:
+                    st.markdown("#### Investment Analysis")
+                    st.metric("Net Position", summary.display("Net Position"))
+                    st.metric("IRR", summary.display("IRR"))
+                    st.metric("Analysis Period", summary.display("Analysis Period"))
+                
+                # Cash flow chart
+                st.markdown("### Annual Cash Flow")
+                
+                years = list(range(1, buy_params['analysis_period'] + 1))
+                cash_flows = (-waterfall['Total Cost']).tolist()
+                
+                import plotly.graph_objects as go
+                with stage("chart.build", chart="annual_cost", scenario=buy_params["name"]):
+                    fig = go.Figure()
+                    fig.add_trace(go.Bar(
+                        x=years,
+                        y=cash_flows,
+                        name='Annual Cost',
+                        marker_color='red'
+                    ))
+
+                    fig.update_layout(
+                        title="Annual Property Costs",
+                        xaxis_title="Year",
+                        yaxis_title="Cost ($)",
+                        template="plotly_white"
+                    )
+
+                # st.plotly_chart serializes the figure to JSON
+                with stage("chart.render", chart="annual_cost", scenario=buy_params["name"]):
+                    st.plotly_chart(fig, use_container_width=True)
+
+                # Cash flow table
+                st.markdown("### Detailed Cash Flow")
+                with stage("table.style", table="cash_flow", scenario=buy_params["name"]):
+                    st.dataframe(waterfall.style.format("${:,.0f}", subset=waterfall.columns.drop("Year")),
+                                 use_container_width=True)
+                
+                st.markdown("---")
+    else:
+        # Original lease analysis
+        results = st.session_state.get("results", [])
+        if not results:
+            st.warning("Run analysis first in Inputs.")
+        else:
+            for idx, (p, s, wf) in enumerate(results):
+                st.header(f"Scenario {idx+1}: {s['Option']}")
+
+                # Lease Summary Section
+                st.markdown("### Lease Summary")
+                
+                # Create a container for the summary
+                with st.container(), stage("table.style", table="summary", scenario=s["Option"]):
+                    col1, col2 = st.columns([2, 1])
+                    
+                    with col1:
+                        # Lease Term Section
+                        with st.container():
+                            st.markdown("#### Lease Term")
+                            
+                            # Get abatement details
+                            abate_details = ""
+                            if p.get("custom_abate") and p.get("abates"):
+                                # For custom abatement, show which years have abatement
+                                abate_years = [f"Year {i+1}: {months}mo" 
+                                             for i, months in enumerate(p.get("abates")) 
+                                             if months > 0]
+                                if abate_years:
+                                    abate_details = f" ({', '.join(abate_years)})"
+                                elif p.get("free", 0) > 0:
+                                    # For standard abatement, it's always in Year 1
+                                    abate_details = " (Year 1)"
+                                
+                                # Calculate total abatement
+                                total_abate = sum(p.get("abates", [])) if p.get("custom_abate") else p.get("free", 0)
+                                
+                                # Determine abatement type label
+                                if total_abate > 0:
+                                    if p.get("lease_type") == "Triple Net (NNN)":
+                                        if p.get("base_only_abate"):
+                                            abate_type = "Base Rent Only"
+                                        else:
+                                            abate_type = "Base Rent & OpEx"
+                                        abate_text = f"{total_abate} months{abate_details} ({abate_type})"
+                                    else:
+                                        abate_text = f"{total_abate} months{abate_details}"
+                                else:
+                                    abate_text = "None"
+                                
+                                lease_term_df = pd.DataFrame([
+                                    ["Commencement", p.get("start_date", "").strftime("%m/%d/%Y") if p.get("start_date") else ""],
+                                    ["Base Term", f"{p.get('term_mos', '')} months"],
+                                    ["Months Abated", abate_text],
+                                    ["Total Term", f"{s.get('Total Term (mos)', '')} months"],
+                                    ["Expiration", (p.get("start_date") + relativedelta(months=s.get("Total Term (mos)", 0))).strftime("%m/%d/%Y") if p.get("start_date") else ""]
+                                ], columns=['Label', 'Value'])
+                                
+                                styled_lease_term_df = lease_term_df.style\
+                                    .set_properties(**{'text-align': 'left'})\
+                                    .hide(axis=0)\
+                                    .hide(axis=1)
+                                
+                                st.dataframe(styled_lease_term_df, hide_index=True)
+                            
+                            # Square Footage Section
+                            with st.container():
+                                st.markdown("#### Square Footage")
+                                # Calculate which year the change occurs in
+                                if p.get('exp_month', 0) > 0:
+                                    change_year = (p.get('exp_month', 0) - 1) // 12 + 1
+                                    size_change_text = f"{p.get('exp_sqft', 0):+,} (Year {change_year})"
+                                else:
+                                    size_change_text = "-"
+                                    
+                                square_footage_df = pd.DataFrame([
+                                    ["Initial SF", f"{p.get('sqft', ''):,}"],
+                                    ["Size Change", size_change_text],
+                                    ["Total SF", f"{p.get('total_sqft', ''):,}"]
+                                ], columns=['Label', 'Value'])
+                                
+                                styled_square_footage_df = square_footage_df.style\
+                                    .set_properties(**{'text-align': 'left'})\
+                                    .hide(axis=0)\
+                                    .hide(axis=1)
+                                
+                                st.dataframe(styled_square_footage_df, hide_index=True)
+                            
+                            # Capital Costs Section
+                            with st.container():
+                                st.markdown("#### Capital Costs")
+                                construction_balance = p.get('construction', 0) - p.get('ti', 0)
+                                balance_color = "red" if construction_balance > 0 else "green"
+                                
+                                # Create DataFrame for capital costs
+                                capital_costs_df = pd.DataFrame([
+                                    ["Total Construction Cost", f"${p.get('construction', 0):,.2f} /SF"],
+                                    ["TI Allowance", f"${p.get('ti', 0):,.2f} /SF"],
+                                    ["Construction Cost Balance", f"${construction_balance:,.2f} /SF"],
+                                    ["Moving Cost", f"${p.get('move_exp', 0):,.2f} /SF"],
+                                    ["FF&E", f"${p.get('ffe', 0):,.2f} /SF"]
+                                ], columns=['Label', 'Value'])
+                                
+                                # Apply styling
+                                def style_df(df):
+                                    return pd.DataFrame(
+                                        [[''] * len(df.columns) if 'Construction Cost Balance' not in row['Label'] 
+                                         else ['', f'color: {balance_color}'] for _, row in df.iterrows()],
+                                        index=df.index, columns=df.columns
+                                    )
+                                
+                                styled_df = capital_costs_df.style\
+                                    .set_properties(**{'text-align': 'left'})\
+                                    .apply(style_df, axis=None)\
+                                    .hide(axis=0)\
+                                    .hide(axis=1)
+                                
+                                st.dataframe(styled_df, hide_index=True)
+                                st.caption("Note: A positive Construction Cost Balance (red) means additional tenant cost; negative (green) means tenant credit.")
+                        
+                        with col2:
+                            # Base Rent Section
+                            with st.container():
+                                st.markdown("#### Base Rent")
+                                base_rent_df = pd.DataFrame([
+                                    ["Base Rent", f"${p.get('base', 0):,.2f}"],
+                                    ["Type", p.get('lease_type', '')],
+                                    ["Escalation", f"{p.get('inc', 0)}%"]
+                                ], columns=['Label', 'Value'])
+                                styled_base_df = base_rent_df.style\
+                                    .set_properties(**{'text-align': 'left'})\
+                                    .hide(axis=0)\
+                                    .hide(axis=1)
+                                st.dataframe(styled_base_df, hide_index=True)
+                            
+                            # Operating Expenses Section
+                            with st.container():
+                                st.markdown("#### Operating Expenses")
+                                operating_expenses_df = pd.DataFrame([
+                                    ["OpEx Base Year", f"${p.get('opex', 0):,.2f}"],
+                                    ["Escalation", f"{p.get('opexinc', 0)}%"]
+                                ], columns=['Label', 'Value'])
+                                styled_opex_df = operating_expenses_df.style\
+                                    .set_properties(**{'text-align': 'left'})\
+                                    .hide(axis=0)\
+                                    .hide(axis=1)
+                                st.dataframe(styled_opex_df, hide_index=True)
+                                st.caption("*Estimated OpEx escalation")
+                            
+                            # Parking Section
+                            with st.container():
+                                st.markdown("#### Parking")
+                                
+                                # Create parking table with clean layout
+                                parking_df = pd.DataFrame([
+                                    ["Ratio/1,000 SF", f"{p.get('park_spaces', 0)/(p.get('sqft', 1))*1000 if p.get('sqft', 1) else 0:.2f}"],
+                                    ["Unreserved Spaces", str(p.get('park_detail', {}).get('unres_spaces', 0))],
+                                    ["Unreserved Rate", f"${p.get('park_detail', {}).get('unres_cost', 0):,.2f}"],
+                                    ["Reserved Spaces", str(p.get('park_detail', {}).get('res_spaces', 0))],
+                                    ["Reserved Rate", f"${p.get('park_detail', {}).get('res_cost', 0):,.2f}"],
+                                    ["Escalation", f"{p.get('park_detail', {}).get('park_inc', 0)}%"]
+                                ], columns=['Label', 'Value'])
+                                
+                                styled_parking_df = parking_df.style\
+                                    .set_properties(**{'text-align': 'left'})\
+                                    .hide(axis=0)\
+                                    .hide(axis=1)
+                                
+                                st.dataframe(styled_parking_df, hide_index=True)
+                                
+                                # Show escalation caption
+                                st.caption("*Estimated parking escalation")
+
+                st.divider()
+
+                # Primary Financial Metrics
+                st.markdown("### Primary Financial Metrics")
+                
+                k1, k2, k3 = st.columns(3)
+                with k1:
+                    st.markdown("#### Total Rent Obligation")
+                    st.markdown(f'<div class="metric-value">{s.display("Total Cost")}</div>', unsafe_allow_html=True)
+                    st.caption("(Excluding parking, including construction cost balance and additional credits)")
+                
+                with k2:
+                    st.markdown("#### Avg Eff. Rent")
+                    st.markdown(f'<div class="metric-value">{s.display("Avg Eff. Rent")}</div>', unsafe_allow_html=True)
+                    st.caption("Average effective rent per SF per year")
+                
+                with k3:
+                    npv_key = next(k for k in s if k.startswith("NPV"))
+                    st.markdown(f"#### {npv_key}")
+                    st.markdown(f'<div class="metric-value">{s.display(npv_key)}</div>', unsafe_allow_html=True)
+                    st.caption("Present value of all lease payments and concessions using the given discount rate, excluding parking costs")
+
+                st.divider()
+
+                # Second row of metrics (without title)
+                k4, k5, k6 = st.columns(3)
+                with k4:
+                    st.markdown("#### Moving Cost")
+                    st.markdown(f'<div class="metric-value">${p.get("move_exp", 0)*p.get("sqft", 0):,.0f}</div>', unsafe_allow_html=True)
+                    st.caption("Total moving cost")
+                
+                with k5:
+                    st.markdown("#### FF&E")
+                    st.markdown(f'<div class="metric-value">${p.get("ffe", 0)*p.get("sqft", 0):,.0f}</div>', unsafe_allow_html=True)
+                    st.caption("Total FF&E cost")
+                
+                with k6:
+                    st.markdown("#### Additional Credit")
+                    st.markdown(f'<div class="metric-value">{s.display("Additional Credit")}</div>', unsafe_allow_html=True)
+                    st.caption("Other landlord incentives")
+
+                st.divider()
+
+                # Third row of metrics (without title)
+                c1, c2, c3 = st.columns(3)
+                with c1:
+                    st.markdown("#### Construction Cost")
+                    st.markdown(f'<div class="metric-value">{s.display("Construction Cost")}</div>', unsafe_allow_html=True)
+                    st.caption("Total construction cost")
+                
+                with c2:
+                    st.markdown("#### TI Allowance")
+                    st.markdown(f'<div class="metric-value">{s.display("TI Allowance")}</div>', unsafe_allow_html=True)
+                    st.caption("Total tenant improvement allowance")
+                
+                with c3:
+                    tenant_expense = s["Construction Cost"] - s["TI Allowance"]
+                    expense_color = "red" if tenant_expense > 0 else "green"
+                    st.markdown("#### Construction Cost Balance")
+                    st.markdown(f'<div class="metric-value" style="color: {expense_color}">${tenant_expense:,.0f}</div>', unsafe_allow_html=True)
+                    st.caption("Red: additional tenant cost; green: tenant credit")
+
+                st.divider()
+
+                # Annual Cost Breakdown Chart
+                st.markdown("### Annual Cost Breakdown")
+                
+                # Chart without header
+                import plotly.graph_objects as go
+                with stage("chart.build", chart="annual_cost", scenario=s["Option"]):
+                    cost_fig = go.Figure()
+                    for name in ["Base Rent", "Opex", "Parking Exp"]:
+                        if name in wf.columns:
+                            cost_fig.add_trace(go.Bar(
+                                name=name,
+                                x=wf["Year"],
+                                y=wf[name],
+                            ))
+                    cost_fig.update_layout(
+                        barmode="stack",
+                        xaxis_title="Year",
+                        yaxis_title="Cost ($)",
+                        margin=dict(t=30, b=30, l=50, r=30),
+                        legend_title_text="",
+                        hovermode="x unified",
+                        template="plotly_white",
+                        showlegend=True,
+                        legend=dict(
+                            orientation="h",
+                            yanchor="bottom",
+                            y=1.02,
+                            xanchor="center",
+                            x=0.5
+                        )
+                    )
+                with stage("chart.render", chart="annual_cost", scenario=s["Option"]):
+                    st.plotly_chart(cost_fig, use_container_width=True)
+
+                # Rent Schedule
+                st.markdown("### Rent Schedule")
+                
+                with stage("table.build", table="rent_schedule", scenario=s["Option"]):
+                    # Create the rent schedule DataFrame (not transposed)
+                    rent_schedule = pd.DataFrame({
+                        "Period": wf["Period"].tolist(),
+                        "SF": wf["SF"].tolist(),
+                        # Base Rent and OpEx as PSF - divide total by SF
+                        "Base Rent PSF": (wf["Base Rent"] / wf["SF"]).tolist(),
+                        "OpEx PSF": (wf["Opex"] / wf["SF"]).tolist(),
+                        # Total costs for other columns
+                        "Gross Rent": [base + opex for base, opex in zip(wf["Base Rent"].tolist(), wf["Opex"].tolist())],
+                        "Rent Abatement": wf["Rent Abatement"].tolist() if "Rent Abatement" in wf.columns else [0] * len(wf),
+                    })
+
+                    # Add Net Rent column
+                    rent_schedule["Net Rent"] = rent_schedule["Gross Rent"] + rent_schedule["Rent Abatement"]
+
+                    # Calculate full years and extra months
+                    full_years = p["term_mos"] // 12
+                    extra_mos = p["term_mos"] % 12
+
+                    # Create Year and Months columns
+                    year_labels = [f"Year {i+1}" for i in range(len(wf))]
+                    month_values = [12 if i < len(wf)-1 else (extra_mos if extra_mos > 0 else 12) for i in range(len(wf))]
+                
+                    # Add Year and Months columns at the start
+                    rent_schedule.insert(0, "Year", year_labels)
+                    rent_schedule.insert(1, "Months", month_values)
+
+                    # Format currency columns
+                    psf_columns = ["Base Rent PSF", "OpEx PSF"]
+                    total_columns = ["Gross Rent", "Rent Abatement", "Net Rent"]
+
+                    # Format PSF columns
+                    for col in psf_columns:
+                        rent_schedule[col] = rent_schedule[col].apply(lambda x: f"${x:,.2f}")
+
+                    # Format total cost columns
+                    for col in total_columns:
+                        rent_schedule[col] = rent_schedule[col].apply(lambda x: f"${abs(x):,.0f}" if col != "Rent Abatement" else f"${x:,.0f}")
+
+                # The Styler is applied when st.dataframe renders it, so time both
+                with stage("table.style", table="rent_schedule", scenario=s["Option"]):
+                    # Create the style
+                    styled_schedule = rent_schedule.style.format("{:,}", subset=["SF"])
+
+                    # Apply base styling
+                    styled_schedule = styled_schedule.set_properties(**{
+                        'text-align': 'center',
+                        'padding': '8px',
+                        'white-space': 'nowrap'
+                    })
+
+                    # Apply specific column styles
+                    styled_schedule = styled_schedule.set_properties(**{
+                        'color': 'green'
+                    }, subset=['Rent Abatement'])
+
+                    styled_schedule = styled_schedule.set_properties(**{
+                        'background-color': '#FFEB9C'
+                    }, subset=['Net Rent'])
+
+                    # Style the first four columns
+                    styled_schedule = styled_schedule.set_properties(**{
+                        'color': '#666666',
+                        'font-size': '0.95em'
+                    }, subset=pd.IndexSlice[:, ['Year', 'Months', 'Period', 'SF']])
+
+                    # Add table styles
+                    styled_schedule = styled_schedule.set_table_styles([
+                        # Style for column headers
+                        {'selector': 'th', 'props': [
+                            ('text-align', 'center'),
+                            ('font-weight', 'bold'),
+                            ('padding', '8px'),
+                            ('white-space', 'nowrap'),
+                            ('background-color', '#f8f9fa')
+                        ]},
+                        # Add borders between sections
+                        {'selector': 'td:nth-child(6)', 'props': [  # After OpEx (adjusted for new Months column)
+                            ('border-right', '2px solid #e0e0e0')
+                        ]},
+                        {'selector': 'td:nth-child(8)', 'props': [  # After Gross Rent (adjusted for new Months column)
+                            ('border-right', '2px solid #e0e0e0')
+                        ]},
+                        {'selector': 'th:nth-child(6)', 'props': [  # Header after OpEx (adjusted for new Months column)
+                            ('border-right', '2px solid #e0e0e0')
+                        ]},
+                        {'selector': 'th:nth-child(8)', 'props': [  # Header after Gross Rent (adjusted for new Months column)
+                            ('border-right', '2px solid #e0e0e0')
+                        ]}
+                    ])
+
+                    st.dataframe(styled_schedule, use_container_width=True)
+
+                # Commission Section (Internal Only)
+                if s["Commission Rate"] > 0:
+                    with st.expander("💰 Commission Details (Internal)", expanded=False):
+                        st.markdown("#### Commission Calculation")
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            st.metric(
+                                "Commission Amount",
+                                s.display("Commission Amount"),
+                                help="Total commission based on selected rate and base"
+                            )
+                            st.caption(f"Rate: {s['Commission Rate']}%")
+                        
+                        with col2:
+                            st.metric(
+                                "Commission Base",
+                                s.display("Commission Base"),
+                                help="Total amount commission is calculated on"
+                            )
+                            st.caption(f"Including OpEx: {'Yes' if s['Include OpEx'] else 'No'}")
+                        
+                        st.markdown("---")
+                        st.markdown("##### Calculation Details")
+                        st.markdown("""
+                        - Base: {'Base Rent + OpEx' if s['Include OpEx'] else 'Base Rent Only'}
+                        - Excludes: Abatement Months
+                        - Calculation: Commission Base × Rate%
+                        """)
+
+                st.markdown("<p style='font-size: 0.8em; color: gray;'>© 2025 Savills. All rights reserved.</p>", unsafe_allow_html=True)
@@ -0,0 +1,157 @@
+import sqlite3
+from datetime import date
+
+import streamlit as st
+
+from lease_analysis.utils.scenario_store import LEASE, PURCHASE, scenario_store
+from lease_analysis.web.inputs import MAX_SCENARIOS, SCENARIO_WIDGETS
+
+# Deck kind saved and loaded in each analyzer mode
+MODE_KINDS = {"🏢 Lease Analyzer": LEASE, "🏠 Buy Analyzer": PURCHASE}
+
+
+def load_test_data():
+    """Load sample data for testing"""
+    test_data = {
+        "name0": "Test Option",
+        "sd0": date.today(),
+        "tm0": 120,  # 10 years
+        "sq0": 10000,  # 10,000 SF
+        "b0": 46.0,  # $46/SF/yr base rent
+        "ci0": False,  # No custom rent increases
+        "r0": 3.0,  # 3% annual rent increase
+        "lt0": "Triple Net (NNN)",
+        "ox0": 12.0,  # $12/SF/yr OpEx
+        "oi0": 3.0,  # 3% annual OpEx increase
+        "pc0": 150.0,  # $150/space/month parking
+        "ps0": 30,  # 30 parking spaces
+        "mv0": 5.0,  # $5/SF moving expense
+        "cc0": 0.0,  # No construction cost
+        "fr0": 3,  # 3 months free rent
+        "ti0": 50.0,  # $50/SF TI allowance
+        "ac0": 0.0,  # No additional credits
+        "dr0": 8.0  # 8% discount rate
+    }
+    # Update session state with test data
+    for key, value in test_data.items():
+        st.session_state[key] = value
+
+
+def render_sidebar(mode):
+    """Render the sidebar: sample data and saved scenario decks for ``mode``."""
+    with st.sidebar:
+        st.subheader("Save/Load Analysis")
+    
+        # Test Data Section in an expander
+        with st.expander("🧪 Test Data", expanded=False):
+            try:
+                if st.button("Load Sample Data", use_container_width=True):
+                    load_test_data()
+                    st.success("Sample data loaded!")
+                    st.rerun()
+            except Exception as e:
+                st.error("Error loading test data. Please try refreshing the page.")
+    
+        # Save/Load Section in an expander
+        with st.expander("💾 Save & Load Scenarios", expanded=False):
+            kind = MODE_KINDS.get(mode, LEASE)
+            try:
+                render_save_load(kind)
+            except (sqlite3.Error, OSError) as e:
+                st.error(f"The scenario store is unavailable: {e}")
+
+
+def render_save_load(kind):
+    """Save every scenario on the Inputs tab as a deck, or load a saved deck back."""
+    # Save Section
+    st.markdown("##### Save Current Scenarios")
+    save_name = st.text_input("Enter name to save scenarios", key="save_name")
+    client = st.text_input("Client", key="save_client")
+    building = st.text_input("Building", key="save_building")
+    if st.button("Save Scenario", use_container_width=True):
+        if save_name:
+            name_key = SCENARIO_WIDGETS[kind][1][0]
+            info = scenario_store.save(kind, save_name, deck_inputs(st.session_state, kind),
+                                       client=client, building=building, name_key=name_key)
+            plural = "" if info.options == 1 else "s"
+            st.success(f"Saved '{save_name}' version {info.version} ({info.options} scenario{plural})")
+        else:
+            st.warning("Please enter a name for the scenarios")
+
+    st.markdown("---")
+
+    # Load Section
+    st.markdown("##### Load Saved Scenarios")
+    decks = scenario_store.find(kind=kind)
+    if not decks:
+        st.info("No saved scenarios available")
+        return
+
+    clients = sorted({d.client for d in decks if d.client})
+    if clients:
+        client = st.selectbox("Client", ["All clients", *clients], key="load_client")
+        if client != "All clients":
+            decks = scenario_store.find(kind=kind, client=client)
+    names = [d.name for d in decks]
+    labels = {d.name: " · ".join(filter(None, [d.name, d.building, d.saved_at[:10]])) for d in decks}
+    selected = st.selectbox("Select scenarios to load", names, format_func=labels.get, key="load_scenario")
+    versions = [d.version for d in scenario_store.find(kind=kind, name=selected, all_versions=True)]
+    version = st.selectbox("Version", versions, key="load_version")
+
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        if st.button("Load", use_container_width=True):
+            deck = scenario_store.load(kind, selected, version)
+            apply_deck(st.session_state, kind, deck.options)
+            st.success(f"Loaded {selected} version {version}")
+            st.rerun()
+
+    with col2:
+        if st.button("Delete", use_container_width=True):
+            scenario_store.delete(kind, selected, version)
+            st.success(f"Deleted {selected} version {version}")
+            st.rerun()
+
+
+def deck_inputs(state, kind):
+    """
+    Every scenario's input widget values, as options to save in a deck.
+
+    Args:
+        state: ``st.session_state`` (or any mapping of widget keys)
+        kind (str): ``LEASE`` or ``PURCHASE``
+
+    Returns:
+        list: Per scenario, widget values keyed without the scenario index
+            (``"tm"`` for ``tm0``, ``"yrinc_2"`` for ``yrinc_0_2``)
+    """
+    count_key, prefixes, yearly = SCENARIO_WIDGETS[kind]
+    options = []
+    for i in range(int(state.get(count_key, 1))):
+        option = {prefix: state[f"{prefix}{i}"] for prefix in prefixes if f"{prefix}{i}" in state}
+        for prefix in yearly:
+            head = f"{prefix}_{i}_"
+            option.update({f"{prefix}_{key[len(head):]}": state[key] for key in list(state) if key.startswith(head)})
+        options.append(option)
+    return options
+
+
+def apply_deck(state, kind, options):
+    """
+    Set the input widgets to a saved deck's options, as ``deck_inputs`` saved them.
+
+    Widgets an option has no value for are reset to their defaults. Must run
+    before the Inputs tab draws its widgets, so the page reruns afterwards.
+    """
+    count_key, prefixes, yearly = SCENARIO_WIDGETS[kind]
+    options = options[:MAX_SCENARIOS]
+    state[count_key] = max(len(options), 1)
+    for i, option in enumerate(options):
+        stale = [f"{prefix}{i}" for prefix in prefixes]
+        stale += [key for key in list(state) if any(key.startswith(f"{prefix}_{i}_") for prefix in yearly)]
+        for key in stale:
+            if key in state:
+                del state[key]
+        for key, value in option.items():
+            head, _, year = key.rpartition("_")
+            state[f"{head}_{i}_{year}" if head in yearly else f"{key}{i}"] = value
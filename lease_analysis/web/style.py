@@ -0,0 +1,79 @@
+# Global CSS for the lease web app, injected once per page render
+STYLE = """
+    <style>
+    /* Reset for Streamlit elements */
+    [data-testid="stMarkdown"] {
+        all: unset !important;
+    }
+    
+    /* Remove any list styling */
+    [data-testid="stMarkdown"] ul,
+    [data-testid="stMarkdown"] ol,
+    [data-testid="stMarkdown"] li {
+        all: unset !important;
+        list-style: none !important;
+    }
+    
+    /* Header styles */
+    .stMarkdown p {
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    
+    /* Metric card styles */
+    .metric-card {
+        background-color: white;
+        padding: 1.5rem;
+        border-radius: 0.75rem;
+        margin: 0.75rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+        border: 1px solid #e0e0e0;
+    }
+    
+    .metric-value {
+        font-size: 1.5em;
+        font-weight: 600;
+        color: #0066cc;
+        margin: 0.5rem 0;
+    }
+    
+    .metric-description {
+        font-size: 0.9em;
+        color: #666;
+    }
+    
+    /* Section spacing */
+    .section-spacer {
+        margin: 2rem 0;
+    }
+
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 24px;
+    }
+
+    .stTabs [data-baseweb="tab"] {
+        font-size: 2.4rem !important;
+        font-weight: 700;
+    }
+
+    .stTabs [data-baseweb="tab-list"] button {
+        font-size: 2.4rem !important;
+        font-weight: 700;
+    }
+
+    .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {
+        font-weight: 900;
+    }
+
+    /* Workflow instruction styling */
+    .workflow-instruction {
+        background: #f8f9fa;
+        border-radius: 8px;
+        padding: 8px;
+        margin-bottom: 16px;
+        text-align: center;
+        border: 1px solid #e9ecef;
+    }
+    </style>
+"""
@@ -1,25 +1,15 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import numpy_financial as npf
 from datetime import date, timedelta, datetime
 from dateutil.relativedelta import relativedelta
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import io
 import base64
-from fpdf import FPDF
-import tempfile
-import os
-from PIL import Image
-import json
 import warnings
-import requests
-import yfinance as yf
-from scipy import stats
-from scipy.optimize import minimize
-import xlsxwriter
+
+from lease_analysis.engine import lease as lease_engine
+from lease_analysis.engine.montecarlo import Distribution, simulate_lease, simulate_purchase
+from lease_analysis.engine.purchase import advisory_purchase_metrics
+
 warnings.filterwarnings('ignore')
 
 # --- Page Configuration and CSS ---
@@ -70,6 +60,8 @@ def initialize_session_state():
         'analysis_mode': 'Lease Analysis',
         'current_scenario': None,
         'purchase_results': None,
+        'lease_params': None,
+        'purchase_params': None,
         'monte_carlo_results': None,
         'show_education': True,
         'show_advanced': False,
@@ -204,104 +196,17 @@ def render_lease_analysis():
 
         if st.button("🚀 Run Lease Analysis", type="primary", use_container_width=True):
             params = locals()
+            st.session_state.lease_params = params
             st.session_state.current_scenario = calculate_lease_metrics(params)
 
     # --- Results Display ---
     if st.session_state.current_scenario:
         display_lease_analysis_results(st.session_state.current_scenario)
+        if st.session_state.lease_params:
+            render_monte_carlo("lease", st.session_state.lease_params)
 
 def calculate_lease_metrics(p):
-    num_periods = (p['term_mos'] + 11) // 12
-    
-    # Weighted Avg SF
-    if p['show_advanced'] and p['custom_sqft']:
-        total_sf_months = sum(p['custom_sqft'][i] * (12 if i < num_periods - 1 else (p['term_mos'] % 12 or 12)) for i in range(num_periods))
-        weighted_avg_sqft = total_sf_months / p['term_mos'] if p['term_mos'] > 0 else p['sqft']
-    else:
-        weighted_avg_sqft = p['sqft']
-
-    # Cash Flows
-    initial_outlay = (p['ti_allowance'] - p['construction_costs'] - p['moving_expense']) * p['sqft']
-    future_rent, future_opex, future_parking = [], [], []
-    detailed_costs = []
-    
-    current_base_rent = p['base_rent']
-    for year in range(num_periods):
-        months = 12 if year < num_periods - 1 else (p['term_mos'] % 12 or 12)
-        year_sqft = p['custom_sqft'][year] if p['show_advanced'] and p['custom_sqft'] else p['sqft']
-        year_esc = p['custom_escalations'][year] if p['show_advanced'] and p['custom_escalations'] else p['rent_escalation']
-
-        if year > 0: current_base_rent *= (1 + year_esc / 100)
-        months_to_pay = max(0, months - (p['free_rent_months'] if year == 0 else 0))
-        
-        period_rent = (current_base_rent * year_sqft) * (months_to_pay / 12)
-
-        # Opex calculation with Base Year Stop logic
-        current_year_opex_psf = p['opex'] * (1 + p['opex_escalation']/100)**year
-        opex_pass_through_cost = 0
-        nnn_opex_cost = 0
-        
-        if p['use_base_year_stop']:
-            if year > 0:
-                # Tenant pays the increase over the base year amount
-                opex_increase_psf = max(0, current_year_opex_psf - p['opex'])
-                opex_pass_through_cost = (opex_increase_psf * year_sqft) * (months / 12)
-            # Total opex cost to tenant is just the pass-through
-            period_opex = opex_pass_through_cost
-        else:
-            # Standard NNN opex calculation
-            nnn_opex_cost = (current_year_opex_psf * year_sqft) * (months / 12)
-            period_opex = nnn_opex_cost
-
-        # One-time costs for display (only in year 1)
-        ti_allowance_display = 0
-        moving_expense_display = 0
-        construction_costs_display = 0
-        if year == 0:
-            initial_sqft = p['custom_sqft'][0] if p['show_advanced'] and p['custom_sqft'] else p['sqft']
-            ti_allowance_display = p['ti_allowance'] * initial_sqft
-            moving_expense_display = -p['moving_expense'] * initial_sqft
-            construction_costs_display = -p['construction_costs'] * initial_sqft
-
-
-        total_spaces = (year_sqft / 1000) * p['parking_ratio']
-        actual_res = min(p['num_reserved_spaces'], total_spaces)
-        unreserved = total_spaces - actual_res
-        period_parking = ((actual_res * p['reserved_cost_monthly'] * 12) + (unreserved * p['unreserved_cost_monthly'] * 12)) * (months / 12)
-
-        future_rent.append(-period_rent); future_opex.append(-period_opex); future_parking.append(-period_parking)
-        detailed_costs.append({
-            "Year": f"Year {year+1} ({months} mos)", 
-            "Rent": period_rent, 
-            "NNN Operating Expenses": nnn_opex_cost,
-            "Opex Pass-Throughs": opex_pass_through_cost,
-            "Parking Costs": period_parking, 
-            "TI Allowance": ti_allowance_display,
-            "Moving Expense": moving_expense_display,
-            "Construction Costs": construction_costs_display,
-            "Total Annual Cost": period_rent + period_opex + period_parking
-        })
-    
-    # NPV Calculations
-    npv_rent = npf.npv(p['discount_rate']/100, future_rent)
-    npv_opex = npf.npv(p['discount_rate']/100, future_opex)
-    npv_parking = npf.npv(p['discount_rate']/100, future_parking)
-    
-    npv_all_in = initial_outlay + npv_rent + npv_opex
-    if p['include_parking_in_npv']:
-        npv_all_in += npv_parking
-    
-    # Effective Rent Calculation
-    total_cost_eff_rent = -(initial_outlay + npv_rent + npv_opex)
-    if p['include_parking_in_eff_rent']:
-        total_cost_eff_rent -= npv_parking
-    avg_eff_rent = total_cost_eff_rent / (p['term_mos']/12) / weighted_avg_sqft if p['term_mos'] > 0 and weighted_avg_sqft > 0 else 0
-
-    return {
-        'npv_all_in': npv_all_in, 'avg_eff_rent': avg_eff_rent, 'detailed_costs': detailed_costs,
-        'initial_outlay': initial_outlay, 'npv_rent': npv_rent, 'npv_opex': npv_opex, 'npv_parking': npv_parking,
-        'total_cost_eff_rent': total_cost_eff_rent, 'term_years': p['term_mos']/12, 'weighted_avg_sqft': weighted_avg_sqft
-    }
+    return lease_engine.advisory_lease_metrics(p)
 
 def display_lease_analysis_results(results):
     st.markdown("---")
@@ -414,35 +319,18 @@ def render_purchase_analysis():
 
             if st.button("🚀 Run Purchase Analysis", type="primary", use_container_width=True):
                 params = locals()
+                st.session_state.purchase_params = params
                 st.session_state.purchase_results = calculate_purchase_metrics(params)
     
     with col2:
         if st.session_state.purchase_results:
             display_purchase_results(st.session_state.purchase_results)
 
+    if st.session_state.purchase_results and st.session_state.purchase_params:
+        render_monte_carlo("purchase", st.session_state.purchase_params)
+
 def calculate_purchase_metrics(p):
-    loan_amount = p['purchase_price'] * (p['ltv'] / 100)
-    equity = p['purchase_price'] - loan_amount
-    
-    monthly_rate = p['interest_rate'] / 12 / 100
-    num_payments = p['amortization_years'] * 12
-    annual_debt_service = npf.pmt(monthly_rate, num_payments, -loan_amount) * 12 if monthly_rate > 0 else loan_amount / p['amortization_years']
-    
-    cash_flows = [-equity]
-    current_noi = p['noi']
-    for _ in range(p['analysis_period']):
-        cash_flows.append(current_noi - annual_debt_service)
-        current_noi *= (1 + p['noi_growth'] / 100)
-
-    exit_price = current_noi / (p['exit_cap_rate'] / 100)
-    remaining_loan = npf.fv(monthly_rate, p['analysis_period']*12, -annual_debt_service/12, -loan_amount) if monthly_rate > 0 else loan_amount - (annual_debt_service * p['analysis_period'])
-    sale_proceeds = exit_price - remaining_loan
-    cash_flows[-1] += sale_proceeds
-
-    irr = npf.irr(cash_flows) * 100
-    coc = cash_flows[1] / equity * 100 if equity > 0 else 0
-    eqm = sum(cf for cf in cash_flows if cf > 0) / equity if equity > 0 else 0
-    return {'irr': irr, 'cash_on_cash': coc, 'equity_multiple': eqm}
+    return advisory_purchase_metrics(p)
 
 def display_purchase_results(results):
     st.markdown("#### Key Metrics")
@@ -451,6 +339,63 @@ def display_purchase_results(results):
     st.metric("Equity Multiple", f"{results['equity_multiple']:.2f}x")
 
 
+# --- Monte Carlo Simulation ---
+MC_LABELS = {
+    "npv_all_in": "NPV (All-In)", "avg_eff_rent": "Avg. Effective Rent ($/SF/yr)",
+    "npv": "Equity NPV", "irr": "IRR (%)", "cash_on_cash": "Cash-on-Cash (Yr 1) (%)",
+    "equity_multiple": "Equity Multiple (x)",
+}
+
+def render_monte_carlo(kind, params):
+    with st.expander("🎲 Monte Carlo Simulation", expanded=False):
+        st.markdown("Samples uncertain assumptions around the inputs above and shows the range of outcomes.")
+        c1, c2 = st.columns(2)
+        paths = c1.number_input("Simulated Paths", 1_000, 1_000_000, 100_000, 10_000, key=f"mc_paths_{kind}")
+        seed = c2.number_input("Random Seed", 0, 1_000_000, 42, 1, key=f"mc_seed_{kind}")
+
+        if kind == "lease":
+            esc_sd = c1.number_input("Rent Escalation Std. Dev. (%)", 0.0, 10.0, 1.0, 0.1, key="mc_esc_sd")
+            opex_sd = c2.number_input("OPEX Growth Std. Dev. (%)", 0.0, 10.0, 1.0, 0.1, key="mc_opex_sd")
+            if st.button("🎲 Run Lease Simulation", use_container_width=True):
+                st.session_state.monte_carlo_results = simulate_lease(
+                    params,
+                    opex_growth=Distribution.normal(params["opex_escalation"], opex_sd),
+                    escalation=Distribution.normal(params["rent_escalation"], esc_sd),
+                    paths=int(paths), seed=int(seed))
+        else:
+            growth_sd = c1.number_input("NOI Growth Std. Dev. (%)", 0.0, 10.0, 1.0, 0.1, key="mc_growth_sd")
+            rate_sd = c2.number_input("Interest Rate Std. Dev. (%)", 0.0, 5.0, 0.5, 0.1, key="mc_rate_sd")
+            cap_low = c1.number_input("Exit Cap Rate Low (%)", 1.0, 15.0, max(1.0, params["exit_cap_rate"] - 1.0), 0.1, key="mc_cap_low")
+            cap_high = c2.number_input("Exit Cap Rate High (%)", 1.0, 20.0, min(20.0, params["exit_cap_rate"] + 1.5), 0.1, key="mc_cap_high")
+            discount_rate = c1.number_input("Discount Rate for NPV (%)", 0.0, 20.0, 8.0, 0.5, key="mc_disc")
+            cap_ok = cap_low < params["exit_cap_rate"] < cap_high
+            if not cap_ok:
+                st.error(f"Exit cap rate low and high must be below and above the exit cap rate "
+                         f"({params['exit_cap_rate']:.1f}%).")
+            if st.button("🎲 Run Purchase Simulation", use_container_width=True, disabled=not cap_ok):
+                st.session_state.monte_carlo_results = simulate_purchase(
+                    params,
+                    appreciation=Distribution.normal(params["noi_growth"], growth_sd),
+                    exit_cap_rate=Distribution.triangular(cap_low, params["exit_cap_rate"], cap_high),
+                    interest_rate=Distribution.normal(params["interest_rate"], rate_sd),
+                    discount_rate=discount_rate, paths=int(paths), seed=int(seed))
+
+        results = st.session_state.monte_carlo_results
+        if results is None or results.kind != kind:
+            return
+        bands = results.bands.rename(index=MC_LABELS)
+        st.dataframe(bands.style.format("{:,.2f}"), use_container_width=True)
+        if results.failed:
+            reason = "had no finite NPV" if kind == "lease" else "had no solvable IRR"
+            st.caption(f"{results.failed:,} of {results.paths:,} paths {reason} and are excluded.")
+        primary = "npv_all_in" if kind == "lease" else "irr"
+        values = results.samples[primary]
+        import plotly.express as px  # slow to import; only the simulation's chart needs it
+        fig = px.histogram(x=values[np.isfinite(values)], nbins=60, labels={"x": MC_LABELS[primary]})
+        fig.update_layout(showlegend=False, yaxis_title="Paths", template="plotly_white")
+        st.plotly_chart(fig, use_container_width=True)
+
+
 # --- Application Start ---
 if __name__ == "__main__":
     main()
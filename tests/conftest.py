@@ -0,0 +1,64 @@
+import io
+from datetime import date
+
+import pytest
+
+LEASE = {
+    'name': 'Test', 'term_mos': 60, 'start_date': date(2025, 1, 1), 'sqft': 1000,
+    'base': 10.0, 'inc': 0.0, 'lease_type': 'Triple Net (NNN)', 'opex': 2.0,
+    'opexinc': 0.0, 'park_cost': 0.0, 'park_spaces': 0, 'free': 0, 'ti': 0.0,
+    'add_cred': 0.0, 'move_exp': 0.0, 'construction': 0.0, 'disc': 0.0,
+    'custom_abate': False, 'abates': None,
+}
+
+PURCHASE = {
+    "name": "Buy", "purchase_price": 1_000_000, "down_payment_pct": 20.0, "mortgage_rate": 6.0,
+    "mortgage_term": 30, "property_tax_rate": 1.0, "insurance_rate": 0.5,
+    "maintenance_rate": 1.0, "appreciation_rate": 3.0, "analysis_period": 10,
+    "discount_rate": 8.0,
+}
+
+
+@pytest.fixture
+def lease_params():
+    """Builds web-form lease parameters: a plain 5-year NNN lease with ``overrides`` applied."""
+    return lambda **overrides: dict(LEASE, **overrides)
+
+
+@pytest.fixture
+def purchase_params():
+    """Builds web-form purchase parameters: a 10-year hold with ``overrides`` applied."""
+    return lambda **overrides: dict(PURCHASE, **overrides)
+
+
+def _png_bytes(size=(4, 2), color=(255, 0, 0, 0), mode="RGBA"):
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.new(mode, size, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def png_bytes():
+    """Builds a small in-memory PNG: ``png_bytes(size, color, mode)``."""
+    pytest.importorskip("PIL")
+    return _png_bytes
+
+
+@pytest.fixture
+def fake_kaleido(monkeypatch, png_bytes):
+    """Stands in for Kaleido: records each render's (width, height) and returns a PNG 1/100 the size."""
+    go = pytest.importorskip("plotly.graph_objects")
+    from lease_analysis.visualization.images import chart_cache
+
+    calls = []
+
+    def to_image(self, format="png", width=None, height=None, **kwargs):
+        calls.append((width, height))
+        return png_bytes((width // 100, height // 100))
+
+    chart_cache.clear()
+    monkeypatch.setattr(go.Figure, "to_image", to_image)
+    yield calls
+    chart_cache.clear()
@@ -0,0 +1,83 @@
+import numpy as np
+import numpy_financial as npf
+import pytest
+
+from lease_analysis.engine.amortization import amortize, payment, remaining_balance
+from lease_analysis.web.analysis import analyze_lease, analyze_purchase, analyze_purchase_vs_lease
+
+
+def monthly_loop(principal, rate, amort_years, term_years=None, io=0, extra=0.0, lumps=None):
+    """Month-by-month reference: (payment, interest, principal, prepayment, balloon, balance) rows."""
+    r = rate / 1200
+    term = io + amort_years * 12 if term_years is None else term_years * 12
+    balance, level, rows = principal, None, []
+    for month in range(1, term + 1):
+        extra_now = extra + (lumps or {}).get(month, 0.0)
+        interest = balance * r
+        scheduled = 0.0
+        if month > io:
+            if level is None:
+                level = npf.pmt(r, amort_years * 12, -balance) if r else balance / (amort_years * 12)
+            scheduled = min(level - interest, balance)
+            balance -= scheduled
+        prepaid = min(extra_now, balance)
+        balance -= prepaid
+        balloon = balance if month == term else 0.0
+        balance -= balloon
+        rows.append((interest + scheduled, interest, scheduled, prepaid, balloon, balance))
+    return np.array(rows).T
+
+
+@pytest.mark.parametrize('args', [
+    (1_000_000, 6.5, 30, None, 0, 0.0, None),
+    (1_000_000, 6.5, 30, 10, 0, 0.0, None),
+    (1_000_000, 6.5, 25, 7, 24, 0.0, None),
+    (500_000, 0.0, 15, None, 0, 0.0, None),
+    (1_000_000, 7.0, 30, None, 0, 500.0, {12: 50_000, 60: 100_000}),
+    (1_000_000, 5.0, 30, 10, 36, 1_000.0, {5: 20_000}),
+    (1_000_000, 6.0, 30, None, 0, 0.0, {200: 2_000_000}),
+])
+def test_schedule_matches_month_by_month_loop(args):
+    principal, rate, amort_years, term_years, io, extra, lumps = args
+    prepayments = np.zeros(360)
+    for month, amount in (lumps or {}).items():
+        prepayments[month - 1] = amount
+    schedule = amortize(principal, rate, amort_years, term_years, io, extra, prepayments)
+
+    expected = monthly_loop(*args)
+    got = np.vstack([schedule.payment[0], schedule.interest[0], schedule.principal[0],
+                     schedule.prepayment[0], schedule.balloon[0], schedule.balance[0]])
+    np.testing.assert_allclose(got, expected, atol=1e-6)
+
+
+def test_variants_broadcast_and_roll_up_by_year():
+    schedule = amortize([1_000_000, 2_000_000, 750_000], [6.0, 7.0, 0.0], 30, term_years=[10, 10, 5])
+    annual = schedule.annual()
+
+    assert schedule.balance.shape == (3, 120)
+    assert annual['interest'].shape == (3, 10)
+    np.testing.assert_allclose(annual['payment'][:, 0], schedule.monthly_payment * 12)
+    assert annual['balloon'][0, -1] == pytest.approx(remaining_balance(1_000_000, 6.0, 360, 120))
+    assert annual['balloon'][2, 4] == pytest.approx(750_000 - 750_000 / 360 * 60)
+    assert not annual['balance'][:, -1].any()
+    np.testing.assert_allclose(annual['principal'].sum(axis=1) + annual['balloon'].sum(axis=1),
+                               [1_000_000, 2_000_000, 750_000])
+
+
+def test_payment_and_balance_match_numpy_financial():
+    assert payment(1_000_000, 6.5, 360) == pytest.approx(npf.pmt(6.5 / 1200, 360, -1_000_000))
+    assert payment(360_000, 0.0, 360) == pytest.approx(1_000)
+    level = npf.pmt(6.5 / 1200, 300, -3_500_000)
+    assert remaining_balance(3_500_000, 6.5, 300, 120) == pytest.approx(npf.fv(6.5 / 1200, 120, level, -3_500_000))
+    assert remaining_balance(3_500_000, 6.5, 300, 400) == 0
+
+
+@pytest.mark.parametrize('rate, down', [(6.0, 20.0), (0.0, 20.0), (6.0, 100.0)])
+def test_web_purchase_payments_come_from_the_engine(rate, down, lease_params, purchase_params):
+    params = purchase_params(down_payment_pct=down, mortgage_rate=rate, analysis_period=5)
+    loan = 1_000_000 * (1 - down / 100)
+    expected = payment(loan, rate, 360) if loan else 0
+    summary, _ = analyze_purchase(params)
+    assert summary['Monthly Payment'] == pytest.approx(expected)
+    lease = analyze_lease(lease_params(name='Lease', base=30.0, inc=3.0, opex=10.0, disc=8.0))
+    assert analyze_purchase_vs_lease(params, lease, 5)['summary']['Monthly Payment'] == pytest.approx(expected)
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from benchmarks.cases import CASES, expand
+from benchmarks.run import Comparison, compare, load_baseline, main, run_cases, save_baseline
+
+CHEAP = [case for case in CASES if case.name != "page_render"]
+
+
+def test_regressions_need_both_the_ratio_and_a_real_slowdown():
+    baseline = {'a': 0.100, 'b': 0.100, 'c': 0.0001}
+    timings = {'a': 0.120, 'b': 0.140, 'c': 0.0005, 'd': 1.0}
+    result = {c.case: c for c in compare(baseline, timings, threshold=0.25)}
+
+    assert not result['a'].regressed
+    assert result['b'].regressed and result['b'].ratio == pytest.approx(1.4)
+    # Five times slower, but by less than the timer noise floor
+    assert not result['c'].regressed
+    # New cases have nothing to regress from
+    assert result['d'].baseline is None and not result['d'].regressed
+    assert Comparison('b', 0.1, 0.14, 0.5).regressed is False
+
+
+def test_every_case_runs_at_small_sizes():
+    runs = expand(CHEAP, {'term': (12,), 'scenarios': (2,)})
+    assert [key for key, _, _ in runs][:2] == [
+        'analyze_lease[term=12,scenarios=2]', 'analyze_purchase[term=12,scenarios=2]']
+
+    timings = run_cases(runs, repeat=1, min_time=0)
+    assert len(timings) == len(CHEAP)
+    assert all(seconds > 0 for seconds in timings.values())
+
+
+def test_update_then_check_fails_on_regression(tmp_path, monkeypatch):
+    monkeypatch.setattr('benchmarks.run.MIN_DELTA', 0.0)
+    path = tmp_path / 'baseline.json'
+    args = ['-k', 'analyze_lease', '--term', '12', '--scenarios', '1', '--repeat', '1',
+            '--baseline', str(path)]
+    assert main(args + ['--update']) == 0
+    stored = load_baseline(path)
+    assert list(stored) == ['analyze_lease[term=12,scenarios=1]']
+    assert json.loads(path.read_text())['machine']['python']
+
+    save_baseline({key: seconds / 100 for key, seconds in stored.items()}, path)
+    assert main(args) == 1
+    save_baseline({key: seconds * 1000 for key, seconds in stored.items()}, path)
+    assert main(args) == 0
@@ -0,0 +1,88 @@
+from datetime import date
+
+import pandas as pd
+
+from lease_analysis.engine.cache import DiskCache, ResultCache, memoize, param_key
+
+
+def test_param_key_is_order_independent_and_type_aware():
+    a = {'start_date': date(2025, 1, 1), 'abates': [1, 2], 'sqft': 1000}
+    b = {'sqft': 1000, 'abates': (1, 2), 'start_date': date(2025, 1, 1)}
+    assert param_key(a) == param_key(b)
+    assert param_key(a) != param_key(dict(a, start_date='2025-01-01'))
+    assert param_key(a) != param_key(dict(a, sqft=1001))
+
+
+def test_lru_eviction_respects_byte_budget():
+    frame = pd.DataFrame({'x': range(100)})
+    cache = ResultCache(max_bytes=int(frame.memory_usage(deep=True).sum()) * 2 + 10)
+    cache.put('a', frame)
+    cache.put('b', frame)
+    cache.get('a')
+    cache.put('c', frame)
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.stats()['evictions'] == 1
+
+
+def test_memoize_counts_hits_and_returns_copies():
+    cache = ResultCache()
+    calls = []
+
+    @memoize(cache=cache, disk=None)
+    def analyze(p):
+        calls.append(p)
+        return {'Total': p['x'] * 2}, pd.DataFrame({'x': [p['x']]})
+
+    summary, _ = analyze({'x': 2})
+    summary['Total'] = -1
+    summary, df = analyze({'x': 2})
+
+    assert summary == {'Total': 4}
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_memoize_runs_unhashable_arguments_uncached():
+    cache = ResultCache()
+
+    @memoize(cache=cache, disk=None)
+    def analyze(p):
+        return len(p)
+
+    assert analyze({'obj': object()}) == 1
+    assert len(cache) == 0
+
+
+def test_disk_cache_survives_restart_and_ignores_other_versions(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    DiskCache(path).put('k', ({'Total': 1}, pd.DataFrame({'x': [1, 2]})))
+
+    summary, df = DiskCache(path).get('k')
+    assert summary == {'Total': 1} and df['x'].tolist() == [1, 2]
+    assert DiskCache(path, version='other').get('k') is None
+
+
+def test_disk_cache_evicts_least_recently_read(tmp_path):
+    cache = DiskCache(str(tmp_path / 'results.sqlite'), max_bytes=2500)
+    cache.put('a', 'x' * 1000)
+    cache.put('b', 'x' * 1000)
+    cache.get('a')
+    cache.put('c', 'x' * 1000)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+
+
+def test_memoize_reads_through_to_disk(tmp_path):
+    disk = DiskCache(str(tmp_path / 'results.sqlite'))
+    calls = []
+
+    def analyze(p):
+        calls.append(p)
+        return p['x'] * 2
+
+    assert memoize(analyze, cache=ResultCache(), disk=disk, name='t')({'x': 3}) == 6
+    # A fresh process has an empty memory cache but shares the disk
+    assert memoize(analyze, cache=ResultCache(), disk=disk, name='t')({'x': 3}) == 6
+    assert len(calls) == 1 and disk.stats()['hits'] == 1
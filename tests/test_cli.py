@@ -0,0 +1,65 @@
+import json
+
+import pandas as pd
+
+from lease_analysis.cli import load_scenarios, main, run_batch, run_scenario
+
+LEASE = {
+    'name': 'Renewal', 'start_date': '2025-01-01', 'term_mos': 60, 'sqft': 5000,
+    'base': 40.0, 'inc': 3.0, 'opex': 12.0, 'opexinc': 3.0, 'park_cost': 0.0,
+    'park_spaces': 0, 'free': 2, 'ti': 20.0, 'add_cred': 0.0, 'move_exp': 0.0,
+    'disc': 8.0, 'custom_abate': False, 'abates': None,
+}
+PURCHASE = {
+    'type': 'purchase', 'name': 'Buy', 'property_value': 1_000_000,
+    'down_payment_pct': 25.0, 'loan_term_years': 25, 'interest_rate': 6.5,
+    'purchase_date': '2025-01-01', 'holding_period_years': 10,
+    'annual_appreciation': 3.0, 'discount_rate': 8.0,
+}
+
+
+def write_scenarios(tmp_path, records):
+    path = tmp_path / 'scenarios.jsonl'
+    path.write_text('\n'.join(json.dumps(r) for r in records))
+    return str(path)
+
+
+def test_cli_writes_summary_and_cash_flow_tables(tmp_path, capsys):
+    path = write_scenarios(tmp_path, [LEASE, PURCHASE, {'name': 'Broken'}])
+
+    assert main([path, '-o', str(tmp_path / 'out.csv')]) == 1
+    assert "scenario 3 (lease): missing parameter" in capsys.readouterr().err
+
+    summary = pd.read_csv(tmp_path / 'out_lease_summary.csv')
+    flows = pd.read_csv(tmp_path / 'out_lease_cash_flows.csv')
+    assert summary['Option'].tolist() == ['Renewal']
+    assert flows['Scenario'].unique().tolist() == [1]
+    assert len(flows) == 6
+    assert pd.read_csv(tmp_path / 'out_purchase_summary.csv')['Scenario'].tolist() == [2]
+
+
+def test_worker_pool_preserves_input_order(tmp_path):
+    scenarios, _ = load_scenarios(write_scenarios(
+        tmp_path, [dict(LEASE, name=f'Option {i}', base=30.0 + i) for i in range(8)]))
+
+    parallel = run_batch(scenarios, workers=2, min_parallel=1)
+    assert [r[1]['Option'] for r in parallel] == [f'Option {i}' for i in range(8)]
+    assert [r[1] for r in parallel] == [r[1] for r in run_batch(scenarios)]
+
+
+def test_mixed_batch_keeps_order_and_isolates_bad_rows(tmp_path):
+    records = [dict(LEASE, name=f'Lease {i}', base=30.0 + i) for i in range(6)]
+    records[2]['base'] = 'forty'
+    records.insert(3, dict(PURCHASE, name='Buy 1'))
+    records.insert(5, dict(PURCHASE, name='Buy 2', down_payment_pct=150.0))
+    records.append({'type': 'lease', 'name': 'Broken'})
+    scenarios, _ = load_scenarios(write_scenarios(tmp_path, records))
+
+    results = run_batch(scenarios, workers=2, min_parallel=1)
+    assert [kind for kind, *_ in results] == [r.get('type', 'lease') for r in records]
+    assert [r[3] is None for r in results] == [True, True, False, True, True, True, True, True, False]
+    assert results[7][1]['Option'] == 'Lease 5'
+    for (_, summary, df, _), (_, expected, expected_df, _) in zip(results, map(run_scenario, scenarios)):
+        if summary is not None:
+            assert summary.formatted() == expected.formatted()
+            assert df.equals(expected_df)
@@ -0,0 +1,85 @@
+import math
+from datetime import date
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from lease_analysis.engine.summary import Summary
+from lease_analysis.utils.columnar import (
+    LEASE, PURCHASE, PURCHASE_VS_LEASE, read_results, result_tables, results_from_tables, write_results,
+)
+from lease_analysis.web.analysis import analyze_lease, analyze_purchase, analyze_purchase_vs_lease
+
+@pytest.fixture
+def results(lease_params, purchase_params):
+    params = lease_params(name='Tower', term_mos=36, base=30.0, inc=3.0, opex=10.0, free=2, ti=40.0, disc=8.0)
+    purchase = purchase_params(analysis_period=5)
+    lease = analyze_lease(params)
+    summary, cash_flows = analyze_purchase(purchase)
+    # An IRR with no solution
+    no_irr = Summary((metric, math.nan if metric == "IRR" else value, summary.kinds[metric])
+                     for metric, value in summary.items())
+    return {
+        LEASE:             [lease, analyze_lease(dict(params, name='Annex', base=28.0))],
+        PURCHASE:          [(summary, cash_flows), (no_irr, cash_flows)],
+        PURCHASE_VS_LEASE: [analyze_purchase_vs_lease(purchase, lease, 5)],
+    }
+
+
+def test_results_flatten_to_long_tables(results):
+    tables = result_tables(results[LEASE], results[PURCHASE], results[PURCHASE_VS_LEASE])
+    flows = tables.cash_flows.to_pandas()
+
+    summary, waterfall = results[LEASE][1]
+    annex = flows[(flows["analysis"] == LEASE) & (flows["scenario"] == 2)]
+    assert set(annex["option"]) == {"Annex"}
+    assert len(annex) == waterfall.size - 2 * len(waterfall)  # every column but Year and Period
+    assert annex.loc[annex["item"] == "SF", "value"].tolist() == [1000.0] * len(waterfall)
+    assert annex.loc[annex["item"] == "Net Rent", "value"].tolist() == waterfall["Net Rent"].tolist()
+
+    rows = tables.summary.to_pandas().set_index(["analysis", "scenario", "metric"])
+    assert rows.loc[(LEASE, 1, "Start Date"), "date"] == date(2025, 1, 1)
+    assert rows.loc[(LEASE, 2, "Total Cost"), "value"] == summary["Total Cost"]
+    assert rows.loc[(PURCHASE_VS_LEASE, 1, "Recommendation"), "text"] in ("Purchase", "Lease")
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+def test_results_round_trip_through_files(results, tmp_path, suffix):
+    tables = result_tables(results[LEASE], results[PURCHASE], results[PURCHASE_VS_LEASE])
+    path = tmp_path / f"deals{suffix}"
+    assert [p.rsplit("/", 1)[1] for p in write_results(tables, str(path))] == [
+        f"deals_summary{suffix}", f"deals_cash_flows{suffix}"]
+
+    allocated = pa.total_allocated_bytes()
+    loaded = read_results(str(path))
+    if suffix == ".arrow":
+        assert pa.total_allocated_bytes() == allocated  # memory-mapped, not copied
+    assert loaded.cash_flows.equals(tables.cash_flows)
+    # NaN values never compare equal in Arrow; pandas matches them by position
+    assert loaded.summary.schema == tables.summary.schema
+    assert loaded.summary.to_pandas().equals(tables.summary.to_pandas())
+
+    back = results_from_tables(loaded)
+    for (summary, df), (original, original_df) in zip(back[LEASE] + back[PURCHASE],
+                                                      results[LEASE] + results[PURCHASE]):
+        assert summary.keys() == original.keys() and summary.kinds == original.kinds
+        for metric, value in original.items():
+            if isinstance(value, float) and math.isnan(value):
+                assert isinstance(summary[metric], float) and math.isnan(summary[metric])
+            else:
+                assert summary[metric] == value
+        assert list(df.columns) == list(original_df.columns)
+        assert df.drop(columns="Period", errors="ignore").astype(float).equals(
+            original_df.drop(columns="Period", errors="ignore").astype(float))
+
+    comparison, original = back[PURCHASE_VS_LEASE][0], results[PURCHASE_VS_LEASE][0]
+    assert comparison["summary"] == original["summary"]
+    assert comparison["lease_cash_flows"] == original["lease_cash_flows"]
+    assert comparison["lease_df"]["Period"].tolist() == original["lease_df"]["Period"].tolist()
+
+
+def test_unknown_file_types_are_rejected(results, tmp_path):
+    tables = result_tables(results[LEASE])
+    with pytest.raises(ValueError, match="unsupported results file type .csv"):
+        write_results(tables, str(tmp_path / "deals.csv"))
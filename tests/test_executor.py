@@ -0,0 +1,68 @@
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from lease_analysis.engine.executor import default_workers, map_chunks, map_threads, merge_chunks
+from lease_analysis.engine.params import PurchaseParams
+from lease_analysis.utils.timing import stage, start_run
+
+
+def row_report(columns, scale=1):
+    return {
+        'value': columns['x'] * scale,
+        'pid':   [os.getpid()] * len(columns['x']),
+    }
+
+
+def test_pool_results_merge_in_input_order():
+    columns = {'x': np.arange(50), 'y': np.zeros((50, 3))}
+    result = map_chunks(row_report, columns, workers=2, min_rows=10, scale=2)
+    np.testing.assert_array_equal(result['value'], np.arange(50) * 2)
+    assert os.getpid() not in result['pid']
+
+
+def test_small_batches_run_in_process():
+    result = map_chunks(row_report, {'x': np.arange(5)}, workers=8, min_rows=10)
+    assert set(result['pid']) == {os.getpid()}
+    with pytest.raises(ValueError):
+        map_chunks(row_report, {'x': np.arange(5), 'y': np.arange(4)}, workers=1)
+
+
+def test_threads_keep_order_report_progress_and_timings():
+    timings = start_run("test")
+    threads = set()
+
+    def work(n):
+        with stage("export.page", scenario=n):
+            time.sleep(0.01 * (5 - n))  # later items finish first
+            threads.add(threading.get_ident())
+        return n * n
+
+    done = []
+    assert map_threads(work, range(5), workers=5, progress=lambda *a: done.append(a)) == [0, 1, 4, 9, 16]
+    assert [d for d, _ in done] == [1, 2, 3, 4, 5] and {t for _, t in done} == {5}
+    assert sorted(t.fields["scenario"] for t in timings.stages) == list(range(5))
+    assert threading.get_ident() not in threads
+
+    threads.clear()
+    assert map_threads(work, [3], workers=4) == [9]
+    assert threads == {threading.get_ident()}
+
+
+def test_merge_and_worker_defaults(monkeypatch):
+    assert merge_chunks([[1, 2], [3]]) == [1, 2, 3]
+    monkeypatch.setenv('LEASE_ANALYZER_WORKERS', '3')
+    assert default_workers() == 3
+
+
+def test_purchase_params_round_trip_through_columns():
+    items = [PurchaseParams(name=f'Buy {i}', property_value=1e6 + i, down_payment_pct=25,
+                            loan_term_years=30, interest_rate=6.5, holding_period_years=10,
+                            discount_rate=8) for i in range(4)]
+    columns = PurchaseParams.to_columns(items)
+    assert columns['values'].shape == (4, len(PurchaseParams.ARRAY_FIELDS))
+    assert PurchaseParams.from_columns(columns) == items
+    assert PurchaseParams.from_columns({k: v[2:] for k, v in columns.items()}) == items[2:]
@@ -0,0 +1,101 @@
+import io
+import tempfile
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("fpdf")
+
+from lease_analysis.web.analysis import analyze_lease, analyze_purchase
+from lease_analysis.web.exports import (
+    comparison_excel, lease_comparison_pdf, purchase_comparison_pdf, summary_excel,
+)
+
+
+@pytest.fixture
+def lease(lease_params):
+    return lease_params(term_mos=36, base=30.0, inc=3.0, opex=10.0, free=2, ti=40.0, disc=8.0)
+
+
+def lease_results(lease):
+    return [(p, *analyze_lease(p)) for p in (lease, dict(lease, name='Other', base=28.0))]
+
+
+def test_excel_and_pdf_exports(lease, purchase_params):
+    results = lease_results(lease)
+    raw_df = pd.DataFrame([dict(r[1]) for r in results])
+    df = pd.DataFrame([r[1].formatted() for r in results])
+
+    book = pd.read_excel(io.BytesIO(summary_excel(raw_df)), sheet_name=None)
+    assert list(book) == ['Summary']
+    assert book['Summary']['Option'].tolist() == ['Test', 'Other']
+
+    # Waterfall periods contain an en dash, which FPDF's core fonts cannot encode
+    assert lease_comparison_pdf(df, results, charts=False).startswith(b'%PDF')
+    purchase = purchase_params()
+    buy = [(purchase, *analyze_purchase(purchase))] * 2
+    buy_df = pd.DataFrame([r[1].formatted() for r in buy])
+    assert purchase_comparison_pdf(buy_df, buy).startswith(b'%PDF')
+
+
+def test_workbook_streams_typed_cash_flows_per_scenario(tmp_path, lease):
+    from openpyxl import load_workbook
+
+    odd = dict(lease, name='A/B: [long] name for a sheet')
+    results = lease_results(lease) + [(odd, *analyze_lease(odd))]
+    raw_df = pd.DataFrame([dict(r[1]) for r in results])
+    path = tmp_path / "comparison.xlsx"
+    assert comparison_excel(raw_df, results, monthly=True, path=path) is None
+
+    book = load_workbook(path, read_only=True)
+    assert book.sheetnames == ['Summary', '1 Test Annual', '1 Test Monthly', '2 Other Annual',
+                               '2 Other Monthly', '3 A-B- -long- name for a Annual',
+                               '3 A-B- -long- name for Monthly']
+    annual = pd.read_excel(path, sheet_name='2 Other Annual')
+    monthly = pd.read_excel(path, sheet_name='2 Other Monthly')
+
+    # "10,000"-style strings are written as numbers
+    assert annual['SF'].tolist() == [1000] * len(annual)
+    assert len(monthly) == lease['term_mos'] + lease['free']
+    assert monthly['Date'].iloc[12] == pd.Timestamp(2026, 1, 1)
+    assert monthly['Base Rent'][:12].sum() == pytest.approx(annual['Base Rent'][0])
+    # Two free months of base rent and opex, signed as in the annual table
+    assert monthly['Rent Abatement'][:3].tolist() == pytest.approx([-(28 + 10) * 1000 / 12] * 2 + [0])
+    assert round(monthly['Rent Abatement'].sum()) == annual['Rent Abatement'].sum()  # annual is whole dollars
+
+
+def test_charts_are_embedded_from_memory(fake_kaleido, lease):
+    before = set(Path(tempfile.gettempdir()).iterdir())
+    results = lease_results(lease)
+    df = pd.DataFrame([r[1].formatted() for r in results])
+
+    first = lease_comparison_pdf(df, results)
+    assert len(fake_kaleido) == 4  # two charts for each of the two scenarios
+    lease_comparison_pdf(df, results)
+    assert len(fake_kaleido) == 4
+    # Four charts and the logo
+    assert first.count(b"/Subtype /Image") == 5
+    assert set(Path(tempfile.gettempdir()).iterdir()) == before
+
+
+def test_scenario_pages_render_side_by_side(fake_kaleido, monkeypatch, lease):
+    go = pytest.importorskip("plotly.graph_objects")
+
+    # Each render waits for the other scenario's: serial rendering would time out
+    barrier = threading.Barrier(2, timeout=10)
+    render = go.Figure.to_image
+
+    def wait_then_render(self, *args, **kwargs):
+        barrier.wait()
+        return render(self, *args, **kwargs)
+
+    monkeypatch.setattr(go.Figure, "to_image", wait_then_render)
+    results = lease_results(lease)
+    df = pd.DataFrame([r[1].formatted() for r in results])
+    done = []
+
+    pdf = lease_comparison_pdf(df, results, progress=lambda n, total: done.append((n, total)))
+    assert done == [(1, 2), (2, 2)]
+    assert pdf.count(b"/Subtype /Image") == 5
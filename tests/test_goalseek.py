@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from lease_analysis.engine.goalseek import breakeven, goal_seek
+from lease_analysis.engine.lease import CLASSIC, analyze_lease, analyze_leases
+from lease_analysis.web.analysis import solve_breakeven
+
+
+@pytest.fixture
+def base(lease_params):
+    return lease_params(base=30.0, inc=3.0, opex=10.0, free=2, ti=40.0, disc=8.0)
+
+
+def test_breakeven_base_rent_equalizes_npv(base):
+    other = dict(base, base=28.0, free=5)
+    result = breakeven(base, other, 'base')
+
+    assert result.converged.all()
+    solved = analyze_leases([dict(base, base=result.value[0]), other])
+    assert solved.loc[0, 'NPV'] == pytest.approx(solved.loc[1, 'NPV'])
+    assert result.achieved[0] == pytest.approx(solved.loc[1, 'NPV'])
+    # NPV is linear in base rent, so the secant lands almost at once
+    assert result.iterations[0] <= 4
+
+
+def test_free_months_offset_a_ti_shortfall(base):
+    # The classic package counts TI in cash flow and does not extend the term
+    short = dict(base, ti=30.0)
+    result = breakeven(short, base, 'free', mode=CLASSIC)
+
+    # $10/SF on 1,000 SF is four months of $30/SF base rent
+    assert result.value[0] == pytest.approx(6.0)
+
+
+def test_many_targets_and_unreachable_ones(base):
+    npv_key = next(k for k in analyze_lease(base)[0] if k.startswith('NPV'))
+    targets = [analyze_lease(dict(base, base=rent))[0][npv_key] for rent in (20.0, 25.0, 40.0)]
+    result = goal_seek(base, 'base', targets + [-1.0], max_iter=20)
+
+    np.testing.assert_allclose(result.value[:3], [20.0, 25.0, 40.0], rtol=1e-8)
+    assert result.failed.tolist() == [3]
+    assert np.isnan(result.value[3])
+    assert result.iterations.max() <= 22
+
+    with pytest.raises(ValueError):
+        goal_seek(base, 'opex', targets)
+
+
+def test_comparison_tab_solve_is_memoized(base):
+    other = dict(base, base=28.0, free=5)
+    value, converged, achieved = solve_breakeven(base, other, 'free')
+    assert converged and value == pytest.approx(breakeven(base, other, 'free').value[0])
+    assert solve_breakeven(base, other, 'free') == (value, converged, achieved)
+    assert solve_breakeven.uncached(base, other, 'free') == (value, converged, achieved)
@@ -0,0 +1,40 @@
+import zlib
+
+import pytest
+
+pytest.importorskip("PIL")
+pytest.importorskip("fpdf")
+go = pytest.importorskip("plotly.graph_objects")
+
+from fpdf import FPDF
+
+from lease_analysis.visualization.images import chart_cache, chart_image, embed_chart, png_image
+
+
+def test_png_image_flattens_transparency_onto_white(png_bytes):
+    image = png_image(png_bytes())
+    assert (image["w"], image["h"], image["cs"], image["bpc"]) == (4, 2, "DeviceRGB", 8)
+    assert zlib.decompress(image["data"]) == b"\xff" * (4 * 2 * 3)
+
+    opaque = png_image(png_bytes(color=(10, 20, 30), mode="RGB"))
+    assert zlib.decompress(opaque["data"])[:3] == bytes([10, 20, 30])
+
+
+def test_charts_render_once_per_figure_content(fake_kaleido):
+    fig = go.Figure(go.Bar(x=[1, 2], y=[3, 4]))
+    key, image = chart_image(fig)
+    assert chart_image(go.Figure(go.Bar(x=[1, 2], y=[3, 4])))[0] == key
+    assert chart_image(go.Figure(go.Bar(x=[1, 2], y=[3, 5])))[0] != key
+    assert chart_image(fig, width=800)[0] != key
+    assert fake_kaleido == [(700, 400), (700, 400), (800, 400)]
+    assert image["w"] == 7
+
+    # Every document gets its own copy: FPDF drops the samples once written
+    for _ in range(2):
+        pdf = FPDF()
+        pdf.add_page()
+        embed_chart(pdf, fig, w=100)
+        embed_chart(pdf, fig, w=50)
+        assert len(pdf.images) == 1
+        assert b"/Subtype /Image" in pdf.output(dest="S").encode("latin1")
+    assert len(fake_kaleido) == 3
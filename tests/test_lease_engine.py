@@ -0,0 +1,86 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from lease_analysis.engine.lease import (
+    CLASSIC, add_months, advisory_lease_metrics, analyze_lease, analyze_leases,
+)
+
+
+def test_add_months_clips_to_month_end():
+    dates = add_months(date(2024, 1, 31), np.array([0, 1, 13]))
+    assert [str(d) for d in dates] == ['2024-01-31', '2024-02-29', '2025-02-28']
+
+
+def test_partial_final_year_and_abatement(lease_params):
+    summary, df = analyze_lease(lease_params(term_mos=18, free=3))
+
+    # 3 free months are added to the 18 month term
+    assert summary['Total Term (mos)'] == 21
+    assert df['Period'].tolist() == ['01/01/2025 – 12/31/2025', '01/01/2026 – 09/30/2026']
+    assert df['Base Rent'].tolist() == [10000, 7500]
+    assert df['Rent Abatement'].tolist() == [-3000, 0]
+
+
+def test_expansion_applies_from_change_month(lease_params):
+    summary, df = analyze_lease(lease_params(exp_month=13, exp_sqft=500))
+    assert df['SF'].tolist() == [1000, 1500, 1500, 1500, 1500]
+    assert summary['Total SF'] == 1500
+    assert summary.display('Size Change') == '+500'
+
+
+def test_full_service_keeps_base_rent_after_year_one(lease_params):
+    _, df = analyze_lease(lease_params(lease_type='Full Service (Gross)', opex=0.0, inc=3.0))
+    assert df['Base Rent'].tolist() == [10000, 10300, 10609, 10927, 11255]
+    assert df['Opex'].tolist() == [0, 0, 0, 0, 0]
+
+
+def test_batch_matches_single_scenarios(lease_params):
+    scenarios = [
+        lease_params(name='Short', term_mos=18, free=3, disc=8.0),
+        lease_params(name='Long', term_mos=125, inc=3.0, ti=40.0, construction=60.0, disc=7.0),
+        lease_params(name='Custom', term_mos=36, custom_abate=True, abates=[2, 1, 0], disc=5.0),
+    ]
+    table = analyze_leases(scenarios)
+
+    assert table['Option'].tolist() == ['Short', 'Long', 'Custom']
+    for (_, row), params in zip(table.iterrows(), scenarios):
+        summary, _ = analyze_lease(params)
+        npv_key = next(k for k in summary if k.startswith('NPV'))
+        assert summary['Total Cost'] == pytest.approx(row['Total Cost'])
+        assert summary[npv_key] == pytest.approx(row['NPV'])
+        assert summary['Avg Eff. Rent'] == pytest.approx(row['Avg Eff. Rent'])
+
+
+def test_empty_batch_gives_an_empty_table(lease_params):
+    table = analyze_leases([])
+    assert table.empty
+    assert table.columns.tolist() == analyze_leases([lease_params()]).columns.tolist()
+
+
+def test_classic_mode_keeps_term_and_credits_in_cash_flow(lease_params):
+    summary, df = analyze_lease(lease_params(term_mos=18, free=3, ti=5.0, move_exp=1.0), CLASSIC)
+    assert summary['Term (mos)'] == 18
+    assert df.columns.tolist() == [
+        'Year', 'Period', 'Base Cost', 'Opex Cost', 'Parking Exp', 'Rent Abatement', 'Net CF']
+    assert df['Rent Abatement'].tolist() == [-2500, 0]
+    assert df['Net CF'].tolist() == [-3500, -6000]
+    assert summary['Total Cost'] == 9500
+    assert summary.display('Total Cost') == '$9,500'
+
+
+def test_advisory_compounds_escalations_and_caps_free_rent():
+    results = advisory_lease_metrics({
+        'term_mos': 36, 'sqft': 1000, 'base_rent': 10.0, 'rent_escalation': 0.0,
+        'show_advanced': True, 'custom_escalations': [0.0, 10.0, 10.0],
+        'custom_sqft': [1000, 1000, 2000], 'free_rent_months': 14,
+        'use_base_year_stop': False, 'opex': 0.0, 'opex_escalation': 0.0,
+        'parking_ratio': 0.0, 'num_reserved_spaces': 0, 'reserved_cost_monthly': 0.0,
+        'unreserved_cost_monthly': 0.0, 'ti_allowance': 0.0, 'moving_expense': 0.0,
+        'construction_costs': 0.0, 'discount_rate': 0.0,
+        'include_parking_in_npv': False, 'include_parking_in_eff_rent': False,
+    })
+    rents = [row['Rent'] for row in results['detailed_costs']]
+    assert np.allclose(rents, [0.0, 11000.0, 24200.0])
+    assert np.isclose(results['weighted_avg_sqft'], 4000 / 3)
@@ -0,0 +1,72 @@
+import numpy as np
+import numpy_financial as npf
+import pytest
+
+from lease_analysis.engine.lease import advisory_lease_metrics
+from lease_analysis.engine.montecarlo import Distribution, simulate_lease, simulate_purchase
+from lease_analysis.engine.purchase import advisory_cash_flows, advisory_purchase_metrics
+from lease_analysis.engine.returns import irr
+
+LEASE = {
+    'term_mos': 61, 'sqft': 5000, 'base_rent': 30.0, 'rent_escalation': 3.0,
+    'opex': 12.0, 'opex_escalation': 3.0, 'free_rent_months': 3, 'ti_allowance': 50.0,
+    'moving_expense': 5.0, 'construction_costs': 80.0, 'parking_ratio': 3.0,
+    'num_reserved_spaces': 5, 'reserved_cost_monthly': 200.0, 'unreserved_cost_monthly': 120.0,
+    'discount_rate': 8.0, 'show_advanced': False, 'custom_escalations': [], 'custom_sqft': [],
+    'use_base_year_stop': True, 'include_parking_in_eff_rent': True, 'include_parking_in_npv': True,
+}
+
+PURCHASE = {
+    'purchase_price': 5_000_000, 'ltv': 70, 'interest_rate': 6.5, 'amortization_years': 25,
+    'noi': 350_000, 'noi_growth': 3.0, 'exit_cap_rate': 6.5, 'analysis_period': 10,
+}
+
+
+def test_fixed_distributions_match_the_scalar_metrics():
+    lease = simulate_lease(LEASE, opex_growth=Distribution.fixed(3.0),
+                           escalation=Distribution.fixed(3.0), paths=7, chunk_size=3)
+    expected = advisory_lease_metrics(LEASE)
+    np.testing.assert_allclose(lease.samples['npv_all_in'], expected['npv_all_in'])
+    np.testing.assert_allclose(lease.samples['avg_eff_rent'], expected['avg_eff_rent'])
+
+    purchase = simulate_purchase(PURCHASE, paths=5)
+    expected = advisory_purchase_metrics(PURCHASE)
+    for name in ('irr', 'cash_on_cash', 'equity_multiple'):
+        np.testing.assert_allclose(purchase.samples[name], expected[name])
+    assert purchase.failed == 0
+
+
+def test_seeded_runs_are_reproducible_and_chunk_independent():
+    dists = dict(appreciation=Distribution.normal(3.0, 1.0),
+                 exit_cap_rate=Distribution.triangular(5.5, 6.5, 8.0),
+                 interest_rate=Distribution.uniform(5.0, 8.0))
+    first = simulate_purchase(PURCHASE, **dists, paths=2_000, chunk_size=2_000, seed=7)
+    again = simulate_purchase(PURCHASE, **dists, paths=2_000, chunk_size=2_000, seed=7)
+    np.testing.assert_array_equal(first.samples['irr'], again.samples['irr'])
+
+    p50 = first.bands.loc['irr', 'P50']
+    assert first.bands.loc['irr', 'P5'] < p50 < first.bands.loc['irr', 'P95']
+    assert list(first.bands.index) == ['npv', 'irr', 'cash_on_cash', 'equity_multiple']
+
+
+def test_remaining_balance_subtracts_payments():
+    flows, equity = advisory_cash_flows(PURCHASE)
+    loan = PURCHASE['purchase_price'] * 0.7
+    r = 0.065 / 12
+    payment = npf.pmt(r, 300, -loan)
+    balance = npf.fv(r, 120, payment, -loan)
+    final_year = 350_000 * 1.03 ** 9 - payment * 12
+    exit_price = 350_000 * 1.03 ** 10 / 0.065
+
+    assert equity == pytest.approx(1_500_000)
+    assert flows[0, -1] == pytest.approx(final_year + exit_price - balance)
+    assert balance < loan
+
+
+def test_vectorized_irr_matches_numpy_financial():
+    rng = np.random.default_rng(3)
+    flows = rng.normal(100, 300, size=(200, 11))
+    flows[:, 0] = -rng.uniform(500, 2000, 200)
+    expected = np.array([npf.irr(row) for row in flows])
+    np.testing.assert_allclose(irr(flows), expected, rtol=1e-8, atol=1e-10)
+    assert irr([-100.0, 110.0]) == pytest.approx(0.10)
@@ -0,0 +1,71 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from lease_analysis.engine.lease import CLASSIC, WEB, lease_inputs, lease_schedule, stack_inputs
+from lease_analysis.engine.monthly import analyze_monthly, annual_totals, monthly_npv, monthly_schedule
+from lease_analysis.engine.returns import xnpv
+
+
+def stacked(params_list, mode=WEB):
+    return stack_inputs([lease_inputs(p, mode) for p in params_list])
+
+
+@pytest.mark.parametrize('mode', [WEB, CLASSIC])
+def test_monthly_flows_roll_up_to_the_annual_schedule(mode, lease_params):
+    b = stacked([
+        lease_params(term_mos=61, free=3, inc=3.0, opexinc=2.0, park_cost=100, park_spaces=4,
+                     ti=20.0, add_cred=2.0, move_exp=5.0),
+        lease_params(term_mos=30, custom_abate=True, abates=[2, 1, 1],
+                     lease_type='Full Service (Gross)', opex_base=1.5),
+        # Mid-year expansion: rent and opex start with the new SF, parking does not change
+        lease_params(term_mos=36, exp_month=7, exp_sqft=500, park_cost=100, park_spaces=4),
+        lease_params(term_mos=36, exp_month=7, exp_sqft=500,
+                     park_detail={'unres_spaces': 3, 'unres_cost': 90.0, 'res_spaces': 1,
+                                  'res_cost': 150.0, 'park_inc': 3.0}),
+    ], mode)
+    annual = lease_schedule(b, mode)
+    monthly = annual_totals(monthly_schedule(b, mode))
+
+    periods = annual['net_cf'].shape[1]
+    np.testing.assert_allclose(monthly['parking'][:, :periods], annual['parking'], atol=1e-6)
+    for name in ('base_rent', 'opex', 'abatement', 'net_rent', 'net_cf'):
+        np.testing.assert_allclose(monthly[name][:2, :periods], annual[name][:2], atol=1e-6)
+
+
+def test_expansion_sf_is_billed_from_its_month(lease_params):
+    b = stacked([lease_params(term_mos=24, exp_month=7, exp_sqft=500, park_cost=100, park_spaces=4)])
+    s = monthly_schedule(b)
+
+    assert s['sqft'][0, :6].tolist() == [1000] * 6
+    assert s['sqft'][0, 6:].tolist() == [1500] * 18
+    # $10/SF/yr: six months at 1,000 SF then 18 at 1,500 SF
+    assert s['base_rent'].sum() == pytest.approx(10 / 12 * (6 * 1000 + 18 * 1500))
+    # Four spaces at $100/month cost the same before and after the expansion
+    assert s['parking'][0, :24].tolist() == pytest.approx([400.0] * 24)
+
+
+def test_free_months_and_dates_follow_the_calendar(lease_params):
+    b = stacked([lease_params(term_mos=12, free=2, start_date=date(2024, 1, 31))])
+    s = monthly_schedule(b)
+
+    assert [str(d) for d in s['date'][0, :3]] == ['2024-01-31', '2024-02-29', '2024-03-31']
+    assert s['years'][0, 1] == pytest.approx(29 / 365)
+    # Abatement extends the term; the first two months are rent free
+    assert (s['abatement'][0, :2] == s['base_rent'][0, :2] + s['opex'][0, :2]).all()
+    assert (s['abatement'][0, 2:] == 0).all()
+
+
+def test_npv_discounts_by_actual_days(lease_params):
+    b = stacked([lease_params(term_mos=36, inc=3.0, disc=8.0)])
+    s = monthly_schedule(b)
+
+    expected = xnpv(0.08, s['net_cf'][0], s['date'][0])
+    assert monthly_npv(b, s)[0] == pytest.approx(expected)
+    assert xnpv(0.1, [-100.0, 110.0], ['2023-01-01', '2024-01-01']) == pytest.approx(0.0)
+
+    frame = analyze_monthly([lease_params(term_mos=36, disc=8.0)])
+    # Paying monthly rather than a year in advance lowers the NPV of the cost
+    assert frame.loc[0, 'NPV (Monthly)'] < frame.loc[0, 'NPV (Annual)']
+    assert frame.loc[0, 'Occupancy Cost'] == pytest.approx(36 * 12_000 / 12)
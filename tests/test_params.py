@@ -0,0 +1,73 @@
+import pickle
+from datetime import date
+
+import numpy as np
+import pytest
+
+from lease_analysis.engine.lease import analyze_lease
+from lease_analysis.engine.params import LeaseParams, PurchaseParams
+from lease_analysis.utils.purchase_calculator import analyze_purchase
+
+LEASE = {
+    'name': 'Test', 'start_date': date(2025, 1, 1), 'term_mos': 60, 'sqft': 1000,
+    'base': 10.0, 'inc': 3.0, 'opex': 2.0, 'opexinc': 0.0, 'park_cost': 0.0,
+    'park_spaces': 0, 'free': 2, 'ti': 5.0, 'add_cred': 0.0, 'move_exp': 1.0,
+    'disc': 8.0, 'custom_abate': False, 'abates': None,
+    'park_detail': {'unres_spaces': 10, 'unres_cost': 100.0, 'res_spaces': 0,
+                    'res_cost': 0.0, 'park_inc': 3.0},
+}
+
+
+def test_lease_params_drive_the_engine_like_a_dict():
+    params = LeaseParams.from_dict(LEASE)
+    summary, df = analyze_lease(params)
+    expected_summary, expected_df = analyze_lease(LEASE)
+
+    assert summary == expected_summary
+    assert df.equals(expected_df)
+
+
+def test_params_are_frozen_hashable_and_picklable():
+    params = LeaseParams.from_dict(LEASE)
+    with pytest.raises(AttributeError):
+        params.base = 11.0
+
+    assert params == LeaseParams.from_dict(LEASE)
+    assert hash(params) == hash(LeaseParams.from_dict(LEASE))
+    assert params.replace(base=11.0) != params
+    assert pickle.loads(pickle.dumps(params)) == params
+    assert params.cache_key() == pickle.loads(pickle.dumps(params)).cache_key()
+
+
+def test_validation_reports_every_bad_field():
+    with pytest.raises(ValueError) as err:
+        LeaseParams(start_date=date(2025, 1, 1), term_mos=1.5, sqft=-1, base=10.0,
+                    lease_type='Gross')
+    message = str(err.value)
+    assert 'term_mos' in message and 'sqft' in message and 'lease_type' in message
+    assert [e.split(':')[0] for e in err.value.errors] == ['term_mos', 'sqft', 'lease_type']
+
+
+def test_legacy_key_names_are_reconciled():
+    old_form = {k: v for k, v in LEASE.items() if k not in ('term_mos', 'move_exp')}
+    params = LeaseParams.from_dict(dict(old_form, term=5, move=2.0))
+    assert (params.term_mos, params.move_exp, params['move']) == (60, 2.0, 2.0)
+
+    web = PurchaseParams.from_dict({
+        'name': 'Buy', 'purchase_price': 1_000_000, 'down_payment_pct': 20.0,
+        'mortgage_rate': 6.0, 'mortgage_term': 25, 'analysis_period': 10,
+        'appreciation_rate': 3.0, 'discount_rate': 8.0, 'property_tax_rate': 1.2,
+    })
+    assert web.property_value == web['purchase_price'] == 1_000_000
+    assert web['mortgage_term'] == web.loan_term_years == 25
+    summary, _ = analyze_purchase(web.replace(purchase_date=date(2025, 1, 1)))
+    assert summary['Property Value'] == 1_000_000
+
+
+def test_stack_gives_a_compact_numeric_matrix():
+    scenarios = [LeaseParams.from_dict(dict(LEASE, base=b)) for b in (10.0, 20.0, 30.0)]
+    matrix = LeaseParams.stack(scenarios)
+
+    assert matrix.shape == (3, len(LeaseParams.ARRAY_FIELDS))
+    assert np.array_equal(matrix[:, LeaseParams.ARRAY_FIELDS.index('base')], [10.0, 20.0, 30.0])
+    assert np.array_equal(matrix[1], scenarios[1].as_array())
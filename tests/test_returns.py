@@ -0,0 +1,43 @@
+from datetime import date
+
+import numpy as np
+import numpy_financial as npf
+import pytest
+
+from lease_analysis.engine.returns import irr, solve_irr, xirr
+
+
+def test_multiple_sign_changes_pick_the_root_nearest_zero_like_npf():
+    rng = np.random.default_rng(11)
+    flows = rng.normal(100, 300, size=(500, 31))
+    flows[:, 0] = -rng.uniform(500, 2000, 500)
+    expected = np.array([npf.irr(row) for row in flows])
+    np.testing.assert_allclose(irr(flows), expected, rtol=1e-7, atol=1e-9)
+
+
+def test_unsolvable_rows_are_flagged_not_zeroed():
+    result = solve_irr([[-100.0, -10.0, -5.0], [-100.0, 110.0, 0.0], [0.0, 0.0, 0.0]])
+    assert result.converged.tolist() == [False, True, False]
+    assert np.isnan(result.rate[[0, 2]]).all()
+    assert result.rate[1] == pytest.approx(0.10)
+    assert result.failed.tolist() == [0, 2]
+
+
+def test_warm_start_needs_fewer_newton_steps():
+    rng = np.random.default_rng(5)
+    flows = np.hstack([-rng.uniform(1e6, 2e6, (1000, 1)), rng.uniform(5e4, 2e5, (1000, 10))])
+    flows[:, -1] += 2e6
+    cold = solve_irr(flows)
+    warm = solve_irr(flows * 1.0001, guess=cold.rate)
+    assert cold.converged.all() and warm.converged.all()
+    assert warm.iterations.max() < cold.iterations.max()
+    np.testing.assert_allclose(warm.rate, cold.rate, atol=1e-9)
+
+
+def test_xirr_matches_the_excel_example_and_yearly_irr():
+    dates = [date(2008, 1, 1), date(2008, 3, 1), date(2008, 10, 30), date(2009, 2, 15), date(2009, 4, 1)]
+    assert xirr([-10000, 2750, 4250, 3250, 2750], dates) == pytest.approx(0.373362535, abs=1e-8)
+
+    yearly = np.array(['2021-01-01', '2022-01-01', '2023-01-01'], dtype='datetime64[D]')
+    flows = np.array([[-1000.0, 500.0, 700.0], [-1000.0, 0.0, 1300.0]])
+    assert xirr(flows, yearly) == pytest.approx(irr(flows), rel=1e-3)
@@ -0,0 +1,52 @@
+from datetime import date
+
+from openpyxl import Workbook
+
+from lease_analysis.engine.params import LeaseParams
+from lease_analysis.utils.scenario_import import read_scenarios
+
+
+def test_csv_rows_are_coerced_and_bad_rows_reported(tmp_path):
+    path = tmp_path / 'survey.csv'
+    path.write_text(
+        'Option,Start Date,Term (mos),RSF,Base Rent,Lease Type,Rent Incs,Free Rent\n'
+        'Brickell,01/01/2026,120,"12,500",$48.50,Gross,3; 3; 4,3\n'
+        'Wynwood,2026-02-01,sixty,5000,40,NNN,,\n'
+        ',,,,,,,\n'
+        'Doral,2026-03-01,60,0,30,Modified,,\n'
+    )
+    scenarios, bad_rows = read_scenarios(str(path))
+
+    assert len(scenarios) == 1
+    lease = scenarios[0]
+    assert lease['name'] == 'Brickell'
+    assert lease['start_date'] == date(2026, 1, 1)
+    assert (lease['term_mos'], lease['sqft'], lease['base']) == (120, 12500, 48.5)
+    assert lease['lease_type'] == 'Full Service (Gross)'
+    assert lease['rent_incs'] == [3.0, 3.0, 4.0]
+    assert lease['free'] == 3 and lease['custom_abate'] is False
+    # Rows are validated by the engine's own parameter class
+    assert LeaseParams.from_dict(lease).to_dict() == {k: v for k, v in lease.items() if k != 'type'}
+
+    assert [number for number, _ in bad_rows] == [3, 5]
+    assert any(e.startswith('term_mos:') for e in bad_rows[0][1])
+    assert {e.split(':')[0] for e in bad_rows[1][1]} == {'sqft', 'lease_type'}
+
+
+def test_xlsx_rows_stream_with_native_cell_types(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(['type', 'name', 'property_value', 'down_payment_pct', 'loan_term_years',
+               'interest_rate', 'purchase_date', 'holding_period_years',
+               'annual_appreciation', 'discount_rate'])
+    ws.append(['purchase', 'HQ', 2_500_000, 20, 25, 6.25, date(2026, 1, 1), 10, 3, 8])
+    path = tmp_path / 'purchases.xlsx'
+    wb.save(path)
+
+    scenarios, bad_rows = read_scenarios(str(path))
+
+    assert bad_rows == []
+    assert scenarios[0]['type'] == 'purchase'
+    assert scenarios[0]['purchase_date'] == date(2026, 1, 1)
+    assert scenarios[0]['loan_term_years'] == 25
+    assert scenarios[0]['closing_costs_pct'] == 3.0
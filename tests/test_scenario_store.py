@@ -0,0 +1,74 @@
+from datetime import date, datetime
+
+import pytest
+
+from lease_analysis.utils.scenario_store import LEASE, PURCHASE, ScenarioStore
+from lease_analysis.web.sidebar import apply_deck, deck_inputs
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ScenarioStore(str(tmp_path / "store" / "scenarios.sqlite"))
+
+
+def options(n, **extra):
+    return [{"name": f"Option {i + 1}", "sd": date(2025, 1 + i % 12, 1), "tm": 60 + i, "ci": False,
+             **extra} for i in range(n)]
+
+
+def test_saving_a_name_again_adds_a_version(store):
+    first = store.save(LEASE, "Midtown", options(2), client="Acme", building="1 Main St",
+                       saved_at=datetime(2025, 3, 1, 9, 30))
+    second = store.save(LEASE, "Midtown", options(3), client="Acme", building="1 Main St")
+    assert (first.version, second.version, second.options) == (1, 2, 3)
+    assert store.save(PURCHASE, "Midtown", options(1)).version == 1
+
+    assert len(store.load(LEASE, "Midtown").options) == 3
+    deck = store.load(LEASE, "Midtown", version=1)
+    assert deck.info == first
+    assert deck.options == options(2)  # dates come back as dates
+    assert store.load(LEASE, "Midtown", version=9) is None
+    assert store.load(LEASE, "Elsewhere") is None
+
+
+def test_decks_are_found_by_name_client_building_and_date(store):
+    store.save(LEASE, "Midtown", options(1), client="Acme", saved_at=datetime(2025, 1, 10))
+    store.save(LEASE, "Midtown", options(1), client="Acme", saved_at=datetime(2025, 2, 10))
+    store.save(LEASE, "Harbor", options(1), client="Beta", building="Pier 4", saved_at=datetime(2025, 3, 10))
+    store.save(PURCHASE, "Warehouse", options(1), client="Acme", saved_at=datetime(2025, 4, 10))
+
+    assert [(d.name, d.version) for d in store.find(kind=LEASE)] == [("Harbor", 1), ("Midtown", 2)]
+    assert [d.name for d in store.find(client="Acme")] == ["Warehouse", "Midtown"]
+    assert [d.name for d in store.find(building="Pier 4")] == ["Harbor"]
+    assert [d.version for d in store.find(name="Midtown", all_versions=True)] == [2, 1]
+    assert [d.name for d in store.find(since=date(2025, 2, 1), until=date(2025, 4, 1))] == ["Harbor", "Midtown"]
+
+    assert store.delete(LEASE, "Midtown", version=2) == 1
+    assert store.find(name="Midtown")[0].version == 1
+    assert store.delete(LEASE, "Midtown") == 1
+    assert store.find(name="Midtown") == []
+
+
+def test_a_fifty_option_deck_loads_in_one_query(store):
+    store.save(LEASE, "Portfolio", options(50, lt="Triple Net (NNN)"))
+    queries = []
+    store._connect().set_trace_callback(queries.append)
+
+    deck = store.load(LEASE, "Portfolio")
+    assert [o["name"] for o in deck.options] == [f"Option {i + 1}" for i in range(50)]
+    assert len(queries) == 1
+
+
+def test_deck_inputs_round_trip_through_widget_state(store):
+    state = {"count": 2, "name0": "A", "tm0": 60, "ci0": True, "yrinc_0_1": 3.0, "yrinc_0_2": 4.5,
+             "name1": "B", "tm1": 36, "em1": 12, "buy_name0": "ignored", "save_name": "Deck"}
+    saved = deck_inputs(state, LEASE)
+    assert saved == [{"name": "A", "tm": 60, "ci": True, "yrinc_1": 3.0, "yrinc_2": 4.5},
+                     {"name": "B", "tm": 36, "em": 12}]
+    store.save(LEASE, "Deck", saved)
+
+    # Widgets the deck has no value for go back to their defaults
+    state = {"count": 5, "name0": "Z", "em0": 6, "yrinc_0_3": 9.0, "save_name": "Deck"}
+    apply_deck(state, LEASE, store.load(LEASE, "Deck").options)
+    assert state == {"count": 2, "name0": "A", "tm0": 60, "ci0": True, "yrinc_0_1": 3.0, "yrinc_0_2": 4.5,
+                     "name1": "B", "tm1": 36, "em1": 12, "save_name": "Deck"}
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from lease_analysis.engine.lease import CLASSIC, analyze_lease
+from lease_analysis.engine.sensitivity import sweep_lease
+
+
+def test_grid_matches_single_scenarios(lease_params):
+    params = lease_params(inc=3.0, ti=10.0, disc=8.0, custom_abate=True, abates=[2, 1])
+    grid = sweep_lease(params, base=[9.0, 12.0], free=[0, 4], ti=[0.0, 25.0], disc=[5.0, 10.0])
+
+    assert grid.npv.shape == grid.eff_rent.shape == (2, 1, 2, 2, 2)
+    for index in np.ndindex(grid.npv.shape):
+        point = {name: values[i] for (name, values), i in zip(grid.axes.items(), index)}
+        point['free'] = int(point['free'])
+        summary, _ = analyze_lease(dict(params, **point, custom_abate=False))
+        npv_key = next(k for k in summary if k.startswith('NPV'))
+        assert grid.npv[index] == pytest.approx(summary[npv_key])
+        assert grid.eff_rent[index] == pytest.approx(summary['Avg Eff. Rent'])
+
+
+def test_small_chunks_give_the_same_surfaces(lease_params):
+    params = lease_params(term_mos=120, disc=7.0)
+    ranges = dict(base=np.linspace(8, 12, 9), inc=[0.0, 2.5, 3.0], free=[0, 6])
+    whole = sweep_lease(params, **ranges)
+    chunked = sweep_lease(params, **ranges, max_cells=25)
+
+    np.testing.assert_allclose(chunked.npv, whole.npv)
+    surface = whole.surface('npv', 'base', 'free')
+    assert surface.shape == (9, 2)
+    assert len(whole.to_frame()) == whole.npv.size
+
+
+def test_ti_axis_only_moves_metrics_when_ti_is_a_cash_flow(lease_params):
+    params = lease_params(disc=8.0)
+    web = sweep_lease(params, ti=[0.0, 40.0, 80.0])
+    assert np.ptp(web.npv) == 0 and np.ptp(web.eff_rent) == 0
+
+    # The allowance comes off the cost in year one
+    classic = sweep_lease(params, ti=[0.0, 10.0, 20.0], mode=CLASSIC)
+    np.testing.assert_allclose(np.diff(classic.npv.ravel()), [-10_000.0, -10_000.0])
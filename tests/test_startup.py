@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+ROOT = Path(__file__).resolve().parent.parent
+# Imported only by the features that need them, never by the first render
+DEFERRED = ("fpdf", "plotly.express", "plotly.graph_objects", "PIL", "numpy_financial", "scipy", "yfinance",
+            "requests", "xlsxwriter")
+# Seconds a first render may take on top of a bare Streamlit script
+STARTUP_BUDGET = 2.0
+
+# Renders a bare script first so Streamlit's own imports are not charged to the app
+PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+def render(path):
+    start = time.perf_counter()
+    app = AppTest.from_file(path, default_timeout=120).run()
+    return time.perf_counter() - start, [str(e.value) for e in app.exception]
+
+deferred = json.loads(sys.argv[3])
+bare, _ = render(sys.argv[1])
+before = {name for name in deferred if name in sys.modules}
+elapsed, errors = render(sys.argv[2])
+print(json.dumps({
+    "overhead": elapsed - bare,
+    "errors": errors,
+    "loaded": sorted(name for name in deferred if name in sys.modules and name not in before),
+}))
+"""
+
+
+@pytest.mark.parametrize("app", ["lease_web_app.py", "revolutionary_property_analyzer.py"])
+def test_first_render_defers_heavy_imports(app, tmp_path):
+    bare = tmp_path / "bare.py"
+    bare.write_text("import streamlit as st\nst.write('ready')\n")
+    env = dict(os.environ, LEASE_ANALYZER_CACHE="", PYTHONPATH=str(ROOT))
+    result = subprocess.run([sys.executable, "-c", PROBE, str(bare), app, json.dumps(DEFERRED)],
+                            cwd=ROOT, env=env, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["errors"] == []
+    assert report["loaded"] == []
+    assert report["overhead"] < STARTUP_BUDGET
+
+
+def test_web_analysis_imports_without_streamlit():
+    code = ("import sys; from lease_analysis.web.analysis import analyze_lease, analyze_purchase; "
+            "print('streamlit' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                            env=dict(os.environ, LEASE_ANALYZER_CACHE=""), timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,41 @@
+import math
+import pickle
+from datetime import date
+
+from lease_analysis.engine.summary import (
+    CURRENCY, DATE, MONTHS, PERCENT, SQFT_CHANGE, TEXT, Summary, format_summary,
+)
+from lease_analysis.utils.purchase_calculator import analyze_purchase
+
+
+def test_summary_keeps_raw_values_and_formats_on_display():
+    summary = Summary([
+        ('Option', 'A', TEXT),
+        ('Start Date', date(2025, 1, 1), DATE),
+        ('NPV', 1234567.891, CURRENCY),
+        ('IRR', 6.5, PERCENT),
+        ('Payback', None, MONTHS),
+        ('Size Change', None, SQFT_CHANGE),
+    ])
+
+    assert summary['NPV'] == 1234567.891
+    assert summary.formatted() == {
+        'Option': 'A', 'Start Date': '01/01/2025', 'NPV': '$1,234,568',
+        'IRR': '6.50%', 'Payback': 'N/A', 'Size Change': '-',
+    }
+    restored = pickle.loads(pickle.dumps(summary))
+    assert restored == summary and restored.kinds == summary.kinds
+    assert format_summary({'x': 1.5}) == {'x': '1.5'}
+
+
+def test_purchase_summary_is_numeric():
+    summary, _ = analyze_purchase({
+        'name': 'Buy', 'property_value': 1_000_000, 'down_payment_pct': 25.0,
+        'loan_term_years': 25, 'interest_rate': 6.5, 'purchase_date': date(2025, 1, 1),
+        'holding_period_years': 10, 'annual_appreciation': 3.0, 'discount_rate': 8.0,
+    })
+
+    assert summary['Down Payment'] == 250_000
+    assert summary.display('Down Payment') == '$250,000'
+    assert math.isfinite(summary['NPV (8.00%)'])
+    assert summary.display('Purchase Date') == '01/01/2025'
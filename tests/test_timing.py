@@ -0,0 +1,59 @@
+import io
+import json
+import logging
+
+import pytest
+
+from lease_analysis.utils.timing import (
+    JsonFormatter, configure_logging, current_timings, stage, start_run, timed,
+)
+
+
+def test_stages_are_collected_per_run_even_when_they_raise():
+    timings = start_run("test")
+
+    @timed("compute.double")
+    def double(x):
+        return 2 * x
+
+    with stage("table.style", table="rent_schedule", scenario="A"):
+        assert double(2) == 4
+    with pytest.raises(ZeroDivisionError), stage("table.style", table="summary"):
+        1 / 0
+    with stage("table.style", table="rent_schedule", scenario="B"):
+        pass
+
+    assert current_timings() is timings
+    assert [t.stage for t in timings.stages] == ["compute.double", "table.style", "table.style", "table.style"]
+    assert timings.stages[1].fields == {"table": "rent_schedule", "scenario": "A"}
+
+    totals = timings.totals().set_index(["Stage", "table"])
+    assert totals.loc[("table.style", "rent_schedule"), "Calls"] == 2
+    assert totals.loc[("table.style", "summary"), "Calls"] == 1
+    assert totals["Total ms"].is_monotonic_decreasing
+    assert start_run().totals().empty
+
+
+def test_stage_timings_log_as_json_lines():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    log = logging.getLogger("lease_analysis.utils.timing")
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    try:
+        run = start_run().run
+        with stage("export.pdf", scenarios=3):
+            pass
+    finally:
+        log.removeHandler(handler)
+        log.setLevel(logging.NOTSET)
+
+    entry = json.loads(stream.getvalue())
+    assert entry["stage"] == "export.pdf" and entry["run"] == run and entry["scenarios"] == 3
+    assert entry["elapsed_ms"] >= 0 and entry["level"] == "INFO"
+
+
+def test_logging_stays_off_without_a_level(monkeypatch):
+    monkeypatch.delenv("LEASE_ANALYZER_LOG", raising=False)
+    assert configure_logging() is None